@@ -1,15 +1,19 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+from collections.abc import Iterable, Iterator
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
+from itertools import islice
 import logging
+import threading
 import time
-from typing import cast
+from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from sqlalchemy import not_, or_
+from sqlalchemy.orm import Session
 import voluptuous as vol
 
 from homeassistant.components import frontend, websocket_api
@@ -20,7 +24,13 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
+)
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
@@ -28,7 +38,9 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -38,6 +50,9 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+# The number of states of an entity serialized at once when streaming
+STREAM_CHUNK_SIZE = 1000
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -97,10 +112,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     use_include_order = conf.get(CONF_ORDER)
 
+    hass.data[DOMAIN] = filters
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_list_statistic_ids)
+    websocket_api.async_register_command(hass, ws_stream_history_during_period)
 
     return True
 
@@ -172,6 +189,109 @@ async def ws_get_list_statistic_ids(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream_history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [cv.entity_id],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_stream_history_during_period(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Stream the history of each entity as events, then send the result."""
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = start_time + timedelta(days=1)
+
+    filters: Filters | None = hass.data[DOMAIN]
+    # Set when the connection is closed to stop reading the database
+    closed = threading.Event()
+    connection.subscriptions[msg["id"]] = closed.set
+
+    def _send_event(entity_id: str, states: list[Any]) -> None:
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"entity_id": entity_id, "states": states}
+            )
+        )
+
+    def _stream_history() -> None:
+        """Send the history of each entity in chunks from the executor."""
+        with session_scope(hass=hass) as session:
+            for entity_id, chunk in _chunked_significant_states(
+                hass,
+                session,
+                start_time,
+                end_time,
+                msg.get("entity_ids"),
+                filters,
+                msg["include_start_time_state"],
+                msg["significant_changes_only"],
+                msg["minimal_response"],
+            ):
+                if closed.is_set():
+                    return
+                run_callback_threadsafe(
+                    hass.loop, _send_event, entity_id, chunk
+                ).result()
+
+    try:
+        await hass.async_add_executor_job(_stream_history)
+    finally:
+        connection.subscriptions.pop(msg["id"], None)
+    if not closed.is_set():
+        connection.send_result(msg["id"])
+
+
+def _chunked_significant_states(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str] | None,
+    filters: Filters | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+) -> Iterator[tuple[str, list[Any]]]:
+    """Yield (entity_id, states) with at most STREAM_CHUNK_SIZE states each."""
+    for entity_id, ent_states in history.stream_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    ):
+        while chunk := list(islice(ent_states, STREAM_CHUNK_SIZE)):
+            yield entity_id, chunk
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -220,6 +340,16 @@ class HistoryPeriodView(HomeAssistantView):
         )
 
         minimal_response = "minimal_response" in request.query
+        columnar_response = "columnar_response" in request.query
+
+        point_budget = None
+        if point_budget_str := request.query.get("point_budget"):
+            try:
+                point_budget = int(point_budget_str)
+            except ValueError:
+                point_budget = 0
+            if point_budget < 1:
+                return self.json_message("Invalid point_budget", HTTPStatus.BAD_REQUEST)
 
         hass = request.app["hass"]
 
@@ -230,6 +360,24 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
+        # The include order can only be respected once all states are fetched
+        if (
+            "stream" in request.query
+            and not columnar_response
+            and point_budget is None
+            and not (self.filters and self.use_include_order)
+        ):
+            return await self._async_stream_significant_states_json(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            )
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -241,6 +389,8 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                columnar_response,
+                point_budget,
             ),
         )
 
@@ -253,6 +403,8 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        columnar_response,
+        point_budget,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -268,12 +420,30 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                columnar_response,
+                point_budget,
             )
 
-        result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
-            _LOGGER.debug("Extracted %d states in %fs", sum(map(len, result)), elapsed)
+            _LOGGER.debug(
+                "Extracted states of %d entities in %fs", len(result), elapsed
+            )
+
+        if columnar_response:
+            # The columns are keyed by entity_id as they do not include it
+            if self.filters and self.use_include_order:
+                result = {
+                    entity_id: result[entity_id]
+                    for entity_id in (
+                        *self.filters.included_entities,
+                        *result,
+                    )
+                    if entity_id in result
+                }
+            return self.json(result)
+
+        result = list(result.values())
 
         # Optionally reorder the result to respect the ordering given
         # by any entities explicitly included in the configuration.
@@ -290,6 +460,84 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    async def _async_stream_significant_states_json(
+        self,
+        request: web.Request,
+        hass: HomeAssistant,
+        *args: Any,
+    ) -> web.StreamResponse:
+        """Stream significant states from the database as json.
+
+        The states are written as they are read from the database, so the
+        entities are in database order instead of the requested order.
+        """
+        response = web.StreamResponse(headers={hdrs.CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_compression()
+        await response.prepare(request)
+
+        def _write(data: str) -> None:
+            asyncio.run_coroutine_threadsafe(
+                response.write(data.encode("UTF-8")), hass.loop
+            ).result()
+
+        try:
+            await hass.async_add_executor_job(
+                self._stream_significant_states_json, hass, _write, *args
+            )
+        except ConnectionResetError:
+            _LOGGER.debug("Client disconnected while streaming history")
+            return response
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error streaming history")
+            # The status was already sent, close the connection so the client
+            # can not mistake the truncated body for a complete response
+            if request.transport is not None:
+                request.transport.close()
+            return response
+        await response.write_eof()
+        return response
+
+    def _stream_significant_states_json(
+        self,
+        hass,
+        write,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    ):
+        """Write significant states from the database as json in chunks."""
+        timer_start = time.perf_counter()
+        prev_entity_id = None
+        write("[")
+        with session_scope(hass=hass) as session:
+            for entity_id, chunk in _chunked_significant_states(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            ):
+                if entity_id != prev_entity_id:
+                    # Close the list of the previous entity
+                    write("[" if prev_entity_id is None else "],[")
+                    prev_entity_id = entity_id
+                else:
+                    write(",")
+                # Strip the brackets, the chunk is a part of the entity list
+                write(json_dumps(chunk)[1:-1])
+        write("]" if prev_entity_id is None else "]]")
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed states in %fs", elapsed)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf: ConfigType) -> Filters | None:
     """Build a sql filter from config."""
@@ -3,7 +3,6 @@ from contextlib import suppress
 from datetime import timedelta
 from http import HTTPStatus
 from itertools import groupby
-import json
 import re
 
 import sqlalchemy
@@ -17,8 +16,10 @@ from homeassistant.components.history import sqlalchemy_filter_from_include_excl
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
+    states_with_entity_ids,
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -52,6 +53,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import json_loads
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
@@ -88,11 +90,6 @@ ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED = [
     *HOMEASSISTANT_EVENTS,
 ]
 
-ALL_EVENT_TYPES = [
-    EVENT_STATE_CHANGED,
-    *ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED,
-]
-
 EVENT_COLUMNS = [
     Events.event_type,
     Events.event_data,
@@ -446,39 +443,35 @@ def _get_events(
     with session_scope(hass=hass) as session:
         old_state = aliased(States, name="old_state")
 
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        )
+
         if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
-            )
             if entity_matches_only:
                 # When entity_matches_only is provided, contexts and events that do not
                 # contain the entity_ids are not included in the logbook response.
                 query = _apply_event_entity_id_matchers(query, entity_ids)
-
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
-                )
-            )
+            states_query = _generate_states_query(
+                session, start_day, end_day, old_state
+            ).filter(states_with_entity_ids(entity_ids))
         else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
+            states_query = _generate_states_query(
+                session, start_day, end_day, old_state
             )
             if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
+                states_query = states_query.filter(filters.entity_filter())
 
             if context_id is not None:
                 query = query.filter(Events.context_id == context_id)
+                states_query = states_query.filter(
+                    _state_context_id_column(States.context_id, Events.context_id)
+                    == context_id
+                )
 
+        query = query.union_all(states_query)
         query = query.order_by(Events.time_fired)
 
         return list(
@@ -486,16 +479,6 @@ def _get_events(
         )
 
 
-def _generate_events_query(session):
-    return session.query(
-        *EVENT_COLUMNS,
-        States.state,
-        States.entity_id,
-        States.domain,
-        States.attributes,
-    )
-
-
 def _generate_events_query_without_states(session):
     return session.query(
         *EVENT_COLUMNS,
@@ -503,37 +486,49 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
     )
 
 
-def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
+def _state_context_id_column(state_column, event_column):
+    # States recorded before schema version 26 have their context
+    # stored in the events table
+    return sqlalchemy.func.coalesce(state_column, event_column)
+
+
+def _generate_states_query(session, start_day, end_day, old_state):
     return (
-        _generate_events_query(session)
+        session.query(
+            literal(value=EVENT_STATE_CHANGED, type_=sqlalchemy.String).label(
+                "event_type"
+            ),
+            literal(value=EMPTY_JSON_OBJECT, type_=sqlalchemy.Text).label("event_data"),
+            States.last_updated.label("time_fired"),
+            _state_context_id_column(States.context_id, Events.context_id).label(
+                "context_id"
+            ),
+            _state_context_id_column(
+                States.context_user_id, Events.context_user_id
+            ).label("context_user_id"),
+            _state_context_id_column(
+                States.context_parent_id, Events.context_parent_id
+            ).label("context_parent_id"),
+            States.state,
+            States.entity_id,
+            States.domain,
+            States.attributes,
+            StateAttributes.shared_attrs,
+        )
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .filter(
-            (States.last_updated == States.last_changed)
-            & States.entity_id.in_(entity_ids)
-        )
-    )
-
-
-def _apply_events_types_and_states_filter(hass, query, old_state):
-    events_query = (
-        query.outerjoin(States, (Events.event_id == States.event_id))
-        .outerjoin(old_state, (States.old_state_id == old_state.state_id))
-        .filter(
-            (Events.event_type != EVENT_STATE_CHANGED)
-            | _missing_state_matcher(old_state)
-        )
-        .filter(
-            (Events.event_type != EVENT_STATE_CHANGED) | _continuous_entity_matcher()
-        )
+        .filter(States.last_updated == States.last_changed)
     )
-    return _apply_event_types_filter(hass, events_query, ALL_EVENT_TYPES)
 
 
 def _missing_state_matcher(old_state):
@@ -554,7 +549,12 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
+        # Rows recorded before schema 25 have the attributes stored
+        # in the states table, newer rows in the state_attributes table
         sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            StateAttributes.shared_attrs.contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -709,7 +709,9 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(
+            self._row.shared_attrs or self._row.attributes
+        )
         return result and result.group(1)
 
     @property
@@ -734,13 +736,11 @@ class LazyEventPartialState:
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            source = self._row.shared_attrs or self._row.attributes
+            if source is None or source == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json_loads(source)
         return self._attributes
 
     @property
@@ -750,7 +750,7 @@ class LazyEventPartialState:
             if self._row.event_data == EMPTY_JSON_OBJECT:
                 self._event_data = {}
             else:
-                self._event_data = json.loads(self._row.event_data)
+                self._event_data = json_loads(self._row.event_data)
         return self._event_data
 
     @property
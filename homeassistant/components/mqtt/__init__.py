@@ -6,11 +6,9 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 import datetime as dt
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
-from itertools import groupby
 import logging
-from operator import attrgetter
 import ssl
 import time
 from typing import Any, Union, cast
@@ -741,7 +739,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -759,12 +756,17 @@ class MQTT:
         """Initialize Home Assistant MQTT client."""
         # We don't import on the top because some integrations
         # should be able to optionally rely on MQTT.
-        import paho.mqtt.client as mqtt  # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel
+        import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
-        self.subscriptions: list[Subscription] = []
+        # The subscriptions by topic filter, the lists are shared with the
+        # matcher trie so matching a topic only walks the levels of the topic
+        self.subscriptions: dict[str, list[Subscription]] = {}
+        self._matcher = MQTTMatcher()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -938,11 +940,11 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
-        self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
+        if (topic_subscriptions := self.subscriptions.get(topic)) is None:
+            topic_subscriptions = self.subscriptions[topic] = []
+            self._matcher[topic] = topic_subscriptions
+        topic_subscriptions.append(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -952,15 +954,18 @@ class MQTT:
         @callback
         def async_remove() -> None:
             """Remove subscription."""
-            if subscription not in self.subscriptions:
+            topic_subscriptions = self.subscriptions.get(topic, [])
+            if subscription not in topic_subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
-            self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            topic_subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if topic_subscriptions:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
+            del self.subscriptions[topic]
+            del self._matcher[topic]
+
             # Only unsubscribe if currently connected.
             if self.connected:
                 self.hass.async_create_task(self._async_unsubscribe(topic))
@@ -1017,9 +1022,8 @@ class MQTT:
             result_code,
         )
 
-        # Group subscriptions to only re-subscribe once for each topic.
-        keyfunc = attrgetter("topic")
-        for topic, subs in groupby(sorted(self.subscriptions, key=keyfunc), keyfunc):
+        # Re-subscribe once for each topic.
+        for topic, subs in self.subscriptions.items():
             # Re-subscribe with the highest requested qos
             max_qos = max(subscription.qos for subscription in subs)
             self.hass.add_job(self._async_perform_subscription, topic, max_qos)
@@ -1048,13 +1052,13 @@ class MQTT:
         """Message received callback."""
         self.hass.add_job(self._mqtt_handle_message, msg)
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching topic."""
+        return [
+            subscription
+            for topic_subscriptions in self._matcher.iter_match(topic)
+            for subscription in topic_subscriptions
+        ]
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -1166,16 +1170,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
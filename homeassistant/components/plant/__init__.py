@@ -6,7 +6,7 @@ import logging
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import States, states_with_entity_ids
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
     ATTR_TEMPERATURE,
@@ -314,8 +314,8 @@ class Plant(Entity):
             query = (
                 session.query(States)
                 .filter(
-                    (States.entity_id == entity_id.lower())
-                    and (States.last_updated > start_date)
+                    states_with_entity_ids([entity_id.lower()])
+                    & (States.last_updated > start_date)
                 )
                 .order_by(States.last_updated.asc())
             )
@@ -14,9 +14,10 @@ import threading
 import time
 from typing import Any
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm import make_transient, scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
 from sqlalchemy.pool import StaticPool
 import voluptuous as vol
@@ -29,10 +30,9 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CoreState, HomeAssistant, ServiceCall, callback
+from homeassistant.core import CoreState, Event, HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -65,7 +65,9 @@ from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
     process_timestamp,
 )
@@ -122,9 +124,17 @@ DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
 KEEPALIVE_TIME = 30
 
-# Controls how often we clean up
-# States and Events objects
-EXPIRE_AFTER_COMMITS = 120
+# The number of attribute ids to cache in memory
+#
+# Based on:
+# - The number of overlapping attributes
+# - How frequently states with overlapping attributes will change
+# - How much memory our low end hardware has
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
+# The number of entity_id to metadata_id mappings to cache in memory,
+# large enough to hold every recorded entity on most installs
+STATES_META_ID_CACHE_SIZE = 8192
 
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 1
@@ -278,6 +288,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def _process_recorder_platform(hass, domain, platform):
     """Process a recorder platform."""
     hass.data[DOMAIN][domain] = platform
+    if hasattr(platform, "record_state_changed"):
+        hass.data[DATA_INSTANCE].async_add_state_changed_listener(
+            platform.record_state_changed
+        )
 
 
 @callback
@@ -371,6 +385,9 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        # Commit the pending rows so they are purged as well
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
         if purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
         ):
@@ -391,6 +408,9 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        # Commit the pending rows so they are purged as well
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
         if purge.purge_entity_data(instance, self.entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -414,6 +434,9 @@ class StatisticsTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
+        # The pending states must be in the database before they are compiled
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
         if statistics.compile_statistics(instance, self.start):
             return
         # Schedule a new statistics task if this one didn't finish
@@ -457,6 +480,26 @@ class DatabaseLockTask(RecorderTask):
         instance._lock_database(self)  # pylint: disable=[protected-access]
 
 
+@dataclass
+class CommitTask(RecorderTask):
+    """Commit the event session."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._commit_event_session_or_retry()
+
+
+@dataclass
+class KeepAliveTask(RecorderTask):
+    """A keep alive to be sent."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._send_keep_alive()
+
+
 @dataclass
 class StopTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
@@ -516,11 +559,13 @@ class Recorder(threading.Thread):
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
-        self._timechanges_seen = 0
-        self._commits_without_expire = 0
-        self._keepalive_count = 0
-        self._old_states: dict[str, States] = {}
-        self._pending_expunge: list[States] = []
+        self._old_states: dict[str, int] = {}
+        self._state_attributes_ids: LRU = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self._states_meta_ids: LRU = LRU(STATES_META_ID_CACHE_SIZE)
+        self._pending_states_meta: dict[str, StatesMeta] = {}
+        self._pending_events: list[Events] = []
+        self._pending_states: list[States] = []
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -528,8 +573,11 @@ class Recorder(threading.Thread):
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
+        self._keep_alive_listener = None
+        self._commit_listener = None
         self._db_supports_row_number = True
         self._database_lock_task: DatabaseLockTask | None = None
+        self._state_changed_listeners: list[Callable[[HomeAssistant, Event], None]] = []
 
         self.enabled = True
 
@@ -537,6 +585,13 @@ class Recorder(threading.Thread):
         """Enable or disable recording events and states."""
         self.enabled = enable
 
+    @callback
+    def async_add_state_changed_listener(
+        self, listener: Callable[[HomeAssistant, Event], None]
+    ) -> None:
+        """Add a listener called from the recorder thread for each recorded state."""
+        self._state_changed_listeners.append(listener)
+
     @callback
     def async_initialize(self):
         """Initialize the recorder."""
@@ -546,6 +601,23 @@ class Recorder(threading.Thread):
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
+        self._keep_alive_listener = self.hass.timer.async_listen(
+            self._async_keep_alive, KEEPALIVE_TIME
+        )
+        if self.commit_interval:
+            self._commit_listener = self.hass.timer.async_listen(
+                self._async_commit, self.commit_interval
+            )
+
+    @callback
+    def _async_keep_alive(self, now):
+        """Queue a keep alive."""
+        self.queue.put(KeepAliveTask())
+
+    @callback
+    def _async_commit(self, now):
+        """Queue a commit."""
+        self.queue.put(CommitTask())
 
     @callback
     def _async_check_queue(self, *_):
@@ -569,6 +641,12 @@ class Recorder(threading.Thread):
         if self._queue_watcher:
             self._queue_watcher()
             self._queue_watcher = None
+        if self._keep_alive_listener:
+            self._keep_alive_listener()
+            self._keep_alive_listener = None
+        if self._commit_listener:
+            self._commit_listener()
+            self._commit_listener = None
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
@@ -889,61 +967,110 @@ class Recorder(threading.Thread):
         )
 
     def _process_one_event(self, event):
-        if event.event_type == EVENT_TIME_CHANGED:
-            self._keepalive_count += 1
-            if self._keepalive_count >= KEEPALIVE_TIME:
-                self._keepalive_count = 0
-                self._send_keep_alive()
-            if self.commit_interval:
-                self._timechanges_seen += 1
-                if self._timechanges_seen >= self.commit_interval:
-                    self._timechanges_seen = 0
-                    self._commit_event_session_or_retry()
-            return
-
         if not self.enabled:
             return
 
-        try:
-            if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
-            else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
-        except (TypeError, ValueError):
-            _LOGGER.warning("Event is not JSON serializable: %s", event)
-            return
-
         if event.event_type == EVENT_STATE_CHANGED:
+            # State changes are only stored in the states table,
+            # the context is stored on the state row itself.
+            self._process_state_changed_event(event)
+        else:
             try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                dbevent = Events.from_event(event)
             except (TypeError, ValueError):
-                _LOGGER.warning(
-                    "State is not JSON serializable: %s",
-                    event.data.get("new_state"),
-                )
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
+                return
+            dbevent.created = event.time_fired
+            self._pending_events.append(dbevent)
 
         # If they do not have a commit interval
         # than we commit right away
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _process_state_changed_event(self, event):
+        """Add a state row for a state_changed event."""
+        try:
+            dbstate = States.from_event(event)
+            shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+            return
+
+        self._add_state_attributes(dbstate, shared_attrs)
+        self._add_states_meta(dbstate)
+        if not event.data.get("new_state"):
+            dbstate.state = None
+        dbstate.created = event.time_fired
+        # The old_state_id is resolved when the state is inserted
+        self._pending_states.append(dbstate)
+
+        for listener in self._state_changed_listeners:
+            try:
+                listener(self.hass, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in state changed listener %s", listener)
+
+    def _add_state_attributes(self, dbstate: States, shared_attrs: str) -> None:
+        """Link dbstate to a deduplicated StateAttributes row.
+
+        Identical attributes are only serialized and inserted once. We first
+        look at the attributes pending in the current commit, then at the
+        attributes_id cache and finally in the database by hash before
+        adding a new StateAttributes row.
+        """
+        # Matching attributes found in the pending commit
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending_attributes
+            return
+        # Matching attributes id found in the cache
+        if attributes_id := self._state_attributes_ids.get(shared_attrs):
+            dbstate.attributes_id = attributes_id
+            return
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        # Matching attributes found in the database
+        if (
+            attributes := self.event_session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.hash == attr_hash)
+            .filter(StateAttributes.shared_attrs == shared_attrs)
+            .first()
+        ):
+            dbstate.attributes_id = attributes[0]
+            self._state_attributes_ids[shared_attrs] = attributes[0]
+            return
+        # No matching attributes found, save them in the DB
+        dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=attr_hash)
+        dbstate.state_attributes = dbstate_attributes
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+
+    def _add_states_meta(self, dbstate: States) -> None:
+        """Link dbstate to the StatesMeta row of its entity_id."""
+        entity_id = dbstate.entity_id
+        # Matching metadata found in the pending commit
+        if pending_states_meta := self._pending_states_meta.get(entity_id):
+            dbstate.states_meta = pending_states_meta
+            return
+        # Matching metadata_id found in the cache
+        if metadata_id := self._states_meta_ids.get(entity_id):
+            dbstate.metadata_id = metadata_id
+            return
+        # Matching metadata found in the database
+        if (
+            states_meta := self.event_session.query(StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
+            .first()
+        ):
+            dbstate.metadata_id = states_meta[0]
+            self._states_meta_ids[entity_id] = states_meta[0]
+            return
+        # First state of this entity, save the metadata in the DB
+        dbstates_meta = StatesMeta(entity_id=entity_id)
+        dbstate.states_meta = dbstates_meta
+        self._pending_states_meta[entity_id] = dbstates_meta
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -956,7 +1083,12 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_events
+            and not self._pending_states
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -970,6 +1102,10 @@ class Recorder(threading.Thread):
                     err,
                     self.db_retry_wait,
                 )
+                # The pending rows are kept in memory and
+                # will be inserted again on the next try
+                self.event_session.rollback()
+                self._reset_pending_rows()
                 if tries == self.db_max_retries:
                     raise
 
@@ -977,24 +1113,99 @@ class Recorder(threading.Thread):
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
-        self._commits_without_expire += 1
-
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
+        """Insert the pending rows and commit the event session.
+
+        The pending rows are never added to the session, they are bulk
+        inserted so we avoid the unit of work bookkeeping and do not
+        have to expunge or expire them after the commit.
+        """
+        if self._pending_state_attributes:
+            self.event_session.bulk_save_objects(
+                self._pending_state_attributes.values(), return_defaults=True
+            )
+        if self._pending_states_meta:
+            self.event_session.bulk_save_objects(
+                self._pending_states_meta.values(), return_defaults=True
+            )
+        if self._pending_events:
+            # Nothing references the event_id so they can
+            # be inserted with a single executemany
+            self.event_session.bulk_save_objects(self._pending_events)
+        old_states = self._insert_pending_states()
         self.event_session.commit()
 
-        # Expire is an expensive operation (frequently more expensive
-        # than the flush and commit itself) so we only
-        # do it after EXPIRE_AFTER_COMMITS commits
-        if self._commits_without_expire == EXPIRE_AFTER_COMMITS:
-            self._commits_without_expire = 0
-            self.event_session.expire_all()
+        self._old_states = old_states
+        self._pending_events = []
+        self._pending_states = []
+
+        # We just committed the state attributes to the database
+        # and we now know the attributes_ids. We can save
+        # many selects for matching attributes by loading them
+        # into the LRU cache now.
+        for state_attr in self._pending_state_attributes.values():
+            self._state_attributes_ids[
+                state_attr.shared_attrs
+            ] = state_attr.attributes_id
+        self._pending_state_attributes = {}
+        for states_meta in self._pending_states_meta.values():
+            self._states_meta_ids[states_meta.entity_id] = states_meta.metadata_id
+        self._pending_states_meta = {}
+
+    def _reset_pending_rows(self) -> None:
+        """Make the pending rows new again after the commit was rolled back.
+
+        bulk_save_objects gives the rows an identity and primary key even
+        when the transaction is rolled back afterwards, the next try would
+        update them instead of inserting them.
+        """
+        for state_attr in self._pending_state_attributes.values():
+            make_transient(state_attr)
+            state_attr.attributes_id = None
+        for states_meta in self._pending_states_meta.values():
+            make_transient(states_meta)
+            states_meta.metadata_id = None
+        for dbevent in self._pending_events:
+            make_transient(dbevent)
+            dbevent.event_id = None
+        for dbstate in self._pending_states:
+            make_transient(dbstate)
+            dbstate.state_id = None
+            dbstate.old_state_id = None
+            # Ids taken from rows of the rolled back commit are gone
+            if dbstate.state_attributes is not None:
+                dbstate.attributes_id = None
+            if dbstate.states_meta is not None:
+                dbstate.metadata_id = None
+
+    def _insert_pending_states(self) -> dict[str, int]:
+        """Insert the pending states and link them to their old states.
+
+        Returns the updated map of entity_id to the state_id of the last
+        state, which replaces _old_states once the commit succeeds.
+        """
+        old_states = dict(self._old_states)
+        pending_states = self._pending_states
+        while pending_states:
+            # Each entity can only appear once per insert since the
+            # old_state_id of the next state is the state_id of this one
+            states: dict[str, States] = {}
+            deferred_states: list[States] = []
+            for dbstate in pending_states:
+                if dbstate.entity_id in states:
+                    deferred_states.append(dbstate)
+                    continue
+                if dbstate.attributes_id is None and dbstate.state_attributes:
+                    dbstate.attributes_id = dbstate.state_attributes.attributes_id
+                if dbstate.metadata_id is None:
+                    dbstate.metadata_id = dbstate.states_meta.metadata_id
+                dbstate.old_state_id = old_states.pop(dbstate.entity_id, None)
+                states[dbstate.entity_id] = dbstate
+            self.event_session.bulk_save_objects(states.values(), return_defaults=True)
+            for entity_id, dbstate in states.items():
+                if dbstate.state is not None:
+                    old_states[entity_id] = dbstate.state_id
+            pending_states = deferred_states
+        return old_states
 
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
@@ -1007,6 +1218,12 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._state_attributes_ids.clear()
+        self._pending_state_attributes = {}
+        self._states_meta_ids.clear()
+        self._pending_states_meta = {}
+        self._pending_events = []
+        self._pending_states = []
 
         if not self.event_session:
             return
@@ -1161,9 +1378,22 @@ class Recorder(threading.Thread):
             session.flush()
             session.expunge(self.run_info)
             self._schedule_compile_missing_statistics(session)
+            self._schedule_unfinished_purge(session)
 
         self._open_event_session()
 
+    def _schedule_unfinished_purge(self, session: Session) -> None:
+        """Add a task to resume a purge which did not finish."""
+        if purge_run := purge.get_unfinished_purge_run(session):
+            _LOGGER.debug("Resuming purge before %s", purge_run.purge_before)
+            self.queue.put(
+                PurgeTask(
+                    process_timestamp(purge_run.purge_before),
+                    purge_run.repack,
+                    purge_run.apply_filter,
+                )
+            )
+
     def _schedule_compile_missing_statistics(self, session: Session) -> None:
         """Add tasks for missing statistics runs."""
         now = dt_util.utcnow()
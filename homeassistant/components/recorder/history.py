@@ -1,7 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections import defaultdict
+from datetime import timedelta
 from itertools import groupby
 import logging
 import time
@@ -10,10 +10,21 @@ from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
-from .models import LazyState, States, process_timestamp_to_utc_isoformat
+from . import statistics
+from .const import DOMAIN
+from .models import (
+    LazyState,
+    StateAttributes,
+    States,
+    StatesMeta,
+    process_timestamp,
+    process_timestamp_to_utc_isoformat,
+    states_with_entity_ids,
+)
 from .util import execute, session_scope
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -22,6 +33,9 @@ _LOGGER = logging.getLogger(__name__)
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+ATTRIBUTES_KEY = "attributes"
+MIN_KEY = "min"
+MAX_KEY = "max"
 
 SIGNIFICANT_DOMAINS = (
     "climate",
@@ -44,12 +58,31 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# The number of rows fetched from the database at once when streaming states
+STREAM_BATCH_SIZE = 1000
+
+# The statistics periods history can be downsampled to, from fine to coarse
+DOWNSAMPLE_PERIODS = (
+    ("5minute", timedelta(minutes=5)),
+    ("hour", timedelta(hours=1)),
+    ("day", timedelta(days=1)),
+    ("month", timedelta(days=31)),
+)
+
+
+def _outerjoin_state_attributes(query):
+    """Join the deduplicated attributes, they are NULL for old rows."""
+    return query.outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
 
 def async_setup(hass):
     """Set up the history hooks."""
@@ -72,6 +105,8 @@ def get_significant_states_with_session(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    columnar_response=False,
+    point_budget=None,
 ):
     """
     Return states changes during UTC period start_time - end_time.
@@ -84,12 +119,171 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    With columnar_response the states of each entity are returned as
+    parallel lists instead of a list of states, see _columnar_entity_states.
+
+    point_budget is an optional number of points per entity. Entities given
+    in entity_ids which have more states than that during the period, and
+    which have mean statistics, are served from the coarsest needed
+    statistics period instead of their states, see _get_downsampled_statistics.
     """
     timer_start = time.perf_counter()
 
+    downsampled = {}
+    states_entity_ids = entity_ids
+    if point_budget is not None and entity_ids:
+        downsampled = _get_downsampled_statistics(
+            hass, session, start_time, end_time, entity_ids, point_budget
+        )
+        states_entity_ids = [
+            entity_id for entity_id in entity_ids if entity_id not in downsampled
+        ]
+
+    states = []
+    if states_entity_ids is None or states_entity_ids:
+        states = execute(
+            _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                states_entity_ids,
+                filters,
+                significant_changes_only,
+            )
+        )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+        columnar_response,
+        downsampled,
+    )
+
+
+def _get_downsampled_statistics(
+    hass, session, start_time, end_time, entity_ids, point_budget
+):
+    """Return the statistics of entities with more states than point_budget.
+
+    Only entities with mean statistics compiled by the recorder in the unit
+    of the entity are downsampled. The finest statistics period which fits
+    the point budget is used, or the coarsest period if none does.
+    """
+    metadata = statistics.get_metadata_with_session(
+        hass,
+        session,
+        statistic_ids=list(entity_ids),
+        statistic_type="mean",
+        statistic_source=DOMAIN,
+    )
+    units = hass.config.units
+    candidates = [
+        entity_id
+        for entity_id, (_, meta) in metadata.items()
+        if (state := hass.states.get(entity_id)) is not None
+        and state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        == statistics.configured_unit(meta["unit_of_measurement"], units)
+    ]
+    if not candidates:
+        return {}
+
+    end_time = end_time or dt_util.utcnow()
+    query = (
+        session.query(StatesMeta.entity_id, func.count(States.state_id))
+        .join(States, States.metadata_id == StatesMeta.metadata_id)
+        .filter(StatesMeta.entity_id.in_(candidates))
+        .filter((States.last_updated > start_time) & (States.last_updated < end_time))
+        .group_by(StatesMeta.entity_id)
+    )
+    over_budget = [
+        entity_id for entity_id, count in execute(query) if count > point_budget
+    ]
+    if not over_budget:
+        return {}
+
+    period = DOWNSAMPLE_PERIODS[-1][0]
+    for period, duration in DOWNSAMPLE_PERIODS:
+        if (end_time - start_time) / duration <= point_budget:
+            break
+
+    stats = statistics.statistics_during_period(
+        hass, start_time, end_time, over_budget, period, start_time_as_datetime=True
+    )
+    return {
+        entity_id: [stat for stat in ent_stats if stat["start"] >= start_time]
+        for entity_id, ent_stats in stats.items()
+    }
+
+
+def stream_significant_states_with_session(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """
+    Yield the states changes of each entity during UTC period start_time - end_time.
+
+    Takes the same arguments as get_significant_states_with_session, but
+    yields an (entity_id, states) tuple per entity instead of returning a dict.
+    The rows are fetched from the database cursor in batches of
+    STREAM_BATCH_SIZE and states is an iterator, so the memory used does not
+    grow with the requested period.
+
+    Each states iterator must be consumed before advancing to the next entity.
+    """
+    query = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_SIZE))
+
+    start_time_states = {}
+    if include_start_time_state:
+        start_time_states = _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
+        )
+
+    yield from _sorted_states_to_entity_states(
+        query, start_time_states, minimal_response
+    )
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+):
+    """Return the query for the significant states during a period."""
     baked_query = hass.data[HISTORY_BAKERY](
         lambda session: session.query(*QUERY_STATES)
     )
+    baked_query += _outerjoin_state_attributes
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -104,7 +298,7 @@ def get_significant_states_with_session(
 
     if entity_ids is not None:
         baked_query += lambda q: q.filter(
-            States.entity_id.in_(bindparam("entity_ids", expanding=True))
+            states_with_entity_ids(bindparam("entity_ids", expanding=True))
         )
     else:
         baked_query += lambda q: q.filter(~States.domain.in_(IGNORE_DOMAINS))
@@ -116,25 +310,8 @@ def get_significant_states_with_session(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
-
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
-
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
 
@@ -144,6 +321,7 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
         baked_query = hass.data[HISTORY_BAKERY](
             lambda session: session.query(*QUERY_STATES)
         )
+        baked_query += _outerjoin_state_attributes
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -156,19 +334,21 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                states_with_entity_ids(bindparam("entity_ids", expanding=True))
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
+        entity_ids = [entity_id] if entity_id is not None else None
+
         states = execute(
             baked_query(session).params(
-                start_time=start_time, end_time=end_time, entity_id=entity_id
+                start_time=start_time, end_time=end_time, entity_ids=entity_ids
             )
         )
 
-        entity_ids = [entity_id] if entity_id is not None else None
-
         return _sorted_states_to_dict(hass, session, states, start_time, entity_ids)
 
 
@@ -180,10 +360,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
         baked_query = hass.data[HISTORY_BAKERY](
             lambda session: session.query(*QUERY_STATES)
         )
+        baked_query += _outerjoin_state_attributes
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                states_with_entity_ids(bindparam("entity_ids", expanding=True))
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -192,14 +375,14 @@ def get_last_state_changes(hass, number_of_states, entity_id):
 
         baked_query += lambda q: q.limit(bindparam("number_of_states"))
 
+        entity_ids = [entity_id] if entity_id is not None else None
+
         states = execute(
             baked_query(session).params(
-                number_of_states=number_of_states, entity_id=entity_id
+                number_of_states=number_of_states, entity_ids=entity_ids
             )
         )
 
-        entity_ids = [entity_id] if entity_id is not None else None
-
         return _sorted_states_to_dict(
             hass,
             session,
@@ -243,7 +426,7 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _outerjoin_state_attributes(session.query(*QUERY_STATES))
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -256,9 +439,9 @@ def _get_states_with_session(
                 (States.last_updated >= run.start)
                 & (States.last_updated < utc_point_in_time)
             )
-            .filter(States.entity_id.in_(entity_ids))
+            .filter(states_with_entity_ids(entity_ids))
         )
-        most_recent_state_ids = most_recent_state_ids.group_by(States.entity_id)
+        most_recent_state_ids = most_recent_state_ids.group_by(States.metadata_id)
         most_recent_state_ids = most_recent_state_ids.subquery()
         query = query.join(
             most_recent_state_ids,
@@ -271,14 +454,14 @@ def _get_states_with_session(
         # not indexed and we can't control what's in the custom filter.
         most_recent_states_by_date = (
             session.query(
-                States.entity_id.label("max_entity_id"),
+                States.metadata_id.label("max_metadata_id"),
                 func.max(States.last_updated).label("max_last_updated"),
             )
             .filter(
                 (States.last_updated >= run.start)
                 & (States.last_updated < utc_point_in_time)
             )
-            .group_by(States.entity_id)
+            .group_by(States.metadata_id)
             .subquery()
         )
         most_recent_state_ids = (
@@ -286,12 +469,12 @@ def _get_states_with_session(
             .join(
                 most_recent_states_by_date,
                 and_(
-                    States.entity_id == most_recent_states_by_date.c.max_entity_id,
+                    States.metadata_id == most_recent_states_by_date.c.max_metadata_id,
                     States.last_updated
                     == most_recent_states_by_date.c.max_last_updated,
                 ),
             )
-            .group_by(States.entity_id)
+            .group_by(States.metadata_id)
             .subquery()
         )
         query = query.join(
@@ -302,6 +485,10 @@ def _get_states_with_session(
         if filters:
             query = filters.apply(query)
 
+    # The inner queries group by metadata_id, keep the results
+    # in entity_id order
+    query = query.order_by(States.entity_id)
+
     return [LazyState(row) for row in execute(query)]
 
 
@@ -311,15 +498,16 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
     baked_query = hass.data[HISTORY_BAKERY](
         lambda session: session.query(*QUERY_STATES)
     )
+    baked_query += _outerjoin_state_attributes
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
-        States.entity_id == bindparam("entity_id"),
+        states_with_entity_ids(bindparam("entity_ids", expanding=True)),
     )
     baked_query += lambda q: q.order_by(States.last_updated.desc())
     baked_query += lambda q: q.limit(1)
 
     query = baked_query(session).params(
-        utc_point_in_time=utc_point_in_time, entity_id=entity_id
+        utc_point_in_time=utc_point_in_time, entity_ids=[entity_id]
     )
 
     return [LazyState(row) for row in execute(query)]
@@ -334,6 +522,8 @@ def _sorted_states_to_dict(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    columnar_response=False,
+    downsampled=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -346,72 +536,216 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    result = defaultdict(list)
+    result = {}
     # Set all entity IDs to empty lists in result set to maintain the order
     if entity_ids is not None:
         for ent_id in entity_ids:
             result[ent_id] = []
 
     # Get the states at the start time
-    timer_start = time.perf_counter()
+    start_time_states = {}
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
-        ):
-            state.last_changed = start_time
-            state.last_updated = start_time
-            result[state.entity_id].append(state)
+        start_time_states = _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
+        )
+        for ent_id in start_time_states:
+            result[ent_id] = []
+
+    # Add all changes to it
+    for ent_id, ent_states in _sorted_states_to_entity_states(
+        states, start_time_states, minimal_response, columnar_response
+    ):
+        result[ent_id] = ent_states if columnar_response else list(ent_states)
+
+    # Add the entities served from statistics
+    for ent_id, ent_stats in (downsampled or {}).items():
+        result[ent_id] = _statistics_to_entity_states(
+            start_time_states.get(ent_id), ent_stats, columnar_response
+        )
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _get_start_time_states(hass, session, start_time, entity_ids, filters):
+    """Return the states at the start time by entity_id.
+
+    The states get start_time as last_changed and last_updated, they are
+    the synthetic first data point of each list of states.
+    """
+    timer_start = time.perf_counter()
+    run = recorder.run_information_from_instance(hass, start_time)
+    start_time_states = {}
+    for state in _get_states_with_session(
+        hass, session, start_time, entity_ids, run=run, filters=filters
+    ):
+        state.last_changed = start_time
+        state.last_updated = start_time
+        start_time_states[state.entity_id] = state
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
+        _LOGGER.debug(
+            "getting %d first datapoints took %fs", len(start_time_states), elapsed
+        )
+
+    return start_time_states
+
+
+def _sorted_states_to_entity_states(
+    states, start_time_states, minimal_response, columnar_response=False
+):
+    """Yield an (entity_id, states) tuple per entity.
+
+    States must be sorted by entity_id and last_updated. The start time
+    states of entities without changes are yielded last.
+    """
+    entity_states = _columnar_entity_states if columnar_response else _entity_states
+    start_time_states = dict(start_time_states)
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        yield ent_id, entity_states(
+            ent_id, start_time_states.pop(ent_id, None), group, minimal_response
+        )
+
+    for ent_id, start_time_state in start_time_states.items():
+        yield ent_id, entity_states(ent_id, start_time_state, iter(()), False)
+
+
+def _entity_states(ent_id, start_time_state, group, minimal_response):
+    """Yield the states of a single entity."""
+    if start_time_state is not None:
+        yield start_time_state
+
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        yield from (LazyState(db_state) for db_state in group)
+        return
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if (prev_state := start_time_state) is None:
+        prev_state = next(group)
+        yield LazyState(prev_state)
 
     # Called in a tight loop so cache the function
     # here
     _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
 
-    # Append all changes to it
-    for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
+    # The last state change is held back as it has to be
+    # provided as a full state
+    last_state_change = None
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        if last_state_change is not None:
+            yield {
+                STATE_KEY: last_state_change.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    last_state_change.last_changed
+                ),
+            }
+        last_state_change = prev_state = db_state
 
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+    if last_state_change is not None:
+        yield LazyState(last_state_change)
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+
+def _columnar_entity_states(ent_id, start_time_state, group, minimal_response):
+    """Return the states of a single entity as parallel lists.
+
+    The result has a list of states and a list of last_changed epoch
+    timestamps, with a [index, attributes] pair in the attributes list
+    wherever the attributes differ from the previous state. With minimal
+    response, changes of the attributes only are dropped and the attributes
+    are only provided for the first and last state.
+    """
+    states = []
+    last_changed = []
+    attributes = []
+    prev_attributes = None
+    prev_raw_attributes = None
+    last_state = None
+
+    domain = split_entity_id(ent_id)[0]
+    minimal_response = minimal_response and domain not in NEED_ATTRIBUTE_DOMAINS
+
+    if start_time_state is not None:
+        states.append(start_time_state.state)
+        last_changed.append(start_time_state.last_changed.timestamp())
+        prev_attributes = start_time_state.attributes
+        attributes.append([0, prev_attributes])
+
+    for db_state in group:
+        state = db_state.state or ""
+        if minimal_response and states and state == states[-1]:
+            continue
+
+        last_state = db_state
+        # Only decode the attributes when the stored json changes
+        if (
+            not (minimal_response and states)
+            and (raw_attributes := db_state.shared_attrs or db_state.attributes)
+            != prev_raw_attributes
+        ):
+            prev_raw_attributes = raw_attributes
+            if (state_attributes := LazyState(db_state).attributes) != prev_attributes:
+                attributes.append([len(states), state_attributes])
+                prev_attributes = state_attributes
+
+        states.append(state)
+        last_changed.append(process_timestamp(db_state.last_changed).timestamp())
+
+    if minimal_response and last_state is not None and len(states) > 1:
+        if (state_attributes := LazyState(last_state).attributes) != prev_attributes:
+            attributes.append([len(states) - 1, state_attributes])
+
+    return {
+        STATE_KEY: states,
+        LAST_CHANGED_KEY: last_changed,
+        ATTRIBUTES_KEY: attributes,
+    }
+
+
+def _statistics_to_entity_states(start_time_state, ent_stats, columnar_response):
+    """Return the statistics of a single entity as states.
+
+    The mean of each statistics period is the state, the min and max are
+    added to it.
+    """
+    if columnar_response:
+        result = {
+            STATE_KEY: [stat["mean"] for stat in ent_stats],
+            LAST_CHANGED_KEY: [stat["start"].timestamp() for stat in ent_stats],
+            ATTRIBUTES_KEY: [],
+            MIN_KEY: [stat["min"] for stat in ent_stats],
+            MAX_KEY: [stat["max"] for stat in ent_stats],
+        }
+        if start_time_state is not None:
+            result[STATE_KEY].insert(0, start_time_state.state)
+            result[LAST_CHANGED_KEY].insert(
+                0, start_time_state.last_changed.timestamp()
+            )
+            result[ATTRIBUTES_KEY].append([0, start_time_state.attributes])
+            result[MIN_KEY].insert(0, None)
+            result[MAX_KEY].insert(0, None)
+        return result
+
+    ent_states = [] if start_time_state is None else [start_time_state]
+    ent_states.extend(
+        {
+            STATE_KEY: stat["mean"],
+            LAST_CHANGED_KEY: stat["start"].isoformat(),
+            MIN_KEY: stat["min"],
+            MAX_KEY: stat["max"],
+        }
+        for stat in ent_stats
+    )
+    return ent_states
 
 
 def get_state(hass, utc_point_in_time, entity_id, run=None):
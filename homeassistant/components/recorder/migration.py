@@ -4,7 +4,15 @@ from datetime import timedelta
 import logging
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text
+from sqlalchemy import (
+    ForeignKeyConstraint,
+    MetaData,
+    Table,
+    distinct,
+    func,
+    select,
+    text,
+)
 from sqlalchemy.exc import (
     InternalError,
     OperationalError,
@@ -19,6 +27,8 @@ from .models import (
     TABLE_STATES,
     Base,
     SchemaChanges,
+    States,
+    StatesMeta,
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
@@ -30,6 +40,8 @@ from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+MIGRATION_BATCH_SIZE = 10000
+
 
 def raise_if_exception_missing_str(ex, match_substrs):
     """Raise an exception if the exception and cause do not contain the match substrs."""
@@ -205,7 +217,7 @@ def _add_columns(connection, table_name, columns_def):
             )
         )
         return
-    except (InternalError, OperationalError):
+    except (InternalError, OperationalError, ProgrammingError):
         # Some engines support adding all columns at once,
         # this error is when they don't
         _LOGGER.info("Unable to use quick column add. Adding 1 by 1")
@@ -219,7 +231,7 @@ def _add_columns(connection, table_name, columns_def):
                     )
                 )
             )
-        except (InternalError, OperationalError) as err:
+        except (InternalError, OperationalError, ProgrammingError) as err:
             raise_if_exception_missing_str(err, ["already exists", "duplicate"])
             _LOGGER.warning(
                 "Column %s already exists on %s, continuing",
@@ -603,11 +615,82 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
             "statistics_short_term",
             "ix_statistics_short_term_statistic_id_start",
         )
-
+    elif new_version == 25:
+        # The state_attributes table is created by create_all, link
+        # the states table to it so attributes can be deduplicated
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 26:
+        # State changes no longer write a row to the events table,
+        # the context is stored on the states table instead.
+        # context_id and context_user_id may still be there from
+        # schema version 6
+        _add_columns(
+            connection,
+            "states",
+            [
+                "context_id CHARACTER(36)",
+                "context_user_id CHARACTER(36)",
+                "context_parent_id CHARACTER(36)",
+            ],
+        )
+        _create_index(connection, "states", "ix_states_context_id")
+    elif new_version == 27:
+        # The states_meta table is created by create_all, link the states
+        # table to it so states are looked up by a small integer id
+        _add_columns(connection, "states", ["metadata_id INTEGER"])
+        connection.execute(
+            StatesMeta.__table__.insert().from_select(
+                ["entity_id"],
+                select(distinct(States.entity_id)).where(
+                    States.entity_id.isnot(None)
+                    & States.entity_id.notin_(select(StatesMeta.entity_id))
+                ),
+            )
+        )
+        _backfill_states_metadata_id(session)
+        _create_index(
+            session.connection(), "states", "ix_states_metadata_id_last_updated"
+        )
+    elif new_version == 28:
+        # The purge_runs table is created by create_all
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _backfill_states_metadata_id(session):
+    """Link the existing states to their states_meta rows.
+
+    The states are updated in ranges of MIGRATION_BATCH_SIZE state_ids and
+    each range is committed to keep the transactions small. States which
+    already have a metadata_id are skipped, so an interrupted migration
+    continues where it stopped.
+    """
+    max_state_id = (
+        session.connection().execute(select(func.max(States.state_id))).scalar()
+    )
+    if max_state_id is None:
+        return
+
+    metadata_id = (
+        select(StatesMeta.metadata_id)
+        .where(StatesMeta.entity_id == States.entity_id)
+        .scalar_subquery()
+    )
+    for batch_start in range(0, max_state_id + 1, MIGRATION_BATCH_SIZE):
+        session.connection().execute(
+            States.__table__.update()
+            .where(
+                (States.state_id >= batch_start)
+                & (States.state_id < batch_start + MIGRATION_BATCH_SIZE)
+                & States.metadata_id.is_(None)
+            )
+            .values(metadata_id=metadata_id)
+        )
+        session.commit()
+
+
 def _inspect_schema_version(engine, session):
     """Determine the schema version by inspecting the db structure.
 
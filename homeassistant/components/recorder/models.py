@@ -4,9 +4,11 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 import json
 import logging
-from typing import TypedDict, overload
+from typing import Any, TypedDict, cast, overload
 
+from fnvhash import fnv1a_32
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -18,11 +20,13 @@ from sqlalchemy import (
     String,
     Text,
     distinct,
+    select,
 )
 from sqlalchemy.dialects import mysql, oracle, postgresql
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ClauseElement
 
 from homeassistant.const import (
     MAX_LENGTH_EVENT_CONTEXT_ID,
@@ -33,14 +37,14 @@ from homeassistant.const import (
     MAX_LENGTH_STATE_STATE,
 )
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_dumps, json_loads
 import homeassistant.util.dt as dt_util
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 24
+SCHEMA_VERSION = 28
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,7 +52,10 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
+TABLE_STATES_META = "states_meta"
 TABLE_RECORDER_RUNS = "recorder_runs"
+TABLE_PURGE_RUNS = "purge_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
@@ -57,8 +64,11 @@ TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES_META,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
+    TABLE_PURGE_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
@@ -111,8 +121,7 @@ class Events(Base):  # type: ignore
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=event_data
-            or json.dumps(event.data, cls=JSONEncoder, separators=(",", ":")),
+            event_data=event_data or json_dumps(event.data),
             origin=str(event.origin.value),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -130,13 +139,13 @@ class Events(Base):  # type: ignore
         try:
             return Event(
                 self.event_type,
-                json.loads(self.event_data),
+                json_loads(self.event_data),
                 EventOrigin(self.origin),
                 process_timestamp(self.time_fired),
                 context=context,
             )
         except ValueError:
-            # When json.loads fails
+            # When json_loads fails
             _LOGGER.exception("Error converting to event: %s", self)
             return None
 
@@ -147,6 +156,8 @@ class States(Base):  # type: ignore
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
         # (get_states in history.py)
+        Index("ix_states_metadata_id_last_updated", "metadata_id", "last_updated"),
+        # Used by the history filters and to order states by entity_id
         Index("ix_states_entity_id_last_updated", "entity_id", "last_updated"),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
@@ -163,8 +174,17 @@ class States(Base):  # type: ignore
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
+    context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
+    context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
+    context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
+    metadata_id = Column(Integer, ForeignKey("states_meta.metadata_id"))
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
+    states_meta = relationship("StatesMeta")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -173,31 +193,39 @@ class States(Base):  # type: ignore
             f"id={self.state_id}, domain='{self.domain}', entity_id='{self.entity_id}', "
             f"state='{self.state}', event_id='{self.event_id}', "
             f"last_updated='{self.last_updated.isoformat(sep=' ', timespec='seconds')}', "
-            f"old_state_id={self.old_state_id}"
+            f"old_state_id={self.old_state_id}, attributes_id={self.attributes_id}, "
+            f"metadata_id={self.metadata_id}"
             f")>"
         )
 
     @staticmethod
     def from_event(event):
-        """Create object from a state_changed event."""
+        """Create object from a state_changed event.
+
+        The attributes are not stored on the row, they are deduplicated
+        in the state_attributes table, see StateAttributes. The context
+        is stored on the row, no events row is written for state changes.
+        """
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
-        dbstate = States(entity_id=entity_id)
+        dbstate = States(
+            entity_id=entity_id,
+            attributes=None,
+            context_id=event.context.id,
+            context_user_id=event.context.user_id,
+            context_parent_id=event.context.parent_id,
+        )
 
         # State got deleted
         if state is None:
             dbstate.state = ""
             dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
             dbstate.last_changed = event.time_fired
             dbstate.last_updated = event.time_fired
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -205,24 +233,121 @@ class States(Base):  # type: ignore
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        context = Context(
+            id=self.context_id,
+            user_id=self.context_user_id,
+            parent_id=self.context_parent_id,
+        )
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                # Join the state_attributes table on attributes_id to get
+                # the attributes for states recorded with schema 25 or later
+                json_loads(self.attributes) if self.attributes else {},
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
-                # Join the events table on event_id to get the context instead
-                # as it will always be there for state_changed events
-                context=Context(id=None),
+                # States recorded before schema 26 have no context, join
+                # the events table on event_id to get it instead
+                context=context,
                 validate_entity_id=validate_entity_id,
             )
         except ValueError:
-            # When json.loads fails
+            # When json_loads fails
             _LOGGER.exception("Error converting row to state: %s", self)
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    # Note that this is not named attributes to avoid confusion with the states table
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_event(event: Event) -> StateAttributes:
+        """Create object from a state_changed event."""
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        return StateAttributes(
+            shared_attrs=shared_attrs,
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+        )
+
+    @staticmethod
+    def shared_attrs_from_event(event: Event) -> str:
+        """Create shared_attrs from a state_changed event."""
+        state: State | None = event.data.get("new_state")
+        # State got deleted
+        if state is None:
+            return "{}"
+        try:
+            return state.attributes_json
+        except ValueError:
+            # The stdlib backend rejects NaN, which the database has always accepted
+            return json.dumps(
+                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
+            )
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash of json encoded shared attributes."""
+        return cast(int, fnv1a_32(shared_attrs.encode("utf-8")))
+
+    def to_native(self) -> dict[str, Any]:
+        """Convert to a state attributes dictionary."""
+        try:
+            return cast(dict[str, Any], json_loads(self.shared_attrs))
+        except ValueError:
+            # When json_loads fails
+            _LOGGER.exception("Error converting row to state attributes: %s", self)
+            return {}
+
+
+class StatesMeta(Base):  # type: ignore
+    """Metadata for states, maps entity_ids to small integer ids."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATES_META
+    metadata_id = Column(Integer, Identity(), primary_key=True)
+    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID), index=True, unique=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatesMeta("
+            f"id={self.metadata_id}, entity_id='{self.entity_id}'"
+            f")>"
+        )
+
+
+def states_with_entity_ids(entity_ids: Any) -> ClauseElement:
+    """Return a filter matching the states of entity_ids.
+
+    The states are matched on their integer metadata_id so the
+    ix_states_metadata_id_last_updated index can be used.
+    entity_ids is a list of entity_ids or an expanding bindparam.
+    """
+    return States.metadata_id.in_(
+        select(StatesMeta.metadata_id).where(StatesMeta.entity_id.in_(entity_ids))
+    )
+
+
 class StatisticResult(TypedDict):
     """Statistic result data class.
 
@@ -411,6 +536,34 @@ class SchemaChanges(Base):  # type: ignore
         )
 
 
+class PurgeRuns(Base):  # type: ignore
+    """Representation of a purge run.
+
+    A purge run without an end is resumed when the recorder starts.
+    """
+
+    __tablename__ = TABLE_PURGE_RUNS
+    run_id = Column(Integer, Identity(), primary_key=True)
+    purge_before = Column(DATETIME_TYPE, nullable=False)
+    repack = Column(Boolean, default=False)
+    apply_filter = Column(Boolean, default=False)
+    start = Column(DATETIME_TYPE, default=dt_util.utcnow)
+    end = Column(DATETIME_TYPE)
+    batch_size = Column(Integer)
+    states_purged = Column(Integer, default=0)
+    events_purged = Column(Integer, default=0)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.PurgeRuns("
+            f"id={self.run_id}, purge_before='{self.purge_before.isoformat(sep=' ', timespec='seconds')}', "
+            f"end={self.end}, states_purged={self.states_purged}, "
+            f"events_purged={self.events_purged}"
+            f")>"
+        )
+
+
 class StatisticsRuns(Base):  # type: ignore
     """Representation of statistics run."""
 
@@ -496,9 +649,13 @@ class LazyState(State):
         """State attributes."""
         if not self._attributes:
             try:
-                self._attributes = json.loads(self._row.attributes)
+                # Rows recorded before schema 25 have the attributes
+                # stored directly in the states table
+                self._attributes = json_loads(
+                    self._row.shared_attrs or self._row.attributes
+                )
             except ValueError:
-                # When json.loads fails
+                # When json_loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
                 self._attributes = {}
         return self._attributes
@@ -4,14 +4,29 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States, StatisticsRuns, StatisticsShortTerm
+from .models import (
+    Events,
+    PurgeRuns,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatesMeta,
+    StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
+    process_timestamp_to_utc_isoformat,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -20,6 +35,11 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# The purge batch size is adapted so deleting a batch takes about this
+# many seconds, to not hold up the recorder queue on slow databases
+PURGE_BATCH_TARGET_DURATION = 0.5
+MIN_ROWS_TO_PURGE = 50
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -27,7 +47,8 @@ def purge_old_data(
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Cleans up a batch of rows, based on the oldest record. The progress is
+    stored in the purge run, which is committed with the deleted batch.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
@@ -35,17 +56,30 @@ def purge_old_data(
     )
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
-        # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-        event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
-        statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
+        purge_run = _get_or_start_purge_run(session, purge_before, repack, apply_filter)
+        batch_size = purge_run.batch_size
+        batch_start = time.monotonic()
+
+        # Purge a max of batch_size, based on the oldest states or events record
+        event_ids = _select_event_ids_to_purge(session, purge_before, batch_size)
+        state_ids, attributes_ids = _select_state_and_attributes_ids_to_purge(
+            session, purge_before, batch_size
+        )
+        statistics_runs = _select_statistics_runs_to_purge(
+            session, purge_before, batch_size
+        )
         short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before
+            session, purge_before, batch_size
         )
 
         if state_ids:
             _purge_state_ids(instance, session, state_ids)
 
+        if unused_attribute_ids := _select_unused_attributes_ids(
+            session, attributes_ids
+        ):
+            _purge_attributes_ids(instance, session, unused_attribute_ids)
+
         if event_ids:
             _purge_event_ids(session, event_ids)
 
@@ -55,7 +89,12 @@ def purge_old_data(
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
-        if event_ids or statistics_runs or short_term_statistics:
+        if state_ids or event_ids or statistics_runs or short_term_statistics:
+            purge_run.states_purged += len(state_ids)
+            purge_run.events_purged += len(event_ids)
+            purge_run.batch_size = _adapt_batch_size(
+                batch_size, time.monotonic() - batch_start
+            )
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -65,47 +104,146 @@ def purge_old_data(
             return False
 
         _purge_old_recorder_runs(instance, session, purge_before)
+        _purge_old_purge_runs(session, purge_before)
+        purge_run.end = dt_util.utcnow()
     if repack:
         repack_database(instance)
     return True
 
 
-def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
+def _get_or_start_purge_run(
+    session: Session, purge_before: datetime, repack: bool, apply_filter: bool
+) -> PurgeRuns:
+    """Return the unfinished purge run, or start a new one.
+
+    An unfinished purge run is taken over by a new purge request, so
+    its progress carries over.
+    """
+    if (purge_run := get_unfinished_purge_run(session)) is None:
+        purge_run = PurgeRuns(
+            purge_before=purge_before,
+            repack=repack,
+            apply_filter=apply_filter,
+            start=dt_util.utcnow(),
+            batch_size=MAX_ROWS_TO_PURGE,
+            states_purged=0,
+            events_purged=0,
+        )
+        session.add(purge_run)
+    elif (
+        process_timestamp(purge_run.purge_before) != purge_before
+        or purge_run.repack != repack
+        or purge_run.apply_filter != apply_filter
+    ):
+        purge_run.purge_before = purge_before
+        purge_run.repack = repack
+        purge_run.apply_filter = apply_filter
+    return purge_run
+
+
+def _adapt_batch_size(batch_size: int, elapsed: float) -> int:
+    """Scale the batch size towards PURGE_BATCH_TARGET_DURATION.
+
+    The batch size changes by at most a factor two per batch, so a single
+    slow or fast batch does not swing it to the limits.
+    """
+    if elapsed <= 0:
+        scaled = batch_size * 2
+    else:
+        scaled = int(batch_size * PURGE_BATCH_TARGET_DURATION / elapsed)
+    scaled = min(max(scaled, batch_size // 2), batch_size * 2)
+    return min(max(scaled, MIN_ROWS_TO_PURGE), MAX_ROWS_TO_PURGE)
+
+
+def get_unfinished_purge_run(session: Session) -> PurgeRuns | None:
+    """Return the purge run which did not finish before the recorder stopped."""
+    return (
+        session.query(PurgeRuns)
+        .filter(PurgeRuns.end.is_(None))
+        .order_by(PurgeRuns.run_id.desc())
+        .first()
+    )
+
+
+def get_purge_progress(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return the progress of the last purge run."""
+    with session_scope(hass=hass) as session:
+        purge_run = session.query(PurgeRuns).order_by(PurgeRuns.run_id.desc()).first()
+        if purge_run is None:
+            return None
+        return {
+            "purge_before": process_timestamp_to_utc_isoformat(purge_run.purge_before),
+            "start": process_timestamp_to_utc_isoformat(purge_run.start),
+            "end": process_timestamp_to_utc_isoformat(purge_run.end),
+            "in_progress": purge_run.end is None,
+            "batch_size": purge_run.batch_size,
+            "states_purged": purge_run.states_purged,
+            "events_purged": purge_run.events_purged,
+        }
+
+
+def _select_event_ids_to_purge(
+    session: Session, purge_before: datetime, max_rows: int = MAX_ROWS_TO_PURGE
+) -> list[int]:
     """Return a list of event ids to purge."""
     events = (
         session.query(Events.event_id)
         .filter(Events.time_fired < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
+        .limit(max_rows)
         .all()
     )
     _LOGGER.debug("Selected %s event ids to remove", len(events))
     return [event.event_id for event in events]
 
 
-def _select_state_ids_to_purge(
-    session: Session, purge_before: datetime, event_ids: list[int]
-) -> set[int]:
-    """Return a list of state ids to purge."""
-    if not event_ids:
-        return set()
+def _select_state_and_attributes_ids_to_purge(
+    session: Session, purge_before: datetime, max_rows: int = MAX_ROWS_TO_PURGE
+) -> tuple[set[int], set[int]]:
+    """Return a list of state and attribute ids to purge."""
     states = (
-        session.query(States.state_id)
+        session.query(States.state_id, States.attributes_id)
         .filter(States.last_updated < purge_before)
-        .filter(States.event_id.in_(event_ids))
+        .limit(max_rows)
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return {state.state_id for state in states}
+    state_ids = set()
+    attributes_ids = set()
+    for state in states:
+        state_ids.add(state.state_id)
+        if state.attributes_id:
+            attributes_ids.add(state.attributes_id)
+    return state_ids, attributes_ids
+
+
+def _select_unused_attributes_ids(
+    session: Session, attributes_ids: set[int]
+) -> set[int]:
+    """Return a set of attributes ids that are not used by any states in the database."""
+    if not attributes_ids:
+        return set()
+    seen_ids = {
+        state[0]
+        for state in session.query(distinct(States.attributes_id))
+        .filter(States.attributes_id.in_(attributes_ids))
+        .all()
+    }
+    to_remove = attributes_ids - seen_ids
+    _LOGGER.debug(
+        "Selected %s shared attributes to remove",
+        len(to_remove),
+    )
+    return to_remove
 
 
 def _select_statistics_runs_to_purge(
-    session: Session, purge_before: datetime
+    session: Session, purge_before: datetime, max_rows: int = MAX_ROWS_TO_PURGE
 ) -> list[int]:
     """Return a list of statistic runs to purge, but take care to keep the newest run."""
     statistic_runs = (
         session.query(StatisticsRuns.run_id)
         .filter(StatisticsRuns.start < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
+        .limit(max_rows)
         .all()
     )
     statistic_runs_list = [run.run_id for run in statistic_runs]
@@ -120,13 +258,13 @@ def _select_statistics_runs_to_purge(
 
 
 def _select_short_term_statistics_to_purge(
-    session: Session, purge_before: datetime
+    session: Session, purge_before: datetime, max_rows: int = MAX_ROWS_TO_PURGE
 ) -> list[int]:
     """Return a list of short term statistics to purge."""
     statistics = (
         session.query(StatisticsShortTerm.id)
         .filter(StatisticsShortTerm.start < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
+        .limit(max_rows)
         .all()
     )
     _LOGGER.debug("Selected %s short term statistics to remove", len(statistics))
@@ -165,9 +303,7 @@ def _evict_purged_states_from_old_states_cache(
     # Make a map from old_state_id to entity_id
     old_states = instance._old_states  # pylint: disable=protected-access
     old_state_reversed = {
-        old_state.state_id: entity_id
-        for entity_id, old_state in old_states.items()
-        if old_state.state_id
+        old_state_id: entity_id for entity_id, old_state_id in old_states.items()
     }
 
     # Evict any purged state from the old states cache
@@ -175,6 +311,62 @@ def _evict_purged_states_from_old_states_cache(
         old_states.pop(old_state_reversed[purged_state_id], None)
 
 
+def _evict_purged_attributes_from_attributes_cache(
+    instance: Recorder, purged_attributes_ids: set[int]
+) -> None:
+    """Evict purged attribute ids from the attribute ids cache."""
+    # Make a map from attributes_id to the attributes json
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    state_attributes_ids_reversed = {
+        attributes_id: attributes
+        for attributes, attributes_id in state_attributes_ids.items()
+    }
+
+    # Evict any purged attributes from the state_attributes_ids cache
+    for purged_attribute_id in purged_attributes_ids.intersection(
+        state_attributes_ids_reversed
+    ):
+        state_attributes_ids.pop(
+            state_attributes_ids_reversed[purged_attribute_id], None
+        )
+
+
+def _purge_states_meta_ids(
+    instance: Recorder, session: Session, metadata_ids: set[int]
+) -> None:
+    """Delete the metadata of entities without states."""
+    deleted_rows = (
+        session.query(StatesMeta)
+        .filter(StatesMeta.metadata_id.in_(metadata_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s states meta", deleted_rows)
+
+    # Evict any purged metadata from the states_meta_ids cache
+    states_meta_ids = instance._states_meta_ids  # pylint: disable=protected-access
+    for entity_id, metadata_id in list(states_meta_ids.items()):
+        if metadata_id in metadata_ids:
+            states_meta_ids.pop(entity_id, None)
+
+
+def _purge_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete old attributes ids."""
+
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the state_attributes_ids cache referring to a purged state
+    _evict_purged_attributes_from_attributes_cache(instance, attributes_ids)
+
+
 def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None:
     """Delete by run_id."""
     deleted_rows = (
@@ -198,7 +390,18 @@ def _purge_short_term_statistics(
 
 
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
-    """Delete by event id."""
+    """Disconnect states and delete by event id."""
+
+    # States recorded before schema version 26 may still refer
+    # to the events table, update event_id to NULL before deleting
+    # to ensure the delete does not fail due to a foreign key constraint
+    disconnected_rows = (
+        session.query(States)
+        .filter(States.event_id.in_(event_ids))
+        .update({"event_id": None}, synchronize_session=False)
+    )
+    _LOGGER.debug("Updated %s states to remove event_id", disconnected_rows)
+
     deleted_rows = (
         session.query(Events)
         .filter(Events.event_id.in_(event_ids))
@@ -221,18 +424,31 @@ def _purge_old_recorder_runs(
     _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
 
+def _purge_old_purge_runs(session: Session, purge_before: datetime) -> None:
+    """Purge all old finished purge runs."""
+    # Purge runs is small, no need to batch run it
+    deleted_rows = (
+        session.query(PurgeRuns)
+        .filter(PurgeRuns.end < purge_before)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s purge_runs", deleted_rows)
+
+
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     """Remove filtered states and events that shouldn't be in the database."""
     _LOGGER.debug("Cleanup filtered data")
 
     # Check if excluded entity_ids are in database
-    excluded_entity_ids: list[str] = [
-        entity_id
-        for (entity_id,) in session.query(distinct(States.entity_id)).all()
+    excluded_metadata_ids: list[int] = [
+        metadata_id
+        for (metadata_id, entity_id) in session.query(
+            StatesMeta.metadata_id, StatesMeta.entity_id
+        ).all()
         if not instance.entity_filter(entity_id)
     ]
-    if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(instance, session, excluded_entity_ids)
+    if len(excluded_metadata_ids) > 0:
+        _purge_filtered_states(instance, session, excluded_metadata_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -249,25 +465,33 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 
 
 def _purge_filtered_states(
-    instance: Recorder, session: Session, excluded_entity_ids: list[str]
+    instance: Recorder, session: Session, excluded_metadata_ids: list[int]
 ) -> None:
     """Remove filtered states and linked events."""
+    states = (
+        session.query(States.state_id, States.attributes_id, States.event_id)
+        .filter(States.metadata_id.in_(excluded_metadata_ids))
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
+    )
+    if not states:
+        # All states of the entities are gone, remove their metadata
+        _purge_states_meta_ids(instance, session, set(excluded_metadata_ids))
+        return
     state_ids: list[int]
+    attributes_ids: list[int]
     event_ids: list[int | None]
-    state_ids, event_ids = zip(
-        *(
-            session.query(States.state_id, States.event_id)
-            .filter(States.entity_id.in_(excluded_entity_ids))
-            .limit(MAX_ROWS_TO_PURGE)
-            .all()
-        )
-    )
+    state_ids, attributes_ids, event_ids = zip(*states)
     event_ids = [id_ for id_ in event_ids if id_ is not None]
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
     _purge_state_ids(instance, session, set(state_ids))
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
+    if unused_attribute_ids_set := _select_unused_attributes_ids(
+        session, {id_ for id_ in attributes_ids if id_ is not None}
+    ):
+        _purge_attributes_ids(instance, session, unused_attribute_ids_set)
 
 
 def _purge_filtered_events(
@@ -285,26 +509,37 @@ def _purge_filtered_events(
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
     states: list[States] = (
-        session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
+        session.query(States.state_id, States.attributes_id)
+        .filter(States.event_id.in_(event_ids))
+        .all()
     )
     state_ids: set[int] = {state.state_id for state in states}
+    attributes_ids: set[int] = {
+        state.attributes_id for state in states if state.attributes_id
+    }
     _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)
+    if unused_attribute_ids_set := _select_unused_attributes_ids(
+        session, attributes_ids
+    ):
+        _purge_attributes_ids(instance, session, unused_attribute_ids_set)
 
 
 @retryable_database_job("purge")
 def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool]) -> bool:
     """Purge states and events of specified entities."""
     with session_scope(session=instance.get_session()) as session:  # type: ignore
-        selected_entity_ids: list[str] = [
-            entity_id
-            for (entity_id,) in session.query(distinct(States.entity_id)).all()
+        selected_states_meta: dict[int, str] = {
+            metadata_id: entity_id
+            for (metadata_id, entity_id) in session.query(
+                StatesMeta.metadata_id, StatesMeta.entity_id
+            ).all()
             if entity_filter(entity_id)
-        ]
-        _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
-        if len(selected_entity_ids) > 0:
+        }
+        _LOGGER.debug("Purging entity data for %s", list(selected_states_meta.values()))
+        if len(selected_states_meta) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(instance, session, selected_entity_ids)
+            _purge_filtered_states(instance, session, list(selected_states_meta))
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
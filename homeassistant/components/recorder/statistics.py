@@ -14,7 +14,7 @@ import re
 from statistics import mean
 from typing import TYPE_CHECKING, Any, Literal
 
-from sqlalchemy import bindparam, func
+from sqlalchemy import bindparam, func, insert, literal, select
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.ext import baked
 from sqlalchemy.orm.scoping import scoped_session
@@ -140,7 +140,7 @@ UNIT_CONVERSIONS = {
     if x is not None
     else None,
     VOLUME_CUBIC_METERS: lambda x, units: volume_util.convert(
-        x, VOLUME_CUBIC_METERS, _configured_unit(VOLUME_CUBIC_METERS, units)
+        x, VOLUME_CUBIC_METERS, configured_unit(VOLUME_CUBIC_METERS, units)
     )
     if x is not None
     else None,
@@ -418,6 +418,10 @@ def compile_hourly_statistics(
     start_time = start.replace(minute=0)
     end_time = start_time + timedelta(hours=1)
 
+    if instance._db_supports_row_number:  # pylint: disable=[protected-access]
+        _insert_hourly_statistics_rollup(session, start_time, end_time)
+        return
+
     # Compute last hour's average, min, max
     summary: dict[str, StatisticData] = {}
     baked_query = instance.hass.data[STATISTICS_SHORT_TERM_BAKERY](
@@ -446,87 +450,112 @@ def compile_hourly_statistics(
             }
 
     # Get last hour's last sum
-    if instance._db_supports_row_number:  # pylint: disable=[protected-access]
-        subquery = (
-            session.query(*QUERY_STATISTICS_SUMMARY_SUM)
-            .filter(StatisticsShortTerm.start >= bindparam("start_time"))
-            .filter(StatisticsShortTerm.start < bindparam("end_time"))
-            .subquery()
-        )
-        query = (
-            session.query(subquery)
-            .filter(subquery.c.rownum == 1)
-            .order_by(subquery.c.metadata_id)
-        )
-        stats = execute(query.params(start_time=start_time, end_time=end_time))
-
-        if stats:
-            for stat in stats:
-                metadata_id, start, last_reset, state, _sum, _ = stat
-                if metadata_id in summary:
-                    summary[metadata_id].update(
-                        {
-                            "last_reset": process_timestamp(last_reset),
-                            "state": state,
-                            "sum": _sum,
-                        }
-                    )
-                else:
-                    summary[metadata_id] = {
-                        "start": start_time,
-                        "last_reset": process_timestamp(last_reset),
-                        "state": state,
-                        "sum": _sum,
-                    }
-    else:
-        baked_query = instance.hass.data[STATISTICS_SHORT_TERM_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS_SUMMARY_SUM_LEGACY)
-        )
+    baked_query = instance.hass.data[STATISTICS_SHORT_TERM_BAKERY](
+        lambda session: session.query(*QUERY_STATISTICS_SUMMARY_SUM_LEGACY)
+    )
 
-        baked_query += lambda q: q.filter(
-            StatisticsShortTerm.start >= bindparam("start_time")
-        )
-        baked_query += lambda q: q.filter(
-            StatisticsShortTerm.start < bindparam("end_time")
-        )
-        baked_query += lambda q: q.order_by(
-            StatisticsShortTerm.metadata_id, StatisticsShortTerm.start.desc()
-        )
+    baked_query += lambda q: q.filter(
+        StatisticsShortTerm.start >= bindparam("start_time")
+    )
+    baked_query += lambda q: q.filter(StatisticsShortTerm.start < bindparam("end_time"))
+    baked_query += lambda q: q.order_by(
+        StatisticsShortTerm.metadata_id, StatisticsShortTerm.start.desc()
+    )
 
-        stats = execute(
-            baked_query(session).params(start_time=start_time, end_time=end_time)
-        )
+    stats = execute(
+        baked_query(session).params(start_time=start_time, end_time=end_time)
+    )
 
-        if stats:
-            for metadata_id, group in groupby(stats, lambda stat: stat["metadata_id"]):  # type: ignore
-                (
-                    metadata_id,
-                    last_reset,
-                    state,
-                    _sum,
-                ) = next(group)
-                if metadata_id in summary:
-                    summary[metadata_id].update(
-                        {
-                            "start": start_time,
-                            "last_reset": process_timestamp(last_reset),
-                            "state": state,
-                            "sum": _sum,
-                        }
-                    )
-                else:
-                    summary[metadata_id] = {
+    if stats:
+        for metadata_id, group in groupby(stats, lambda stat: stat["metadata_id"]):  # type: ignore
+            (
+                metadata_id,
+                last_reset,
+                state,
+                _sum,
+            ) = next(group)
+            if metadata_id in summary:
+                summary[metadata_id].update(
+                    {
                         "start": start_time,
                         "last_reset": process_timestamp(last_reset),
                         "state": state,
                         "sum": _sum,
                     }
+                )
+            else:
+                summary[metadata_id] = {
+                    "start": start_time,
+                    "last_reset": process_timestamp(last_reset),
+                    "state": state,
+                    "sum": _sum,
+                }
 
     # Insert compiled hourly statistics in the database
     for metadata_id, stat in summary.items():
         session.add(Statistics.from_stats(metadata_id, stat))
 
 
+def _insert_hourly_statistics_rollup(
+    session: scoped_session, start_time: datetime, end_time: datetime
+) -> None:
+    """Insert hourly statistics summarizing the 5-minute statistics.
+
+    The summary is computed and inserted by a single INSERT ... SELECT statement,
+    which needs database support for the ROW_NUMBER window function.
+    """
+    period = (StatisticsShortTerm.start >= start_time) & (
+        StatisticsShortTerm.start < end_time
+    )
+    summary_mean = (
+        select(
+            StatisticsShortTerm.metadata_id,
+            func.avg(StatisticsShortTerm.mean).label("mean"),
+            func.min(StatisticsShortTerm.min).label("min"),
+            func.max(StatisticsShortTerm.max).label("max"),
+        )
+        .where(period)
+        .group_by(StatisticsShortTerm.metadata_id)
+        .subquery()
+    )
+    summary_sum = select(*QUERY_STATISTICS_SUMMARY_SUM).where(period).subquery()
+    summary = select(
+        literal(dt_util.utcnow(), Statistics.created.type),
+        summary_mean.c.metadata_id,
+        literal(start_time, Statistics.start.type),
+        summary_mean.c.mean,
+        summary_mean.c.min,
+        summary_mean.c.max,
+        summary_sum.c.last_reset,
+        summary_sum.c.state,
+        summary_sum.c.sum,
+    ).select_from(
+        summary_mean.join(
+            summary_sum,
+            (summary_sum.c.metadata_id == summary_mean.c.metadata_id)
+            & (summary_sum.c.rownum == 1),
+        )
+    )
+    # The 5-minute statistics of the last period may not be flushed yet
+    session.flush()
+    session.execute(
+        insert(Statistics).from_select(
+            [
+                "created",
+                "metadata_id",
+                "start",
+                "mean",
+                "min",
+                "max",
+                "last_reset",
+                "state",
+                "sum",
+            ],
+            summary,
+        )
+    )
+
+
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
     """Compile 5-minute statistics for all integrations with a recorder platform.
@@ -695,7 +724,7 @@ def get_metadata(
         )
 
 
-def _configured_unit(unit: str, units: UnitSystem) -> str:
+def configured_unit(unit: str, units: UnitSystem) -> str:
     """Return the pressure and temperature units configured by the user."""
     if unit == PRESSURE_PA:
         return units.pressure_unit
@@ -748,7 +777,7 @@ def list_statistic_ids(
         for _, meta in metadata.values():
             if (unit := meta["unit_of_measurement"]) is not None:
                 # Display unit according to user settings
-                unit = _configured_unit(unit, units)
+                unit = configured_unit(unit, units)
             meta["unit_of_measurement"] = unit
 
         statistic_ids = {
@@ -769,7 +798,7 @@ def list_statistic_ids(
         for statistic_id, info in platform_statistic_ids.items():
             if (unit := info["unit_of_measurement"]) is not None:
                 # Display unit according to user settings
-                unit = _configured_unit(unit, units)
+                unit = configured_unit(unit, units)
             platform_statistic_ids[statistic_id]["unit_of_measurement"] = unit
 
         for key, value in platform_statistic_ids.items():
@@ -820,6 +849,7 @@ def _reduce_statistics(
     same_period: Callable[[datetime, datetime], bool],
     period_start_end: Callable[[datetime], tuple[datetime, datetime]],
     period: timedelta,
+    start_time_as_datetime: bool,
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to daily or monthly statistics."""
     result: dict[str, list[dict[str, Any]]] = defaultdict(list)
@@ -839,7 +869,7 @@ def _reduce_statistics(
                 result[statistic_id].append(
                     {
                         "statistic_id": statistic_id,
-                        "start": start.isoformat(),
+                        "start": start if start_time_as_datetime else start.isoformat(),
                         "end": end.isoformat(),
                         "mean": mean(mean_values) if mean_values else None,
                         "min": min(min_values) if min_values else None,
@@ -880,11 +910,13 @@ def day_start_end(time: datetime) -> tuple[datetime, datetime]:
 
 
 def _reduce_statistics_per_day(
-    stats: dict[str, list[dict[str, Any]]]
+    stats: dict[str, list[dict[str, Any]]], start_time_as_datetime: bool = False
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to daily statistics."""
 
-    return _reduce_statistics(stats, same_day, day_start_end, timedelta(days=1))
+    return _reduce_statistics(
+        stats, same_day, day_start_end, timedelta(days=1), start_time_as_datetime
+    )
 
 
 def same_month(time1: datetime, time2: datetime) -> bool:
@@ -906,11 +938,13 @@ def month_start_end(time: datetime) -> tuple[datetime, datetime]:
 
 
 def _reduce_statistics_per_month(
-    stats: dict[str, list[dict[str, Any]]],
+    stats: dict[str, list[dict[str, Any]]], start_time_as_datetime: bool = False
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to monthly statistics."""
 
-    return _reduce_statistics(stats, same_month, month_start_end, timedelta(days=31))
+    return _reduce_statistics(
+        stats, same_month, month_start_end, timedelta(days=31), start_time_as_datetime
+    )
 
 
 def statistics_during_period(
@@ -976,9 +1010,9 @@ def statistics_during_period(
         )
 
         if period == "day":
-            return _reduce_statistics_per_day(result)
+            return _reduce_statistics_per_day(result, start_time_as_datetime)
 
-        return _reduce_statistics_per_month(result)
+        return _reduce_statistics_per_month(result, start_time_as_datetime)
 
 
 def _get_last_statistics(
@@ -14,6 +14,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components.recorder import (
     history,
     is_entity_recorded,
+    run_information_from_instance,
     statistics,
     util as recorder_util,
 )
@@ -44,7 +45,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -127,6 +128,98 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Keep track of the recorded sensor states which have not been compiled yet
+STATE_BUFFER = "sensor_statistics_state_buffer"
+
+
+class StateBuffer:
+    """Sensor states recorded during the current recorder run.
+
+    The recorder thread adds the states as it records them, which allows compiling
+    statistics without reading the states back from the database. After each
+    compile only the states still needed by the next period are kept.
+    """
+
+    def __init__(self, run: Any, start: datetime.datetime) -> None:
+        """Initialize the buffer."""
+        self.run = run
+        # States recorded before start may be missing from the buffer
+        self.start = start
+        self.states: dict[str, list[State]] = {}
+
+    def add(self, entity_id: str, old_state: State | None, new_state: State) -> None:
+        """Add a recorded state."""
+        if (entity_states := self.states.get(entity_id)) is None:
+            entity_states = self.states[entity_id] = []
+            # The previous state may have been recorded before the buffer started
+            if old_state is not None and old_state.last_updated >= self.run.start:
+                entity_states.append(old_state)
+        entity_states.append(new_state)
+
+    def covers(self, start: datetime.datetime) -> bool:
+        """Return True if the buffer has all states needed to compile from start."""
+        return start >= self.start
+
+    def entity_history(
+        self,
+        entity_id: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        significant_changes_only: bool,
+    ) -> list[State]:
+        """Return the states during start-end, like the history query.
+
+        The history starts with the last state recorded before start.
+        """
+        entity_history: list[State] = []
+        for state in self.states.get(entity_id, ()):
+            if state.last_updated < start:
+                entity_history[:] = (state,)
+            elif state.last_updated >= end:
+                break
+            elif state.last_updated > start and (
+                not significant_changes_only or state.last_changed == state.last_updated
+            ):
+                entity_history.append(state)
+        return entity_history
+
+    def trim(self, end: datetime.datetime) -> None:
+        """Drop the states which are not needed to compile from end."""
+        for entity_states in self.states.values():
+            idx = 0
+            while (
+                idx + 1 < len(entity_states)
+                and entity_states[idx + 1].last_updated < end
+            ):
+                idx += 1
+            del entity_states[:idx]
+        self.start = max(self.start, end)
+
+
+def record_state_changed(hass: HomeAssistant, event: Event) -> None:
+    """Add a recorded sensor state to the state buffer.
+
+    Note: This is called from the recorder thread.
+    """
+    run = run_information_from_instance(hass)
+    if (buffer := hass.data.get(STATE_BUFFER)) is None or buffer.run is not run:
+        buffer = hass.data[STATE_BUFFER] = StateBuffer(run, event.time_fired)
+
+    entity_id = event.data["entity_id"]
+    if split_entity_id(entity_id)[0] != DOMAIN:
+        return
+    if (new_state := event.data.get("new_state")) is None:
+        return
+    buffer.add(entity_id, event.data.get("old_state"), new_state)
+
+
+def _get_state_buffer(hass: HomeAssistant) -> StateBuffer | None:
+    """Return the state buffer of the current recorder run."""
+    if (buffer := hass.data.get(STATE_BUFFER)) is None:
+        return None
+    if buffer.run is not run_information_from_instance(hass):
+        return None
+    return buffer
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -412,30 +505,51 @@ def _compile_statistics(  # noqa: C901
         hass, session, statistic_ids=[i.entity_id for i in sensor_states]
     )
 
-    # Get history between start and end
+    # Get history between start and end, the states recorded during the current
+    # run are taken from the state buffer
+    history_start = start - datetime.timedelta.resolution
+    history_list: dict[str, Iterable[State]] = {}
+    db_sensor_states = sensor_states
+    state_buffer = _get_state_buffer(hass)
+    if state_buffer is not None and state_buffer.covers(history_start):
+        db_sensor_states = []
+        for _state in sensor_states:
+            entity_id = _state.entity_id
+            if entity_id not in state_buffer.states and _state.last_updated >= end:
+                # The state before the change is not known
+                db_sensor_states.append(_state)
+                continue
+            if entity_history := state_buffer.entity_history(
+                entity_id,
+                history_start,
+                end,
+                "sum" not in wanted_statistics[entity_id],
+            ):
+                history_list[entity_id] = entity_history
+
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id for i in db_sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list = {}
     if entities_full_history:
-        history_list = history.get_significant_states_with_session(  # type: ignore
+        _history_list = history.get_significant_states_with_session(  # type: ignore
             hass,
             session,
-            start - datetime.timedelta.resolution,
+            history_start,
             end,
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
+        history_list = {**history_list, **_history_list}
     entities_significant_history = [
         i.entity_id
-        for i in sensor_states
+        for i in db_sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
         _history_list = history.get_significant_states_with_session(  # type: ignore
             hass,
             session,
-            start - datetime.timedelta.resolution,
+            history_start,
             end,
             entity_ids=entities_significant_history,
         )
@@ -593,6 +707,9 @@ def _compile_statistics(  # noqa: C901
 
         result.append({"meta": meta, "stat": stat})
 
+    if state_buffer is not None:
+        state_buffer.trim(end - datetime.timedelta.resolution)
+
     return result
 
 
@@ -12,7 +12,11 @@ from typing import Any, Literal, cast
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import (
+    StateAttributes,
+    States,
+    states_with_entity_ids,
+)
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA,
@@ -484,8 +488,13 @@ class StatisticsSensor(SensorEntity):
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
         with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._source_entity_id.lower()
+            query = (
+                session.query(States, StateAttributes)
+                .filter(states_with_entity_ids([self._source_entity_id.lower()]))
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
             )
 
             if self._samples_max_age is not None:
@@ -502,7 +511,13 @@ class StatisticsSensor(SensorEntity):
             query = query.order_by(States.last_updated.desc()).limit(
                 self._samples_max_buffer_size
             )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+            states = []
+            for db_state, db_state_attributes in execute(query) or []:
+                if (state := db_state.to_native(validate_entity_id=False)) is None:
+                    continue
+                if db_state_attributes:
+                    state.attributes = db_state_attributes.to_native()
+                states.append(state)
 
         if states:
             for state in reversed(states):
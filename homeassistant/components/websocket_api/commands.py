@@ -11,7 +11,6 @@ import voluptuous as vol
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.const import (
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATONS,
 )
@@ -24,9 +23,11 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entityfilter import generate_filter
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_track_state_change_matching,
     async_track_template_result,
 )
 from homeassistant.helpers.json import ExtendedJSONEncoder
@@ -58,22 +59,54 @@ def async_register_commands(
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_supported_features)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
 
 
+# Filters of state changed subscriptions
+ENTITY_FILTER_SCHEMA = {
+    vol.Optional("entity_ids"): cv.entity_ids,
+    vol.Optional("domains"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional("entity_globs"): vol.All(cv.ensure_list, [cv.string]),
+}
+
+
 def pong_message(iden: int) -> dict[str, Any]:
     """Return a pong message."""
     return {"id": iden, "type": "pong"}
 
 
+def _has_entity_filter(msg: dict[str, Any]) -> bool:
+    """Return if a subscription is filtered by entity."""
+    return any(key in msg for key in ("entity_ids", "domains", "entity_globs"))
+
+
+@callback
+def _async_listen_state_changed(
+    hass: HomeAssistant, msg: dict[str, Any], action: Callable[[Event], None]
+) -> Callable[[], None]:
+    """Listen for state changed events matching the entity filter of msg."""
+    if not _has_entity_filter(msg):
+        return hass.bus.async_listen(EVENT_STATE_CHANGED, action)
+    return async_track_state_change_matching(
+        hass,
+        msg.get("entity_ids", []),
+        msg.get("domains", []),
+        msg.get("entity_globs", []),
+        action,
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_events",
         vol.Optional("event_type", default=MATCH_ALL): str,
+        **ENTITY_FILTER_SCHEMA,
     }
 )
 def handle_subscribe_events(
@@ -89,6 +122,14 @@ def handle_subscribe_events(
     if event_type not in SUBSCRIBE_ALLOWLIST and not connection.user.is_admin:
         raise Unauthorized
 
+    if _has_entity_filter(msg) and event_type != EVENT_STATE_CHANGED:
+        connection.send_error(
+            msg["id"],
+            const.ERR_INVALID_FORMAT,
+            f"Entity filters are only supported for {EVENT_STATE_CHANGED} events",
+        )
+        return
+
     if event_type == EVENT_STATE_CHANGED:
 
         @callback
@@ -106,18 +147,81 @@ def handle_subscribe_events(
         @callback
         def forward_events(event: Event) -> None:
             """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
             connection.send_message(messages.cached_event_message(msg["id"], event))
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
-    )
+    if event_type == EVENT_STATE_CHANGED:
+        connection.subscriptions[msg["id"]] = _async_listen_state_changed(
+            hass, msg, forward_events
+        )
+    else:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            event_type, forward_events
+        )
 
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        **ENTITY_FILTER_SCHEMA,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends a compressed snapshot of the states, then only what changes.
+    """
+    entity_filter = None
+    if _has_entity_filter(msg):
+        entity_filter = generate_filter(
+            msg.get("domains", []),
+            msg.get("entity_ids", []),
+            [],
+            [],
+            msg.get("entity_globs", []),
+        )
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward entity state changed events to websocket."""
+        if not connection.user.permissions.check_entity(
+            event.data["entity_id"], POLICY_READ
+        ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    # We must never await between sending the states and listening for
+    # state changed events or we will introduce a race condition
+    # where some states are missed
+    states = [
+        state
+        for state in hass.states.async_all()
+        if (entity_filter is None or entity_filter(state.entity_id))
+        and connection.user.permissions.check_entity(state.entity_id, POLICY_READ)
+    ]
+    connection.subscriptions[msg["id"]] = _async_listen_state_changed(
+        hass, msg, forward_entity_changes
+    )
+    connection.send_message(messages.result_message(msg["id"]))
+    connection.send_message(
+        messages.message_to_json(
+            messages.event_message(
+                msg["id"],
+                {
+                    messages.ENTITY_EVENT_ADD: {
+                        state.entity_id: state.as_compressed_state() for state in states
+                    }
+                },
+            )
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -243,7 +347,16 @@ def handle_get_states(
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    # Reuse the JSON each state caches for every consumer
+    try:
+        serialized_states = [state.as_dict_json for state in states]
+    except (ValueError, TypeError):
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(
+        messages.construct_result_message(msg["id"], f'[{",".join(serialized_states)}]')
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -310,6 +423,21 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): {str: int},
+    }
+)
+def handle_supported_features(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setting the features the client supports."""
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -17,9 +17,11 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
 from .auth import AuthPhase, auth_required_message
+from .connection import ActiveConnection
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -67,17 +69,42 @@ class WebSocketHandler:
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._connection: ActiveConnection | None = None
 
     async def _writer(self) -> None:
         """Write outgoing messages."""
+        to_write = self._to_write
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                if (message := await self._to_write.get()) is None:
+                if (message := await to_write.get()) is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                if (
+                    to_write.empty()
+                    or self._connection is None
+                    or not self._connection.supported_features.get(
+                        FEATURE_COALESCE_MESSAGES
+                    )
+                ):
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    continue
+
+                # Send everything queued so far in a single frame
+                messages = [message]
+                closing = False
+                while not to_write.empty():
+                    if (message := to_write.get_nowait()) is None:
+                        closing = True
+                        break
+                    messages.append(message)
+
+                coalesced_messages = f'[{",".join(messages)}]'
+                self._logger.debug("Sending %s", coalesced_messages)
+                await self.wsock.send_str(coalesced_messages)
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -197,6 +224,7 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             connection = await auth.async_handle(msg_data)
+            self._connection = connection
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
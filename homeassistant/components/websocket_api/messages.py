@@ -7,8 +7,17 @@ from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -31,12 +40,24 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+# Keys of the entity events of a state diff subscription
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def construct_result_message(iden: int, payload: str) -> str:
+    """Construct a success result message JSON from an already serialized result."""
+    return f'{{"id":{iden},"type":"{const.TYPE_RESULT}","success":true,"result":{payload}}}'
+
+
 def error_message(iden: int | None, code: str, message: str) -> dict[str, Any]:
     """Return an error result message."""
     return {
@@ -71,9 +92,96 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if event.event_type == EVENT_STATE_CHANGED:
+        try:
+            return _state_changed_event_message_json(event)
+        except (ValueError, TypeError):
+            # Let the generic path log the data that could not be serialized
+            pass
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return a state diff event message of a state changed event.
+
+    Serialize to json once per message, like cached_event_message.
+    """
+    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_message(event: Event) -> str:
+    """Cache and serialize the state diff event message to json."""
+    return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Convert a state changed event to the entity event of a state diff.
+
+    Only the fields and attributes that changed are sent for a changed entity.
+    """
+    entity_id = event.data["entity_id"]
+    if (new_state := event.data["new_state"]) is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if (old_state := event.data["old_state"]) is None:
+        return {ENTITY_EVENT_ADD: {entity_id: new_state.as_compressed_state()}}
+    return {ENTITY_EVENT_CHANGE: {entity_id: _state_diff(old_state, new_state)}}
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the fields and attributes of new_state that differ from old_state."""
+    additions: dict[str, Any] = {}
+    diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context.id != new_state.context.id:
+        additions[COMPRESSED_STATE_CONTEXT] = new_state.context.as_compressed()
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if changed_attributes := {
+        key: value
+        for key, value in new_attributes.items()
+        if key not in old_attributes or old_attributes[key] != value
+    }:
+        additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+    if removed_attributes := [
+        key for key in old_attributes if key not in new_attributes
+    ]:
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed_attributes}
+    return diff
+
+
+def _state_json(state: State | None) -> str:
+    """Return the cached JSON of a state object."""
+    if state is None:
+        return "null"
+    if type(state) is not State:  # pylint: disable=unidiomatic-typecheck
+        raise TypeError(f"Cannot use the cached JSON of {type(state)}")
+    return state.as_dict_json
+
+
+def _state_changed_event_message_json(event: Event) -> str:
+    """Serialize a state changed event message reusing the cached state JSON."""
+    data = event.data
+    if data.keys() != {"entity_id", "old_state", "new_state"}:
+        raise TypeError("Unexpected state changed event data")
+    return (
+        f'{{"id":{IDEN_JSON_TEMPLATE},"type":"event","event":'
+        f'{{"event_type":"{EVENT_STATE_CHANGED}","data":'
+        f'{{"entity_id":{json_dumps(data["entity_id"])},'
+        f'"old_state":{_state_json(data["old_state"])},'
+        f'"new_state":{_state_json(data["new_state"])}}},'
+        f'"origin":"{event.origin.value}",'
+        f'"time_fired":"{event.time_fired.isoformat()}",'
+        f'"context":{json_dumps(event.context.as_dict())}}}}}'
+    )
+
+
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
     try:
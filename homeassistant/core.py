@@ -18,6 +18,7 @@ from collections.abc import (
 import datetime
 import enum
 import functools
+import heapq
 import logging
 import os
 import pathlib
@@ -50,6 +51,11 @@ from .const import (
     ATTR_SECONDS,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     CONF_UNIT_SYSTEM_IMPERIAL,
     EVENT_CALL_SERVICE,
     EVENT_CORE_CONFIG_UPDATE,
@@ -77,6 +83,7 @@ from .exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from .helpers.json import json_dumps
 from .util import dt as dt_util, location, uuid as uuid_util
 from .util.async_ import (
     fire_coroutine_threadsafe,
@@ -121,6 +128,9 @@ BLOCK_LOG_TIMEOUT = 60
 # How long we wait for the result of a service call
 SERVICE_CALL_LIMIT = 10  # seconds
 
+# Events that are not delivered to MATCH_ALL listeners
+EVENTS_EXCLUDED_FROM_MATCH_ALL = {EVENT_HOMEASSISTANT_CLOSE, EVENT_TIME_CHANGED}
+
 
 class ConfigSource(StrEnum):
     """Source of core configuration."""
@@ -248,6 +258,7 @@ class HomeAssistant:
         self._pending_tasks: list[asyncio.Future[Any]] = []
         self._track_task = True
         self.bus = EventBus(self)
+        self.timer = Timer(self)
         self.services = ServiceRegistry(self)
         self.states = StateMachine(self.bus, self.loop)
         self.config = Config(self)
@@ -705,6 +716,12 @@ class Context:
         """Return a dictionary representation of the context."""
         return {"id": self.id, "parent_id": self.parent_id, "user_id": self.user_id}
 
+    def as_compressed(self) -> str | dict[str, str | None]:
+        """Return the context id, or its dictionary if it has more than an id."""
+        if self.parent_id is None and self.user_id is None:
+            return self.id
+        return self.as_dict()
+
 
 class EventOrigin(enum.Enum):
     """Represent the origin of an event."""
@@ -797,6 +814,16 @@ class EventBus:
         """
         return {key: len(listeners) for key, listeners in self._listeners.items()}
 
+    @callback
+    def async_has_listeners(self, event_type: str) -> bool:
+        """Return True if event_type has listeners of its own.
+
+        Listeners for all events are not taken into account.
+
+        This method must be run in the event loop.
+        """
+        return event_type in self._listeners
+
     @property
     def listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners."""
@@ -834,9 +861,13 @@ class EventBus:
 
         listeners = self._listeners.get(event_type, [])
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
+        # EVENT_HOMEASSISTANT_CLOSE and EVENT_TIME_CHANGED should go only to
+        # listeners that explicitly subscribed to them
         match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
+        if (
+            match_all_listeners is not None
+            and event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL
+        ):
             listeners = match_all_listeners + listeners
 
         event = Event(event_type, event_data, origin, time_fired, context)
@@ -994,6 +1025,67 @@ class EventBus:
             )
 
 
+class Timer:
+    """Dispatch the core timer ticks to the listeners that are due."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new timer."""
+        self._hass = hass
+        self._ticks = 0
+        self._counter = 0
+        # Entries are [due tick, insertion order, interval in ticks, job]
+        self._schedule: list[list[Any]] = []
+
+    @property
+    def listener_count(self) -> int:
+        """Return the number of active listeners."""
+        return sum(1 for entry in self._schedule if entry[3] is not None)
+
+    @callback
+    def async_listen(
+        self,
+        listener: Callable[[datetime.datetime], Any],
+        seconds: int = 1,
+    ) -> CALLBACK_TYPE:
+        """Listen for every nth tick of the core timer.
+
+        The listener is called with the time of the tick.
+
+        This method must be run in the event loop.
+        """
+        if seconds < 1:
+            raise ValueError("Timer interval must be at least one second")
+
+        self._counter += 1
+        entry = [self._ticks + seconds, self._counter, seconds, HassJob(listener)]
+        heapq.heappush(self._schedule, entry)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener, it is dropped from the heap when due."""
+            entry[3] = None
+
+        return remove_listener
+
+    @callback
+    def async_tick(self, now: datetime.datetime) -> None:
+        """Advance the timer a tick and run the listeners that are due.
+
+        This method must be run in the event loop.
+        """
+        self._ticks += 1
+        schedule = self._schedule
+
+        while schedule and schedule[0][0] <= self._ticks:
+            entry = schedule[0]
+            if (job := entry[3]) is None:
+                heapq.heappop(schedule)
+                continue
+            entry[0] += entry[2]
+            heapq.heapreplace(schedule, entry)
+            self._hass.async_add_hass_job(job, now)
+
+
 _StateT = TypeVar("_StateT", bound="State")
 
 
@@ -1020,6 +1112,9 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_attributes_json",
+        "_as_compressed_state",
     ]
 
     def __init__(
@@ -1055,6 +1150,9 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._attributes_json: str | None = None
+        self._as_compressed_state: dict[str, Any] | None = None
 
     @property
     def name(self) -> str:
@@ -1087,6 +1185,56 @@ class State:
             }
         return self._as_dict
 
+    @property
+    def attributes_json(self) -> str:
+        """Return the attributes as a compact JSON string.
+
+        The result is cached so all consumers share a single encoding.
+        Raises TypeError or ValueError if the attributes are not serializable.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = json_dumps(dict(self.attributes))
+        return self._attributes_json
+
+    @property
+    def as_dict_json(self) -> str:
+        """Return the dict representation of the State as a JSON string.
+
+        Reuses the cached attributes_json.
+        Raises TypeError or ValueError if the attributes are not serializable.
+        """
+        if self._as_dict_json is None:
+            as_dict = self.as_dict()
+            self._as_dict_json = (
+                f'{{"entity_id":{json_dumps(self.entity_id)},'
+                f'"state":{json_dumps(self.state)},'
+                f'"attributes":{self.attributes_json},'
+                f'"last_changed":"{as_dict["last_changed"]}",'
+                f'"last_updated":"{as_dict["last_updated"]}",'
+                f'"context":{json_dumps(as_dict["context"])}}}'
+            )
+        return self._as_dict_json
+
+    def as_compressed_state(self) -> dict[str, Any]:
+        """Return a compact dict representation of the State.
+
+        Timestamps are sent as UNIX timestamps, last updated only if it differs
+        from last changed, and the context as its id if it has nothing else.
+        """
+        if self._as_compressed_state is None:
+            compressed_state: dict[str, Any] = {
+                COMPRESSED_STATE_STATE: self.state,
+                COMPRESSED_STATE_ATTRIBUTES: dict(self.attributes),
+                COMPRESSED_STATE_CONTEXT: self.context.as_compressed(),
+                COMPRESSED_STATE_LAST_CHANGED: self.last_changed.timestamp(),
+            }
+            if self.last_changed != self.last_updated:
+                compressed_state[
+                    COMPRESSED_STATE_LAST_UPDATED
+                ] = self.last_updated.timestamp()
+            self._as_compressed_state = compressed_state
+        return self._as_compressed_state
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
@@ -1140,6 +1288,16 @@ class State:
         )
 
 
+class StateUpdate(NamedTuple):
+    """A state to set with StateMachine.async_set_many."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    context: Context | None = None
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
@@ -1334,6 +1492,45 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
+        self._async_set(entity_id, new_state, attributes, force_update, context, None)
+
+    @callback
+    def async_set_many(
+        self,
+        updates: Iterable[StateUpdate],
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities in one pass.
+
+        All states share the same last_updated time. Updates without a context
+        share the passed context, or a single new context if none is passed.
+
+        This method must be run in the event loop.
+        """
+        now = dt_util.utcnow()
+        if context is None:
+            context = Context()
+        for entity_id, new_state, attributes, force_update, update_context in updates:
+            self._async_set(
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                update_context or context,
+                now,
+            )
+
+    @callback
+    def _async_set(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        now: datetime.datetime | None,
+    ) -> None:
+        """Set the state of an entity and fire the state changed event."""
         entity_id = entity_id.lower()
         new_state = str(new_state)
         attributes = attributes or {}
@@ -1352,7 +1549,8 @@ class StateMachine:
         if context is None:
             context = Context()
 
-        now = dt_util.utcnow()
+        if now is None:
+            now = dt_util.utcnow()
 
         state = State(
             entity_id,
@@ -1927,9 +2125,15 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(
-            EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
-        )
+        hass.timer.async_tick(now)
+        # Only legacy listeners which subscribe to the time changed event get it
+        if hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            hass.bus.async_fire(
+                EVENT_TIME_CHANGED,
+                {ATTR_NOW: now},
+                time_fired=now,
+                context=timer_context,
+            )
 
         # If we are more than a second late, a tick was missed
         if (late := monotonic() - target) > 1:
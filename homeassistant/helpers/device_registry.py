@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from collections.abc import Iterable
 import logging
 import time
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
@@ -213,6 +214,8 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    _devices_by_area: dict[str, dict[str, DeviceEntry]]
+    _devices_by_config_entry: dict[str, dict[str, DeviceEntry]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
@@ -223,6 +226,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self._clear_index()
 
@@ -266,6 +270,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self._add_device_to_lookups(device)
 
         _add_device_to_index(devices_index, device)
 
@@ -277,6 +282,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self._remove_device_from_lookups(device)
 
         _remove_device_from_index(devices_index, device)
 
@@ -288,16 +294,54 @@ class DeviceRegistry:
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
 
+        # Unchanged keys keep the position of the device in the lookups
+        _remove_from_lookup(
+            self._devices_by_area,
+            _area_keys(old_device) - _area_keys(new_device),
+            old_device.id,
+        )
+        _remove_from_lookup(
+            self._devices_by_config_entry,
+            old_device.config_entries - new_device.config_entries,
+            old_device.id,
+        )
+        self._add_device_to_lookups(new_device)
+
+    def _add_device_to_lookups(self, device: DeviceEntry) -> None:
+        """Add a device to the lookups by area and config entry."""
+        _add_to_lookup(self._devices_by_area, _area_keys(device), device)
+        _add_to_lookup(self._devices_by_config_entry, device.config_entries, device)
+
+    def _remove_device_from_lookups(self, device: DeviceEntry) -> None:
+        """Remove a device from the lookups by area and config entry."""
+        _remove_from_lookup(self._devices_by_area, _area_keys(device), device.id)
+        _remove_from_lookup(
+            self._devices_by_config_entry, device.config_entries, device.id
+        )
+
+    def get_entries_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        return list(self._devices_by_area.get(area_id, {}).values())
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        return list(self._devices_by_config_entry.get(config_entry_id, {}).values())
+
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._devices_by_area = {}
+        self._devices_by_config_entry = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            self._add_device_to_lookups(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -501,7 +545,7 @@ class DeviceRegistry:
 
         new = attr.evolve(old, **changes)
         self._update_device(old, new)
-        self.async_schedule_save()
+        self.async_schedule_save(new.id)
 
         self.hass.bus.async_fire(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -533,7 +577,7 @@ class DeviceRegistry:
         self.hass.bus.async_fire(
             EVENT_DEVICE_REGISTRY_UPDATED, {"action": "remove", "device_id": device_id}
         )
-        self.async_schedule_save()
+        self.async_schedule_save(device_id)
 
     async def async_load(self) -> None:
         """Load the device registry."""
@@ -585,48 +629,44 @@ class DeviceRegistry:
         self._rebuild_index()
 
     @callback
-    def async_schedule_save(self) -> None:
-        """Schedule saving the device registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+    def async_schedule_save(self, device_id: str | None = None) -> None:
+        """Schedule saving the device registry.
+
+        If only the device with device_id changed, only that device is saved.
+        """
+        if device_id is None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            return
+
+        self._store.async_delay_save_records(
+            self._data_to_save,
+            self._record_to_save,
+            (("devices", device_id), ("deleted_devices", device_id)),
+            SAVE_DELAY,
+        )
 
     @callback
     def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
         """Return data of device registry to store in a file."""
         data = {}
 
-        data["devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "hw_version": entry.hw_version,
-                "entry_type": entry.entry_type,
-                "id": entry.id,
-                "via_device_id": entry.via_device_id,
-                "area_id": entry.area_id,
-                "name_by_user": entry.name_by_user,
-                "disabled_by": entry.disabled_by,
-                "configuration_url": entry.configuration_url,
-            }
-            for entry in self.devices.values()
-        ]
+        data["devices"] = [_device_to_save(entry) for entry in self.devices.values()]
         data["deleted_devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "id": entry.id,
-                "orphaned_timestamp": entry.orphaned_timestamp,
-            }
-            for entry in self.deleted_devices.values()
+            _deleted_device_to_save(entry) for entry in self.deleted_devices.values()
         ]
 
         return data
 
+    @callback
+    def _record_to_save(self, collection: str, device_id: str) -> dict[str, Any] | None:
+        """Return data of a device to store in a file, None if it is gone."""
+        if collection == "devices":
+            if device := self.devices.get(device_id):
+                return _device_to_save(device)
+        elif deleted_device := self.deleted_devices.get(device_id):
+            return _deleted_device_to_save(deleted_device)
+        return None
+
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
@@ -677,6 +717,38 @@ class DeviceRegistry:
                 self.async_update_device(dev_id, area_id=None)
 
 
+def _device_to_save(entry: DeviceEntry) -> dict[str, Any]:
+    """Return data of a device to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "manufacturer": entry.manufacturer,
+        "model": entry.model,
+        "name": entry.name,
+        "sw_version": entry.sw_version,
+        "hw_version": entry.hw_version,
+        "entry_type": entry.entry_type,
+        "id": entry.id,
+        "via_device_id": entry.via_device_id,
+        "area_id": entry.area_id,
+        "name_by_user": entry.name_by_user,
+        "disabled_by": entry.disabled_by,
+        "configuration_url": entry.configuration_url,
+    }
+
+
+def _deleted_device_to_save(entry: DeletedDeviceEntry) -> dict[str, Any]:
+    """Return data of a deleted device to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "id": entry.id,
+        "orphaned_timestamp": entry.orphaned_timestamp,
+    }
+
+
 @callback
 def async_get(hass: HomeAssistant) -> DeviceRegistry:
     """Get device registry."""
@@ -702,7 +774,7 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -710,11 +782,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -875,3 +943,32 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+
+
+def _area_keys(device: DeviceEntry) -> set[str]:
+    """Return the keys of a device in the lookup by area."""
+    return {device.area_id} if device.area_id is not None else set()
+
+
+def _add_to_lookup(
+    lookup: dict[str, dict[str, DeviceEntry]],
+    keys: Iterable[str],
+    device: DeviceEntry,
+) -> None:
+    """Add a device to a lookup under keys."""
+    for key in keys:
+        lookup.setdefault(key, {})[device.id] = device
+
+
+def _remove_from_lookup(
+    lookup: dict[str, dict[str, DeviceEntry]],
+    keys: Iterable[str],
+    device_id: str,
+) -> None:
+    """Remove a device from a lookup under keys."""
+    for key in keys:
+        if (devices := lookup.get(key)) is None:
+            continue
+        devices.pop(device_id, None)
+        if not devices:
+            del lookup[key]
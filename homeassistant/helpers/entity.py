@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections.abc import Awaitable, Iterable, Mapping, MutableMapping
+from collections.abc import Awaitable, Generator, Iterable, Mapping, MutableMapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
@@ -35,7 +36,14 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    StateUpdate,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
@@ -50,6 +58,7 @@ from .typing import StateType
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_PENDING_STATE_WRITES = "entity_pending_state_writes"
 SOURCE_CONFIG_ENTRY = "config_entry"
 SOURCE_PLATFORM_CONFIG = "platform_config"
 
@@ -68,6 +77,28 @@ def entity_sources(hass: HomeAssistant) -> dict[str, dict[str, str]]:
     return hass.data.get(DATA_ENTITY_SOURCE, {})
 
 
+@contextmanager
+def async_batch_state_writes(hass: HomeAssistant) -> Generator[None, None, None]:
+    """Collect the entity state writes and set them in one pass on exit.
+
+    The state machine is not updated until the block exits, so code inside
+    the block will not see the states written by the entities. The block
+    must not await.
+    """
+    if DATA_PENDING_STATE_WRITES in hass.data:
+        yield
+        return
+
+    pending: list[StateUpdate] = []
+    hass.data[DATA_PENDING_STATE_WRITES] = pending
+    try:
+        yield
+    finally:
+        del hass.data[DATA_PENDING_STATE_WRITES]
+        if pending:
+            hass.states.async_set_many(pending)
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -651,9 +682,13 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
-        self.hass.states.async_set(
+        update = StateUpdate(
             self.entity_id, state, attr, self.force_update, self._context
         )
+        if (pending := self.hass.data.get(DATA_PENDING_STATE_WRITES)) is not None:
+            pending.append(update)
+            return
+        self.hass.states.async_set(*update)
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -103,6 +103,9 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Entities added by each platform config, None once entities were
+        # added that can not be attributed to a platform config
+        self._config_entities: list[tuple[ConfigType, list[Entity]]] | None = []
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -168,6 +171,32 @@ class EntityPlatform:
             )
             return
 
+        config_entities: list[Entity] = []
+        if discovery_info is not None or self._config_entities is None:
+            self._config_entities = None
+        else:
+            self._config_entities.append((platform_config, config_entities))
+
+        @callback
+        def async_add_config_entities(
+            new_entities: Iterable[Entity], update_before_add: bool = False
+        ) -> None:
+            """Schedule adding entities, recording the config that added them."""
+            new_entities = list(new_entities)
+            config_entities.extend(new_entities)
+            self._async_schedule_add_entities(new_entities, update_before_add)
+
+        def add_config_entities(
+            new_entities: Iterable[Entity], update_before_add: bool = False
+        ) -> None:
+            """Schedule adding entities synchronously."""
+            run_callback_threadsafe(
+                hass.loop,
+                async_add_config_entities,
+                list(new_entities),
+                update_before_add,
+            ).result()
+
         @callback
         def async_create_setup_task() -> Coroutine:
             """Get task to set up platform."""
@@ -175,7 +204,7 @@ class EntityPlatform:
                 return platform.async_setup_platform(  # type: ignore
                     hass,
                     platform_config,
-                    self._async_schedule_add_entities,
+                    async_add_config_entities,
                     discovery_info,
                 )
 
@@ -186,11 +215,77 @@ class EntityPlatform:
                 platform.setup_platform,  # type: ignore
                 hass,
                 platform_config,
-                self._schedule_add_entities,
+                add_config_entities,
                 discovery_info,
             )
 
-        await self._async_setup_platform(async_create_setup_task)
+        if (
+            not await self._async_setup_platform(async_create_setup_task)
+            and self._config_entities is not None
+        ):
+            # Set up the config again on the next reconfig
+            self._config_entities = [
+                item for item in self._config_entities if item[1] is not config_entities
+            ]
+
+    async def async_reconfig(self, platform_configs: list[ConfigType]) -> None:
+        """Set up the platform again from a new list of platform configs.
+
+        Entities added by platform configs that did not change are kept.
+        The ones of changed or removed configs are removed and new configs are
+        set up. When entities can not be attributed to the platform config that
+        added them, such as for discovered platforms, the platform is reset and
+        every config is set up again.
+        """
+        if (config_entities := self._async_live_config_entities()) is None:
+            await self.async_reset()
+            await asyncio.gather(
+                *(self.async_setup(p_config) for p_config in platform_configs)
+            )
+            return
+
+        new_configs = list(platform_configs)
+        kept: list[tuple[ConfigType, list[Entity]]] = []
+        removed: list[Entity] = []
+        for p_config, entities in config_entities:
+            if p_config in new_configs:
+                new_configs.remove(p_config)
+                kept.append((p_config, entities))
+            else:
+                removed.extend(entities)
+
+        self._config_entities = kept
+        await asyncio.gather(
+            *(self.async_remove_entity(entity.entity_id) for entity in removed)  # type: ignore[arg-type]
+        )
+        await asyncio.gather(*(self.async_setup(p_config) for p_config in new_configs))
+
+    @callback
+    def _async_live_config_entities(
+        self,
+    ) -> list[tuple[ConfigType, list[Entity]]] | None:
+        """Return the entities still added by each platform config.
+
+        Returns None if not all entities can be attributed to a config.
+        """
+        if self._config_entities is None or self._async_cancel_retry_setup:
+            return None
+
+        config_entities = [
+            (
+                p_config,
+                [
+                    entity
+                    for entity in entities
+                    if entity.entity_id is not None
+                    and self.entities.get(entity.entity_id) is entity
+                ],
+            )
+            for p_config, entities in self._config_entities
+        ]
+        if sum(len(entities) for _, entities in config_entities) != len(self.entities):
+            return None
+        return config_entities
 
     async def async_shutdown(self) -> None:
         """Call when Home Assistant is stopping."""
@@ -629,6 +724,7 @@ class EntityPlatform:
 
         self.async_unsub_polling()
         self._setup_complete = False
+        self._config_entities = []
 
     @callback
     def async_unsub_polling(self) -> None:
@@ -74,6 +74,9 @@ ENTITY_DESCRIBING_ATTRIBUTES = {
     "unit_of_measurement",
 }
 
+# Attributes the registry maintains a lookup of entries by
+_INDEXED_ATTRIBUTES = ("area_id", "config_entry_id", "device_id", "platform")
+
 
 class RegistryEntryDisabler(StrEnum):
     """What disabled a registry entry."""
@@ -185,9 +188,10 @@ class EntityRegistryStore(storage.Store):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entry
+    - area_id, config_entry_id, device_id and platform -> entries
     """
 
     def __init__(self) -> None:
@@ -195,24 +199,59 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._attribute_indexes: dict[str, dict[str, dict[str, RegistryEntry]]] = {
+            attribute: {} for attribute in _INDEXED_ATTRIBUTES
+        }
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry = self.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         super().__setitem__(key, entry)
         self._entry_ids.__setitem__(entry.id, entry)
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
 
+        for attribute, index in self._attribute_indexes.items():
+            value = getattr(entry, attribute)
+            if old_entry is not None:
+                old_value = getattr(old_entry, attribute)
+                if old_value != value:
+                    _remove_from_index(index, old_value, key)
+            if value is not None:
+                # Replacing an entry keeps its position in the index
+                index.setdefault(value, {})[key] = entry
+
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         self._entry_ids.__delitem__(entry.id)
         self._index.__delitem__((entry.domain, entry.platform, entry.unique_id))
+        for attribute, index in self._attribute_indexes.items():
+            _remove_from_index(index, getattr(entry, attribute), key)
         super().__delitem__(key)
 
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        return list(self._attribute_indexes["area_id"].get(area_id, {}).values())
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        return list(
+            self._attribute_indexes["config_entry_id"].get(config_entry_id, {}).values()
+        )
+
+    def get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries for device."""
+        return list(self._attribute_indexes["device_id"].get(device_id, {}).values())
+
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        return list(self._attribute_indexes["platform"].get(platform, {}).values())
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
@@ -236,6 +275,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -410,7 +450,7 @@ class EntityRegistry:
         )
         self.entities[entity_id] = entry
         _LOGGER.info("Registered new %s.%s entity: %s", domain, platform, entity_id)
-        self.async_schedule_save()
+        self.async_schedule_save(entry.id)
 
         self.hass.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "create", "entity_id": entity_id}
@@ -421,11 +461,11 @@ class EntityRegistry:
     @callback
     def async_remove(self, entity_id: str) -> None:
         """Remove an entity from registry."""
-        self.entities.pop(entity_id)
+        entry = self.entities.pop(entity_id)
         self.hass.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "remove", "entity_id": entity_id}
         )
-        self.async_schedule_save()
+        self.async_schedule_save(entry.id)
 
     @callback
     def async_device_modified(self, event: Event) -> None:
@@ -564,7 +604,7 @@ class EntityRegistry:
 
         new = self.entities[entity_id] = attr.evolve(old, **new_values)
 
-        self.async_schedule_save()
+        self.async_schedule_save(new.id)
 
         data: dict[str, str | dict[str, Any]] = {
             "action": "update",
@@ -586,9 +626,9 @@ class EntityRegistry:
         """Update entity options."""
         old = self.entities[entity_id]
         new_options: Mapping[str, Mapping[str, Any]] = {**old.options, domain: options}
-        self.entities[entity_id] = attr.evolve(old, options=new_options)
+        new = self.entities[entity_id] = attr.evolve(old, options=new_options)
 
-        self.async_schedule_save()
+        self.async_schedule_save(new.id)
 
         data: dict[str, str | dict[str, Any]] = {
             "action": "update",
@@ -648,42 +688,38 @@ class EntityRegistry:
         self.entities = entities
 
     @callback
-    def async_schedule_save(self) -> None:
-        """Schedule saving the entity registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+    def async_schedule_save(self, entry_id: str | None = None) -> None:
+        """Schedule saving the entity registry.
+
+        If only the entry with entry_id changed, only that entry is saved.
+        """
+        if entry_id is None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            return
+
+        self._store.async_delay_save_records(
+            self._data_to_save,
+            self._record_to_save,
+            (("entities", entry_id),),
+            SAVE_DELAY,
+        )
 
     @callback
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         data: dict[str, Any] = {}
 
-        data["entities"] = [
-            {
-                "area_id": entry.area_id,
-                "capabilities": entry.capabilities,
-                "config_entry_id": entry.config_entry_id,
-                "device_class": entry.device_class,
-                "device_id": entry.device_id,
-                "disabled_by": entry.disabled_by,
-                "entity_category": entry.entity_category,
-                "entity_id": entry.entity_id,
-                "icon": entry.icon,
-                "id": entry.id,
-                "name": entry.name,
-                "options": entry.options,
-                "original_device_class": entry.original_device_class,
-                "original_icon": entry.original_icon,
-                "original_name": entry.original_name,
-                "platform": entry.platform,
-                "supported_features": entry.supported_features,
-                "unique_id": entry.unique_id,
-                "unit_of_measurement": entry.unit_of_measurement,
-            }
-            for entry in self.entities.values()
-        ]
+        data["entities"] = [_entry_to_save(entry) for entry in self.entities.values()]
 
         return data
 
+    @callback
+    def _record_to_save(self, collection: str, entry_id: str) -> dict[str, Any] | None:
+        """Return data of an entry to store in a file, None if it was removed."""
+        if entry := self.entities.get_entry(entry_id):
+            return _entry_to_save(entry)
+        return None
+
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
@@ -702,6 +738,42 @@ class EntityRegistry:
                 self.async_update_entity(entity_id, area_id=None)
 
 
+def _remove_from_index(
+    index: dict[str, dict[str, RegistryEntry]], value: str | None, entity_id: str
+) -> None:
+    """Remove an entity from the entries indexed under value."""
+    if value is None or (entries := index.get(value)) is None:
+        return
+    entries.pop(entity_id, None)
+    if not entries:
+        del index[value]
+
+
+def _entry_to_save(entry: RegistryEntry) -> dict[str, Any]:
+    """Return data of an entry to store in a file."""
+    return {
+        "area_id": entry.area_id,
+        "capabilities": entry.capabilities,
+        "config_entry_id": entry.config_entry_id,
+        "device_class": entry.device_class,
+        "device_id": entry.device_id,
+        "disabled_by": entry.disabled_by,
+        "entity_category": entry.entity_category,
+        "entity_id": entry.entity_id,
+        "icon": entry.icon,
+        "id": entry.id,
+        "name": entry.name,
+        "options": entry.options,
+        "original_device_class": entry.original_device_class,
+        "original_icon": entry.original_icon,
+        "original_name": entry.original_name,
+        "platform": entry.platform,
+        "supported_features": entry.supported_features,
+        "unique_id": entry.unique_id,
+        "unit_of_measurement": entry.unit_of_measurement,
+    }
+
+
 @callback
 def async_get(hass: HomeAssistant) -> EntityRegistry:
     """Get entity registry."""
@@ -731,9 +803,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.entities.get_entries_for_device_id(device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -742,7 +813,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -750,11 +821,15 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
+
+
+@callback
+def async_entries_for_platform(
+    registry: EntityRegistry, platform: str
+) -> list[RegistryEntry]:
+    """Return entries that match a platform."""
+    return registry.entities.get_entries_for_platform(platform)
 
 
 @callback
@@ -16,10 +16,8 @@ from typing_extensions import Concatenate, ParamSpec
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
-    ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -39,6 +37,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from .entityfilter import generate_filter
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
@@ -516,6 +515,83 @@ def async_track_state_removed_domain(
     return remove_listener
 
 
+@callback
+@bind_hass
+def async_track_state_change_matching(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str],
+    domains: Iterable[str],
+    entity_globs: Iterable[str],
+    action: Callable[[Event], Any],
+) -> CALLBACK_TYPE:
+    """Track state change events of entities by entity_id, domain or glob.
+
+    Changes are routed through the entity_id index of
+    async_track_state_change_event, so only events of matching entities reach
+    the action. Entities added later that match a domain or glob are picked
+    up through the domain index of async_track_state_added_domain.
+    """
+    entity_ids = set(_async_string_to_lower_list(entity_ids))
+    domains = set(_async_string_to_lower_list(domains))
+    entity_globs = set(_async_string_to_lower_list(entity_globs))
+    listeners = [async_track_state_change_event(hass, entity_ids, action)]
+
+    @callback
+    def remove_listeners() -> None:
+        """Remove the state change listeners."""
+        for remove in listeners:
+            remove()
+
+    if not domains and not entity_globs:
+        return remove_listeners
+
+    matches_pattern = generate_filter(list(domains), [], [], [], list(entity_globs))
+    pattern_job = HassJob(action)
+
+    @callback
+    def _pattern_state_changed(event: Event) -> None:
+        """Forward changes of entities matched by domain or glob."""
+        # Added states are forwarded by _pattern_state_added
+        if event.data["old_state"] is not None:
+            hass.async_run_hass_job(pattern_job, event)
+
+    # Only globs need every entity id to be matched
+    pattern_entity_ids = {
+        entity_id
+        for entity_id in hass.states.async_entity_ids(None if entity_globs else domains)
+        if entity_id not in entity_ids and matches_pattern(entity_id)
+    }
+    listeners.append(
+        async_track_state_change_event(hass, pattern_entity_ids, _pattern_state_changed)
+    )
+
+    @callback
+    def _pattern_state_added(event: Event) -> None:
+        """Track and forward added entities matched by domain or glob."""
+        entity_id = event.data["entity_id"]
+        if entity_id in entity_ids or not matches_pattern(entity_id):
+            return
+        if entity_id not in pattern_entity_ids:
+            pattern_entity_ids.add(entity_id)
+            listeners.append(
+                async_track_state_change_event(hass, entity_id, _pattern_state_changed)
+            )
+        hass.async_run_hass_job(pattern_job, event)
+
+    added_domains = set(domains)
+    for glob in entity_globs:
+        glob_domain = glob.partition(".")[0]
+        if any(char in glob_domain for char in "*?["):
+            added_domains = {MATCH_ALL}
+            break
+        added_domains.add(glob_domain)
+    listeners.append(
+        async_track_state_added_domain(hass, added_domains, _pattern_state_added)
+    )
+
+    return remove_listeners
+
+
 @callback
 def _async_string_to_lower_list(instr: str | Iterable[str]) -> list[str]:
     if isinstance(instr, str):
@@ -1463,17 +1539,12 @@ def async_track_utc_time_change(
     local: bool = False,
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire if time matches a pattern."""
-    job = HassJob(action)
     # We do not have to wrap the function with time pattern matching logic
     # if no pattern given
     if all(val is None for val in (hour, minute, second)):
+        return hass.timer.async_listen(action)
 
-        @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_hass_job(job, cast(datetime, event.data[ATTR_NOW]))
-
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
+    job = HassJob(action)
 
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
@@ -1598,7 +1669,9 @@ def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
     entity_id = cast(str, event.data.get(ATTR_ENTITY_ID))
 
     if info.filter(entity_id):
-        return True
+        return info.filter_state_change(
+            entity_id, event.data.get("old_state"), event.data.get("new_state")
+        )
 
     if (
         event.data.get("new_state") is not None
@@ -1,25 +1,21 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
 import datetime
-import json
 from typing import Any
 
+from homeassistant.util.json import (  # noqa: F401
+    ORJSON_OPTIONS,
+    JSONEncoder,
+    json_bytes,
+    json_encoder_default,
+    json_loads,
+)
 
-class JSONEncoder(json.JSONEncoder):
-    """JSONEncoder that supports Home Assistant objects."""
-
-    def default(self, o: Any) -> Any:
-        """Convert Home Assistant objects.
-
-        Hand other objects to the original method.
-        """
-        if isinstance(o, datetime.datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if hasattr(o, "as_dict"):
-            return o.as_dict()
 
-        return json.JSONEncoder.default(self, o)
+def json_dumps(data: Any) -> str:
+    """Dump data to a compact JSON string that supports Home Assistant objects."""
+    return json_bytes(data).decode("utf-8")
 
 
 class ExtendedJSONEncoder(JSONEncoder):
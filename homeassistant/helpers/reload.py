@@ -124,10 +124,11 @@ async def _async_setup_platform(
 async def _async_reconfig_platform(
     platform: EntityPlatform, platform_configs: list[dict[str, Any]]
 ) -> None:
-    """Reconfigure an already loaded platform."""
-    await platform.async_reset()
-    tasks = [platform.async_setup(p_config) for p_config in platform_configs]
-    await asyncio.gather(*tasks)
+    """Reconfigure an already loaded platform.
+
+    Only the entities of platform configs that changed are re-created.
+    """
+    await platform.async_reconfig(platform_configs)
 
 
 async def async_integration_yaml_config(
@@ -14,7 +14,7 @@ import homeassistant.util.dt as dt_util
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_loads
 from .singleton import singleton
 from .storage import Store
 
@@ -202,7 +202,10 @@ class RestoreStateData:
         # To fully mimic all the attribute data types when loaded from storage,
         # we're going to serialize it to JSON and then re-load it.
         if state is not None:
-            state = State.from_dict(_encode_complex(state.as_dict()))
+            try:
+                state = State.from_dict(json_loads(state.as_dict_json))
+            except (ValueError, TypeError):
+                state = State.from_dict(_encode_complex(state.as_dict()))
         if state is not None:
             self.last_states[entity_id] = StoredState(state, dt_util.utcnow())
 
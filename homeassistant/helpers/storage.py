@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from contextlib import suppress
 from copy import deepcopy
 import inspect
@@ -14,7 +14,9 @@ from typing import Any
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
-from homeassistant.util import json as json_util
+from homeassistant.util import json as json_util, uuid as uuid_util
+
+from .json import json_bytes, json_loads
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -24,6 +26,10 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+JOURNAL_SUFFIX = ".journal"
+# Rewrite the whole data once the journal holds this many records
+JOURNAL_COMPACT_RECORDS = 1000
+
 
 @bind_hass
 async def async_migrator(
@@ -79,8 +85,14 @@ class Store:
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal enabled, records saved with async_delay_save_records are
+        appended to a journal next to the data file instead of rewriting it.
+        The data must then be a dict of lists of records with a unique "id".
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -93,12 +105,24 @@ class Store:
         self._load_task: asyncio.Future | None = None
         self._encoder = encoder
         self._atomic_writes = atomic_writes
+        self._journal = journal
+        # Generation of the data file the journal applies to, None if unknown
+        self._journal_generation: str | None = None
+        self._journal_records = 0
+        # Records to journal on the next write, None if all data must be written
+        self._pending_records: set[tuple[str, str]] | None = None
+        self._record_func: Callable[[str, str], dict[str, Any] | None] | None = None
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self):
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> dict | list | None:
         """Load data.
 
@@ -137,6 +161,20 @@ class Store:
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
+        elif self._journal:
+            data, generation, records = await self.hass.async_add_executor_job(
+                self._load_data_with_journal, self.path
+            )
+
+            if data == {}:
+                return None
+
+            if (
+                data["version"] == self.version
+                and data.get("minor_version", 1) == self.minor_version
+            ):
+                self._journal_generation = generation
+                self._journal_records = records
         else:
             data = await self.hass.async_add_executor_job(
                 json_util.load_json, self.path
@@ -178,8 +216,47 @@ class Store:
 
         return stored
 
+    def _load_data_with_journal(self, path: str) -> tuple[dict, str | None, int]:
+        """Load the data and replay the journal on top of it."""
+        data = json_util.load_json(path)
+        generation = data.pop("journal", None)
+
+        try:
+            journal = open(f"{path}{JOURNAL_SUFFIX}", encoding="utf-8")
+        except FileNotFoundError:
+            return data, generation, 0
+
+        records = []
+        with journal:
+            try:
+                header = json_loads(journal.readline())
+            except ValueError:
+                header = None
+            if (
+                not isinstance(header, dict)
+                or generation is None
+                or header.get("generation") != generation
+            ):
+                # The data was rewritten after the journal
+                _LOGGER.debug("Ignoring stale journal for %s", self.key)
+                return data, generation, 0
+
+            for line in journal:
+                try:
+                    records.append(json_loads(line))
+                except ValueError:
+                    # Incomplete write, the rest of the journal can not be trusted
+                    _LOGGER.warning(
+                        "Ignoring incomplete journal record for %s", self.key
+                    )
+                    break
+
+        _apply_journal_records(data["data"], records)
+        return data, generation, len(records)
+
     async def async_save(self, data: dict | list) -> None:
         """Save data."""
+        self._pending_records = None
         self._data = {
             "version": self.version,
             "minor_version": self.minor_version,
@@ -196,6 +273,35 @@ class Store:
     @callback
     def async_delay_save(self, data_func: Callable[[], dict], delay: float = 0) -> None:
         """Save data with an optional delay."""
+        self._pending_records = None
+        self._async_schedule_write(data_func, delay)
+
+    @callback
+    def async_delay_save_records(
+        self,
+        data_func: Callable[[], dict],
+        record_func: Callable[[str, str], dict[str, Any] | None],
+        records: Iterable[tuple[str, str]],
+        delay: float = 0,
+    ) -> None:
+        """Save changed records with an optional delay.
+
+        Records are (collection, id) tuples, record_func returns the record to
+        store for them or None if it was removed. Without a journal, or when
+        the journal needs compacting, all data returned by data_func is written.
+        """
+        if self._data is None:
+            self._pending_records = set()
+        if self._pending_records is not None:
+            self._pending_records.update(records)
+        self._record_func = record_func
+        self._async_schedule_write(data_func, delay)
+
+    @callback
+    def _async_schedule_write(
+        self, data_func: Callable[[], dict], delay: float
+    ) -> None:
+        """Schedule writing data with an optional delay."""
         # pylint: disable-next=import-outside-toplevel
         from .event import async_call_later
 
@@ -262,18 +368,94 @@ class Store:
                 return
 
             data = self._data
+            records = self._pending_records
+            self._data = None
+            self._pending_records = None
+
+            if (
+                self._journal
+                and records
+                and self._journal_generation is not None
+                and self._journal_records + len(records) <= JOURNAL_COMPACT_RECORDS
+            ):
+                assert self._record_func is not None
+                if await self._async_write_journal(
+                    [
+                        {
+                            "collection": collection,
+                            "id": record_id,
+                            "record": self._record_func(collection, record_id),
+                        }
+                        for collection, record_id in records
+                    ]
+                ):
+                    return
 
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
 
-            self._data = None
+            if self._journal:
+                # Start a new journal on top of the data written now
+                self._journal_generation = None
+                data["journal"] = generation = uuid_util.random_uuid_hex()
 
             try:
                 await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
+                    self._write_data_and_reset_journal, self.path, data
                 )
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+                return
+
+            if self._journal:
+                self._journal_generation = generation
+                self._journal_records = 0
+
+    async def _async_write_journal(self, records: list[dict[str, Any]]) -> bool:
+        """Append records to the journal.
+
+        Returns False if the records could not be written, all data should then
+        be written instead.
+        """
+        header = None
+        if not self._journal_records:
+            header = {
+                "version": self.version,
+                "minor_version": self.minor_version,
+                "generation": self._journal_generation,
+            }
+
+        try:
+            await self.hass.async_add_executor_job(
+                self._write_journal, self.path, header, records
+            )
+        except (OSError, TypeError, ValueError) as err:
+            _LOGGER.error("Error writing journal for %s: %s", self.key, err)
+            return False
+
+        self._journal_records += len(records)
+        return True
+
+    def _write_journal(
+        self, path: str, header: dict[str, Any] | None, records: list[dict[str, Any]]
+    ) -> None:
+        """Append records to the journal, starting a new one if a header is given."""
+        content = b"".join(
+            json_bytes(item, encoder=self._encoder) + b"\n"
+            for item in ([header] if header else []) + records
+        )
+        _LOGGER.debug("Writing %s journal records for %s", len(records), self.key)
+        with open(f"{path}{JOURNAL_SUFFIX}", "wb" if header else "ab") as fdesc:
+            fdesc.write(content)
+            fdesc.flush()
+            os.fsync(fdesc.fileno())
+
+    def _write_data_and_reset_journal(self, path: str, data: dict) -> None:
+        """Write the data and remove the journal it replaces."""
+        self._write_data(path, data)
+        if self._journal:
+            with suppress(FileNotFoundError):
+                os.unlink(f"{path}{JOURNAL_SUFFIX}")
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
@@ -299,3 +481,27 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _apply_journal_records(
+    data: dict[str, list[dict[str, Any]]], records: Iterable[dict[str, Any]]
+) -> None:
+    """Apply journal records to the lists of records they change."""
+    changed: dict[str, dict[str, dict[str, Any]]] = {}
+    for record in records:
+        collection = record["collection"]
+        if (items := changed.get(collection)) is None:
+            items = changed[collection] = {
+                item["id"]: item for item in data.get(collection, [])
+            }
+        if record["record"] is None:
+            items.pop(record["id"], None)
+        else:
+            items[record["id"]] = record["record"]
+
+    for collection, items in changed.items():
+        data[collection] = list(items.values())
@@ -19,18 +19,20 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import time
 from typing import Any, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import pass_context, pass_environment
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
+from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_UNIT_OF_MEASUREMENT,
@@ -69,6 +71,11 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+# Compiled code is shared by every template environment of the same kind
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+_COMPILED_TEMPLATE_CACHE: LRU = LRU(COMPILED_TEMPLATE_CACHE_SIZE)
+_COMPILE_STATS = {"compiles": 0, "compile_time": 0.0}
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -77,15 +84,17 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
-_COLLECTABLE_STATE_ATTRIBUTES = {
-    "state",
-    "attributes",
-    "last_changed",
-    "last_updated",
-    "context",
-    "domain",
-    "object_id",
-    "name",
+# Maps collectable state properties to the state field and attribute they read.
+# The domain and object_id never change for an entity_id.
+_COLLECTABLE_STATE_ATTRIBUTES: dict[str, tuple[str | None, str | None]] = {
+    "state": ("state", None),
+    "attributes": ("attributes", None),
+    "last_changed": ("last_changed", None),
+    "last_updated": ("last_updated", None),
+    "context": ("context", None),
+    "domain": (None, None),
+    "object_id": (None, None),
+    "name": (None, ATTR_FRIENDLY_NAME),
 }
 
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
@@ -236,6 +245,10 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # State fields and attributes read from entities that were not
+        # collected as a whole
+        self.entity_fields: dict[str, set[str]] = {}
+        self.entity_attributes: dict[str, set[str]] = {}
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -257,6 +270,53 @@ class RenderInfo:
         """Template should re-render if the entity is added or removed with domains watched."""
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def filter_state_change(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> bool:
+        """Template should re-render if a field or attribute it read changed."""
+        if (
+            old_state is None
+            or new_state is None
+            or (fields := self.entity_fields.get(entity_id)) is None
+            or self.all_states
+            or self.exception
+            or split_entity_id(entity_id)[0] in self.domains
+        ):
+            return True
+
+        for field in fields:
+            if getattr(old_state, field) != getattr(new_state, field):
+                return True
+
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        return any(
+            old_attributes.get(attribute) != new_attributes.get(attribute)
+            for attribute in self.entity_attributes[entity_id]
+        )
+
+    def collect_entity(self, entity_id: str) -> None:
+        """Collect an entity the template depends on as a whole."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        self.entity_fields.pop(entity_id, None)
+        self.entity_attributes.pop(entity_id, None)
+
+    def collect_entity_read(
+        self, entity_id: str, field: str | None, attribute: str | None = None
+    ) -> None:
+        """Collect a state field or attribute the template read from an entity."""
+        if entity_id not in self.entities:
+            self.entities.add(entity_id)  # type: ignore[attr-defined]
+            self.entity_fields[entity_id] = set()
+            self.entity_attributes[entity_id] = set()
+        elif entity_id not in self.entity_fields:
+            return
+
+        if field is not None:
+            self.entity_fields[entity_id].add(field)
+        if attribute is not None:
+            self.entity_attributes[entity_id].add(attribute)
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -732,16 +792,29 @@ class TemplateState(State):
 
     def _collect_state(self) -> None:
         if self._collect and _RENDER_INFO in self._hass.data:
-            self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+            self._hass.data[_RENDER_INFO].collect_entity(self._state.entity_id)
+
+    def _collect_read(self, field: str | None, attribute: str | None = None) -> None:
+        if self._collect and _RENDER_INFO in self._hass.data:
+            self._hass.data[_RENDER_INFO].collect_entity_read(
+                self._state.entity_id, field, attribute
+            )
+
+    def _attribute(self, name: str) -> Any:
+        """Return a single attribute, collecting only that attribute."""
+        self._collect_read(None, name)
+        return self._state.attributes.get(name)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item):
         """Return a property as an attribute for jinja."""
-        if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
+        if (collect := _COLLECTABLE_STATE_ATTRIBUTES.get(item)) is not None:
+            # _collect_read inlined here for performance
             if self._collect and _RENDER_INFO in self._hass.data:
-                self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+                self._hass.data[_RENDER_INFO].collect_entity_read(
+                    self._state.entity_id, *collect
+                )
             return getattr(self._state, item)
         if item == "entity_id":
             return self._state.entity_id
@@ -760,55 +833,55 @@ class TemplateState(State):
     @property
     def state(self):
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_read("state")
         return self._state.state
 
     @property
     def attributes(self):
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_read("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_read("last_changed")
         return self._state.last_changed
 
     @property
     def last_updated(self):
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_read("last_updated")
         return self._state.last_updated
 
     @property
     def context(self):
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_read("context")
         return self._state.context
 
     @property
     def domain(self):
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_read(None)
         return self._state.domain
 
     @property
     def object_id(self):
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_read(None)
         return self._state.object_id
 
     @property
     def name(self):
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_read(None, ATTR_FRIENDLY_NAME)
         return self._state.name
 
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
-        self._collect_state()
+        self._collect_read("state", ATTR_UNIT_OF_MEASUREMENT)
         unit = self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return f"{self._state.state} {unit}" if unit else self._state.state
 
@@ -824,7 +897,7 @@ class TemplateState(State):
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := hass.data.get(_RENDER_INFO)) is not None:
-        entity_collect.entities.add(entity_id)
+        entity_collect.collect_entity(entity_id)
 
 
 def _state_generator(hass: HomeAssistant, domain: str | None) -> Generator:
@@ -1260,7 +1333,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._attribute(name)  # pylint: disable=protected-access
     return None
 
 
@@ -1866,7 +1939,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        self.cache_kind = (hass is not None, limited, strict)
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -2058,10 +2131,26 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (self.cache_kind, source)
+        if (cached := _COMPILED_TEMPLATE_CACHE.get(key)) is None:
+            start = time.perf_counter()
+            cached = _COMPILED_TEMPLATE_CACHE[key] = super().compile(source)
+            _COMPILE_STATS["compiles"] += 1
+            _COMPILE_STATS["compile_time"] += time.perf_counter() - start
 
         return cached
 
 
+def compiled_template_cache_info() -> dict[str, Any]:
+    """Return statistics of the compiled template cache."""
+    hits, misses = _COMPILED_TEMPLATE_CACHE.get_stats()
+    return {
+        "hits": hits,
+        "misses": misses,
+        "size": len(_COMPILED_TEMPLATE_CACHE),
+        "maxsize": _COMPILED_TEMPLATE_CACHE.get_size(),
+        **_COMPILE_STATS,
+    }
+
+
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
@@ -96,6 +96,16 @@ class DataUpdateCoordinator(Generic[T]):
 
         return remove_listener
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners.
+
+        The state writes of the listening entities are set in one pass.
+        """
+        with entity.async_batch_state_writes(self.hass):
+            for update_callback in self._listeners:
+                update_callback()
+
     @callback
     def async_remove_listener(self, update_callback: CALLBACK_TYPE) -> None:
         """Remove data update."""
@@ -261,8 +271,7 @@ class DataUpdateCoordinator(Generic[T]):
             if not auth_failed and self._listeners and not self.hass.is_stopping:
                 self._schedule_refresh()
 
-        for update_callback in self._listeners:
-            update_callback()
+        self.async_update_listeners()
 
     @callback
     def async_set_updated_data(self, data: T) -> None:
@@ -283,8 +292,7 @@ class DataUpdateCoordinator(Generic[T]):
         if self._listeners:
             self._schedule_refresh()
 
-        for update_callback in self._listeners:
-            update_callback()
+        self.async_update_listeners()
 
     @callback
     def _async_stop_refresh(self, _: Event) -> None:
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+import copy
 import functools as ft
 import importlib
 import json
@@ -29,7 +30,6 @@ from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
-from .util.async_ import gather_with_concurrency
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -46,6 +46,12 @@ DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
+MANIFESTS_INDEX_PATH = pathlib.Path(__file__).parent / "generated" / "manifests.json"
+# Bump when the structure of the index changes, an index with
+# another version is ignored.
+MANIFESTS_INDEX_VERSION = 1
+CUSTOM_MANIFESTS_STORAGE_KEY = "core.custom_manifests"
+CUSTOM_MANIFESTS_STORAGE_VERSION = 1
 CUSTOM_WARNING = (
     "We found a custom integration %s which has not "
     "been tested by Home Assistant. This component might "
@@ -113,27 +119,57 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
-
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    def get_manifests(
+        paths: list[str], cached: dict[str, dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Return the manifests of all sub directories in a set of paths.
+
+        A manifest.json file is only loaded when its modification time does
+        not match the cached one.
+        """
+        manifests: dict[str, dict[str, Any]] = {}
+        for path in paths:
+            for entry in pathlib.Path(path).iterdir():
+                manifest_path = entry / "manifest.json"
+                if entry.name in manifests:
+                    continue
+                try:
+                    mtime = manifest_path.stat().st_mtime
+                except OSError:
+                    continue
+                cache = cached.get(str(manifest_path))
+                if cache is None or cache["mtime"] != mtime:
+                    if (manifest := _load_manifest(manifest_path)) is None:
+                        continue
+                    cache = {
+                        "path": str(manifest_path),
+                        "mtime": mtime,
+                        "manifest": manifest,
+                    }
+                manifests[entry.name] = cache
+        return list(manifests.values())
+
+    store = Store(hass, CUSTOM_MANIFESTS_STORAGE_VERSION, CUSTOM_MANIFESTS_STORAGE_KEY)
+    stored = await store.async_load() or []
+    manifests = await hass.async_add_executor_job(
+        get_manifests,
+        custom_components.__path__,
+        {cache["path"]: cache for cache in stored},
     )
-
-    integrations = await gather_with_concurrency(
-        MAX_LOAD_CONCURRENTLY,
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        ),
+    if manifests != stored:
+        await store.async_save(manifests)
+
+    integrations = (
+        Integration.from_manifest(
+            hass,
+            custom_components,
+            pathlib.Path(cache["path"]),
+            copy.deepcopy(cache["manifest"]),
+        )
+        for cache in manifests
     )
 
     return {
@@ -309,6 +345,32 @@ async def async_get_mqtt(hass: HomeAssistant) -> dict[str, list[str]]:
     return mqtt
 
 
+def _load_manifest(manifest_path: pathlib.Path) -> Manifest | None:
+    """Load a manifest.json file."""
+    try:
+        return cast(Manifest, json.loads(manifest_path.read_text()))
+    except ValueError as err:
+        _LOGGER.error("Error parsing manifest.json file at %s: %s", manifest_path, err)
+        return None
+
+
+@ft.lru_cache(maxsize=1)
+def _get_builtin_manifests() -> dict[str, Manifest]:
+    """Return the manifests of the built-in integrations from the index.
+
+    The index is generated by hassfest. When it is missing or has another
+    version, the manifest.json file of each integration is loaded instead.
+    """
+    try:
+        index = json.loads(MANIFESTS_INDEX_PATH.read_text())
+    except (OSError, ValueError) as err:
+        _LOGGER.debug("Error loading the manifest index: %s", err)
+        return {}
+    if index.get("version") != MANIFESTS_INDEX_VERSION:
+        return {}
+    return cast(dict[str, Manifest], index["manifests"])
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -317,62 +379,78 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        if root_module.__name__ == PACKAGE_BUILTIN and (
+            manifest := _get_builtin_manifests().get(domain)
+        ):
+            return cls.from_manifest(
+                hass,
+                root_module,
+                pathlib.Path(root_module.__path__[0]) / domain / "manifest.json",
+                copy.deepcopy(manifest),
+            )
+
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
             if not manifest_path.is_file():
                 continue
 
-            try:
-                manifest = json.loads(manifest_path.read_text())
-            except ValueError as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+            if (manifest := _load_manifest(manifest_path)) is None:
                 continue
 
-            integration = cls(
-                hass,
-                f"{root_module.__name__}.{domain}",
-                manifest_path.parent,
-                manifest,
-            )
+            return cls.from_manifest(hass, root_module, manifest_path, manifest)
 
-            if integration.is_built_in:
-                return integration
+        return None
 
-            _LOGGER.warning(CUSTOM_WARNING, integration.domain)
-            if integration.version is None:
-                _LOGGER.error(
-                    "The custom integration '%s' does not have a "
-                    "version key in the manifest file and was blocked from loading. "
-                    "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
-                    integration.domain,
-                )
-                return None
-            try:
-                AwesomeVersion(
-                    integration.version,
-                    [
-                        AwesomeVersionStrategy.CALVER,
-                        AwesomeVersionStrategy.SEMVER,
-                        AwesomeVersionStrategy.SIMPLEVER,
-                        AwesomeVersionStrategy.BUILDVER,
-                        AwesomeVersionStrategy.PEP440,
-                    ],
-                )
-            except AwesomeVersionException:
-                _LOGGER.error(
-                    "The custom integration '%s' does not have a "
-                    "valid version key (%s) in the manifest file and was blocked from loading. "
-                    "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
-                    integration.domain,
-                    integration.version,
-                )
-                return None
+    @classmethod
+    def from_manifest(
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        manifest_path: pathlib.Path,
+        manifest: Manifest,
+    ) -> Integration | None:
+        """Create an integration from its manifest."""
+        integration = cls(
+            hass,
+            f"{root_module.__name__}.{manifest_path.parent.name}",
+            manifest_path.parent,
+            manifest,
+        )
+
+        if integration.is_built_in:
             return integration
 
-        return None
+        _LOGGER.warning(CUSTOM_WARNING, integration.domain)
+        if integration.version is None:
+            _LOGGER.error(
+                "The custom integration '%s' does not have a "
+                "version key in the manifest file and was blocked from loading. "
+                "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
+                integration.domain,
+            )
+            return None
+        try:
+            AwesomeVersion(
+                integration.version,
+                [
+                    AwesomeVersionStrategy.CALVER,
+                    AwesomeVersionStrategy.SEMVER,
+                    AwesomeVersionStrategy.SIMPLEVER,
+                    AwesomeVersionStrategy.BUILDVER,
+                    AwesomeVersionStrategy.PEP440,
+                ],
+            )
+        except AwesomeVersionException:
+            _LOGGER.error(
+                "The custom integration '%s' does not have a "
+                "valid version key (%s) in the manifest file and was blocked from loading. "
+                "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
+                integration.domain,
+                integration.version,
+            )
+            return None
+        return integration
 
     def __init__(
         self,
@@ -191,7 +191,8 @@ def check(config_dir, secrets=False):
 
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.SafeLineLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        for loader in (yaml_loader.SafeLineLoader, yaml_loader.PythonSafeLineLoader):
+            loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     def secrets_proxy(*args):
         secrets = Secrets(*args)
@@ -219,9 +220,11 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.SafeLineLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            for loader in (
+                yaml_loader.SafeLineLoader,
+                yaml_loader.PythonSafeLineLoader,
+            ):
+                loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     return res
 
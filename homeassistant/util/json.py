@@ -3,17 +3,97 @@ from __future__ import annotations
 
 from collections import deque
 from collections.abc import Callable
+import datetime
 import json
 import logging
-from typing import Any
+from typing import Any, Final
+
+import orjson
 
-from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
 from .file import write_utf8_file, write_utf8_file_atomic
 
 _LOGGER = logging.getLogger(__name__)
 
+ORJSON_OPTIONS: Final = orjson.OPT_NON_STR_KEYS
+
+
+class JSONEncoder(json.JSONEncoder):
+    """JSONEncoder that supports Home Assistant objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects.
+
+        Hand other objects to the original method.
+        """
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        if isinstance(o, set):
+            return list(o)
+        if hasattr(o, "as_dict"):
+            return o.as_dict()
+
+        return json.JSONEncoder.default(self, o)
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert the Home Assistant objects orjson does not handle.
+
+    Datetimes, dataclasses, enums and tuples are encoded natively.
+    """
+    if isinstance(obj, set):
+        return list(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError
+
+
+def json_bytes(
+    data: Any,
+    *,
+    indent: bool = False,
+    encoder: type[json.JSONEncoder] | None = JSONEncoder,
+) -> bytes:
+    """Dump data to JSON bytes with orjson.
+
+    The stdlib is used when a custom encoder class is requested or for data
+    orjson can not encode. Without an encoder only the types the stdlib
+    supports are encoded, plus datetimes. NaN is encoded as null by orjson
+    and rejected by the stdlib.
+    """
+    if encoder in (None, JSONEncoder):
+        try:
+            return orjson.dumps(
+                data,
+                option=ORJSON_OPTIONS | orjson.OPT_INDENT_2
+                if indent
+                else ORJSON_OPTIONS,
+                default=json_encoder_default if encoder else None,
+            )
+        except orjson.JSONEncodeError:
+            # Let the stdlib encode what orjson can not, or raise its own error
+            pass
+    if indent:
+        return json.dumps(data, indent=2, cls=encoder, allow_nan=False).encode("utf-8")
+    return json.dumps(data, cls=encoder, allow_nan=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON with orjson.
+
+    Falls back to the stdlib for input orjson rejects, such as NaN, so
+    previously written data keeps loading.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -30,7 +110,7 @@ def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """
     try:
         with open(filename, encoding="utf-8") as fdesc:
-            return json.loads(fdesc.read())  # type: ignore
+            return json_loads(fdesc.read())  # type: ignore
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
@@ -56,7 +136,7 @@ def save_json(
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        json_data = json_bytes(data, indent=True, encoder=encoder).decode("utf-8")
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
@@ -83,6 +163,9 @@ def find_paths_unserializable_data(
 
     This method is slow! Only use for error handling.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.core import Event, State
+
     to_process = deque([(bad_data, "$")])
     invalid = {}
 
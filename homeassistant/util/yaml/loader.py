@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from collections.abc import Iterator
+from copy import deepcopy
 import fnmatch
 import logging
 import os
@@ -11,6 +12,14 @@ from typing import Any, TextIO, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore[misc]
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -23,6 +32,9 @@ DICT_T = TypeVar("DICT_T", bound=dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed files by path, with the mtime and size they were parsed at
+_FILE_CACHE: dict[str, tuple[tuple[int, int], JSON_TYPE]] = {}
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -88,13 +100,41 @@ class Secrets:
         return secrets
 
 
-class SafeLineLoader(yaml.SafeLoader):
-    """Loader class that keeps track of line numbers."""
+class SafeLineLoader(FastestAvailableSafeLoader):
+    """Loader class that keeps track of line numbers.
+
+    Uses the libyaml C parser when it is available. The line of loaded
+    objects comes from the start mark of their node, which both parsers set.
+    """
+
+    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+        """Initialize a safe line loader."""
+        super().__init__(stream)
+        if HAS_C_LOADER:
+            # The C parser does not keep the stream or its name around
+            if isinstance(stream, str):
+                self.name = "<unicode string>"
+            elif isinstance(stream, bytes):
+                self.name = "<byte string>"
+            else:
+                self.name = getattr(stream, "name", "<file>")
+            self.stream = stream
+        self.secrets = secrets
+        # Cleared when the result depends on more than the file itself
+        self.cacheable = True
+
+
+class PythonSafeLineLoader(yaml.SafeLoader):
+    """Pure Python loader class that keeps track of line numbers.
+
+    Used to report detailed errors when the C parser fails.
+    """
 
     def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.cacheable = True
 
     def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:  # type: ignore[override]
         """Annotate a node with the first line it was seen."""
@@ -105,29 +145,75 @@ class SafeLineLoader(yaml.SafeLoader):
 
 
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Files that only depend on their own content are cached by path, mtime and
+    size, so included files that did not change are not parsed again.
+    """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            try:
+                stat = os.fstat(conf_file.fileno())
+            except (OSError, ValueError):
+                # Not backed by a real file
+                return parse_yaml(conf_file, secrets)
+
+            key = (stat.st_mtime_ns, stat.st_size)
+            if (cached := _FILE_CACHE.get(fname)) is not None and cached[0] == key:
+                return deepcopy(cached[1])
+
+            data, cacheable = _parse_yaml(conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    if cacheable:
+        _FILE_CACHE[fname] = (key, deepcopy(data))
+    else:
+        _FILE_CACHE.pop(fname, None)
+    return data
+
 
 def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    return _parse_yaml(content, secrets)[0]
+
+
+def _parse_yaml(
+    content: str | TextIO, secrets: Secrets | None
+) -> tuple[JSON_TYPE, bool]:
+    """Load a YAML file and return if the result only depends on the content."""
     try:
-        # If configuration file is empty YAML returns None
-        # We convert that to an empty dict
-        return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
-            or OrderedDict()
-        )
+        try:
+            return _load_with(SafeLineLoader, content, secrets)
+        except yaml.YAMLError:
+            if not HAS_C_LOADER:
+                raise
+            # The C parser does not include the offending snippet in its
+            # errors, so parse again with the pure Python one to report it.
+            if not isinstance(content, str):
+                content.seek(0)
+            return _load_with(PythonSafeLineLoader, content, secrets)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
 
 
+def _load_with(
+    loader_class: type[SafeLineLoader] | type[PythonSafeLineLoader],
+    content: str | TextIO,
+    secrets: Secrets | None,
+) -> tuple[JSON_TYPE, bool]:
+    """Load YAML content with a specific loader class."""
+    loader = loader_class(content, secrets)
+    try:
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        return loader.get_single_data() or OrderedDict(), loader.cacheable
+    finally:
+        loader.dispose()
+
+
 @overload
 def _add_reference(
     obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
@@ -167,6 +253,7 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         device_tracker: !include device_tracker.yaml
 
     """
+    loader.cacheable = False
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
         return _add_reference(load_yaml(fname, loader.secrets), loader, node)
@@ -195,6 +282,7 @@ def _include_dir_named_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
+    loader.cacheable = False
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     for fname in _find_files(loc, "*.yaml"):
@@ -209,6 +297,7 @@ def _include_dir_merge_named_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
+    loader.cacheable = False
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     for fname in _find_files(loc, "*.yaml"):
@@ -224,6 +313,7 @@ def _include_dir_list_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
+    loader.cacheable = False
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
         load_yaml(f, loader.secrets)
@@ -236,6 +326,7 @@ def _include_dir_merge_list_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
+    loader.cacheable = False
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: list[JSON_TYPE] = []
     for fname in _find_files(loc, "*.yaml"):
@@ -287,6 +378,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    loader.cacheable = False
     args = node.value.split()
 
     # Check for a default value
@@ -300,25 +392,25 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
 
 def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
+    loader.cacheable = False
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+for _loader in (SafeLineLoader, PythonSafeLineLoader):
+    _loader.add_constructor("!include", _include_yaml)
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
+    )
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
+    )
+    _loader.add_constructor("!env_var", _env_var_yaml)
+    _loader.add_constructor("!secret", secret_yaml)
+    _loader.add_constructor("!include_dir_list", _include_dir_list_yaml)
+    _loader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+    _loader.add_constructor("!include_dir_named", _include_dir_named_yaml)
+    _loader.add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+    _loader.add_constructor("!input", Input.from_node)
@@ -12,6 +12,7 @@ from . import (
     dhcp,
     json,
     manifest,
+    manifests,
     mqtt,
     mypy_config,
     requirements,
@@ -30,6 +31,7 @@ INTEGRATION_PLUGINS = [
     dhcp,
     json,
     manifest,
+    manifests,
     mqtt,
     requirements,
     services,
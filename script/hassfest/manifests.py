@@ -0,0 +1,41 @@
+"""Generate the manifest index file."""
+from __future__ import annotations
+
+import json
+
+from homeassistant.loader import MANIFESTS_INDEX_VERSION
+
+from .model import Config, Integration
+
+
+def generate_and_validate(integrations: dict[str, Integration]):
+    """Validate and generate manifest index data."""
+    data = {
+        domain: integrations[domain].manifest
+        for domain in sorted(integrations)
+        if integrations[domain].manifest
+    }
+    return json.dumps({"version": MANIFESTS_INDEX_VERSION, "manifests": data}, indent=2)
+
+
+def validate(integrations: dict[str, Integration], config: Config):
+    """Validate manifest index file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.json"
+    config.cache["manifests"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    if not manifests_path.is_file() or manifests_path.read_text().strip() != content:
+        config.add_error(
+            "manifests",
+            "File manifests.json is not up to date. Run python3 -m script.hassfest",
+            fixable=True,
+        )
+
+
+def generate(integrations: dict[str, Integration], config: Config):
+    """Generate manifest index file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.json"
+    with open(str(manifests_path), "w") as fp:
+        fp.write(f"{config.cache['manifests']}\n")
@@ -47,6 +47,8 @@ REQUIRES = [
     "httpx==0.21.3",
     "ifaddr==0.1.7",
     "jinja2==3.0.3",
+    "lru-dict==1.1.7",
+    "orjson==3.8.3",
     "PyJWT==2.1.0",
     # PyJWT has loose dependency. We want the latest one.
     "cryptography==35.0.0",
@@ -385,7 +385,9 @@ def async_fire_time_changed(
     if datetime_ is None:
         datetime_ = date_util.utcnow()
 
-    hass.bus.async_fire(EVENT_TIME_CHANGED, {"now": date_util.as_utc(datetime_)})
+    utc_datetime = date_util.as_utc(datetime_)
+    hass.timer.async_tick(utc_datetime)
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {"now": utc_datetime})
 
     for task in list(hass.loop._scheduled):
         if not isinstance(task, asyncio.TimerHandle):
@@ -1066,6 +1068,16 @@ def mock_storage(data=None):
         raise_contains_mocks(data_to_write)
         data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
 
+    def mock_write_journal(store, path, header, records):
+        """Mock version of write journal."""
+        # To ensure that the records can be serialized
+        _LOGGER.info("Writing journal to %s: %s", store.key, records)
+        raise_contains_mocks(records)
+        storage._apply_journal_records(
+            data[store.key]["data"],
+            json.loads(json.dumps(records, cls=store._encoder)),
+        )
+
     async def mock_remove(store):
         """Remove data."""
         data.pop(store.key, None)
@@ -1078,6 +1090,10 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store._write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store._write_journal",
+        side_effect=mock_write_journal,
+        autospec=True,
     ), patch(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
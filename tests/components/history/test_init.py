@@ -3,10 +3,13 @@
 from datetime import timedelta
 from http import HTTPStatus
 import json
+import threading
 from unittest.mock import patch, sentinel
 
+from aiohttp import ClientPayloadError
 import pytest
 from pytest import approx
+from sqlalchemy.exc import SQLAlchemyError
 
 from homeassistant.components import history, recorder
 from homeassistant.components.recorder.history import get_significant_states
@@ -614,6 +617,61 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == HTTPStatus.OK
 
 
+async def test_fetch_period_api_with_columnar_response(hass, hass_client):
+    """Test the fetch period view for history with columnar_response."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(
+        hass,
+        "history",
+        {
+            "history": {
+                "use_include_order": True,
+                "include": {"entities": ["light.kitchen", "light.cow"]},
+            }
+        },
+    )
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?columnar_response&minimal_response"
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert list(response_json) == ["light.kitchen", "light.cow"]
+    kitchen = response_json["light.kitchen"]
+    assert kitchen["state"] == ["on", "off"]
+    assert len(kitchen["last_changed"]) == 2
+    assert all(isinstance(value, float) for value in kitchen["last_changed"])
+    assert kitchen["attributes"] == [[0, {"brightness": 10}], [1, {}]]
+    assert response_json["light.cow"]["attributes"] == [[0, {}]]
+
+
+@pytest.mark.parametrize("point_budget", ["cats", "0"])
+async def test_fetch_period_api_with_invalid_point_budget(
+    hass, hass_client, point_budget
+):
+    """Test the fetch period view for history with an invalid point_budget."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}",
+        params={"point_budget": point_budget},
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -831,6 +889,173 @@ async def test_entity_ids_limit_via_api_with_skip_initial_state(hass, hass_clien
     assert response_json[1][0]["entity_id"] == "light.cow"
 
 
+async def test_fetch_period_api_stream(hass, hass_client):
+    """Test streaming the fetch period view matches the buffered response."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    for query in ("", "&minimal_response"):
+        url = f"/api/history/period/{start.isoformat()}?filter_entity_id=light.kitchen,light.cow{query}"
+        response = await client.get(url)
+        assert response.status == HTTPStatus.OK
+        expected = await response.json()
+
+        with patch.object(history, "STREAM_CHUNK_SIZE", 1):
+            response = await client.get(f"{url}&stream")
+        assert response.status == HTTPStatus.OK
+        streamed = await response.json()
+
+        assert len(streamed) == 2
+        assert sorted(streamed, key=lambda states: states[0]["entity_id"]) == sorted(
+            expected, key=lambda states: states[0]["entity_id"]
+        )
+
+
+async def test_fetch_period_api_stream_no_states(hass, hass_client):
+    """Test streaming the fetch period view without any states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}?filter_entity_id=light.none&stream"
+    )
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == []
+
+
+async def test_fetch_period_api_stream_error(hass, hass_client, caplog):
+    """Test a database error while streaming closes the connection."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def _stream_significant_states(*args):
+        yield "light.kitchen", iter([{"state": "on"}])
+        raise SQLAlchemyError("database gone")
+
+    client = await hass_client()
+    with patch.object(
+        history.history,
+        "stream_significant_states_with_session",
+        _stream_significant_states,
+    ):
+        response = await client.get(
+            f"/api/history/period/{dt_util.utcnow().isoformat()}?stream"
+        )
+        assert response.status == HTTPStatus.OK
+        with pytest.raises(ClientPayloadError):
+            await response.read()
+
+    assert "Error streaming history" in caplog.text
+
+
+async def test_stream_history_during_period(hass, hass_ws_client):
+    """Test streaming history over the websocket api."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.test", "2")
+    hass.states.async_set("sensor.test", "3")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    with patch.object(history, "STREAM_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream_history_during_period",
+                "start_time": start.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "include_start_time_state": False,
+            }
+        )
+        first = await client.receive_json()
+        second = await client.receive_json()
+        response = await client.receive_json()
+
+    assert first["type"] == "event"
+    assert first["event"]["entity_id"] == "sensor.test"
+    assert [state["state"] for state in first["event"]["states"]] == ["1", "2"]
+    assert second["type"] == "event"
+    assert second["event"]["entity_id"] == "sensor.test"
+    assert [state["state"] for state in second["event"]["states"]] == ["3"]
+    assert response["id"] == 1
+    assert response["success"]
+
+
+async def test_stream_history_during_period_connection_closed(hass, hass_ws_client):
+    """Test streaming history stops when the connection is closed."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    proceed = threading.Event()
+    read_entity_ids = []
+
+    def _chunked_significant_states(*args):
+        for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+            read_entity_ids.append(entity_id)
+            yield entity_id, [{"state": "on"}]
+            proceed.wait(5)
+
+    client = await hass_ws_client()
+    with patch.object(
+        history, "_chunked_significant_states", _chunked_significant_states
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream_history_during_period",
+                "start_time": dt_util.utcnow().isoformat(),
+            }
+        )
+        first = await client.receive_json()
+        await client.close()
+        proceed.set()
+        await hass.async_block_till_done()
+
+    assert first["event"]["entity_id"] == "sensor.one"
+    assert read_entity_ids == ["sensor.one", "sensor.two"]
+
+
+async def test_stream_history_during_period_bad_start_time(hass, hass_ws_client):
+    """Test streaming history with an invalid start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream_history_during_period",
+            "start_time": "cats",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 POWER_SENSOR_ATTRIBUTES = {
     "device_class": "power",
     "state_class": "measurement",
@@ -34,9 +34,9 @@ async def test_invalid_json(caplog):
     view = HomeAssistantView()
 
     with pytest.raises(HTTPInternalServerError):
-        view.json(float("NaN"))
+        view.json({"hello": object()})
 
-    assert str(float("NaN")) in caplog.text
+    assert "Unable to serialize to JSON" in caplog.text
 
 
 async def test_handling_unauthorized(mock_request):
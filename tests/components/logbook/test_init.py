@@ -12,7 +12,13 @@ import voluptuous as vol
 from homeassistant.components import logbook, recorder
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.models import (
+    Events,
+    States,
+    StatesMeta,
+    process_timestamp_to_utc_isoformat,
+)
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.const import (
     ATTR_DOMAIN,
@@ -278,6 +284,7 @@ def create_state_changed_event_from_old_new(
             "entity_id"
             "domain"
             "attributes"
+            "shared_attrs"
             "state_id",
             "old_state_id",
         ],
@@ -286,6 +293,7 @@ def create_state_changed_event_from_old_new(
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
     row.attributes = attributes_json
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -1864,6 +1872,64 @@ async def test_context_filter(hass, hass_client):
     assert response.status == HTTPStatus.BAD_REQUEST
 
 
+async def test_context_from_legacy_state_changed_event(hass, hass_client):
+    """Test the context of states recorded before schema 26 comes from the event."""
+    await async_init_recorder_component(hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    entity_id = "switch.legacy"
+    now = dt_util.utcnow()
+
+    def _add_legacy_states():
+        with session_scope(hass=hass) as session:
+            states_meta = StatesMeta(entity_id=entity_id)
+            old_state = States(
+                entity_id=entity_id,
+                domain="switch",
+                state="off",
+                attributes="{}",
+                last_changed=now - timedelta(minutes=2),
+                last_updated=now - timedelta(minutes=2),
+                states_meta=states_meta,
+            )
+            # Before schema 26 the context was only stored on the event
+            event = Events(
+                event_type=EVENT_STATE_CHANGED,
+                event_data="{}",
+                origin="LOCAL",
+                time_fired=now - timedelta(minutes=1),
+                context_id="legacy-context-id",
+                context_user_id="legacy-user-id",
+            )
+            session.add(
+                States(
+                    entity_id=entity_id,
+                    domain="switch",
+                    state="on",
+                    attributes="{}",
+                    last_changed=now - timedelta(minutes=1),
+                    last_updated=now - timedelta(minutes=1),
+                    old_state=old_state,
+                    event=event,
+                    states_meta=states_meta,
+                )
+            )
+
+    await hass.async_add_executor_job(_add_legacy_states)
+    client = await hass_client()
+
+    entries = await _async_fetch_logbook(client, {"context_id": "legacy-context-id"})
+
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id=entity_id, state="on")
+    assert entries[0]["context_user_id"] == "legacy-user-id"
+
+    entries = await _async_fetch_logbook(client, {"entity": entity_id})
+    assert len(entries) == 1
+    assert entries[0]["context_user_id"] == "legacy-user-id"
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
@@ -947,6 +947,35 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+async def test_subscribe_overlapping_wildcards(hass, mqtt_mock):
+    """Test removing a subscription keeps the overlapping subscriptions."""
+    calls_exact = MagicMock()
+    calls_level = MagicMock()
+    calls_subtree = MagicMock()
+    unsub_exact = await mqtt.async_subscribe(hass, "test/a/state", calls_exact)
+    unsub_level = await mqtt.async_subscribe(hass, "test/+/state", calls_level)
+    await mqtt.async_subscribe(hass, "test/#", calls_subtree)
+
+    async_fire_mqtt_message(hass, "test/a/state", "on")
+    async_fire_mqtt_message(hass, "test/b/state", "on")
+    async_fire_mqtt_message(hass, "test", "on")
+    await hass.async_block_till_done()
+    assert calls_exact.call_count == 1
+    assert calls_level.call_count == 2
+    assert calls_subtree.call_count == 3
+
+    unsub_level()
+    with pytest.raises(HomeAssistantError):
+        unsub_level()
+    unsub_exact()
+
+    async_fire_mqtt_message(hass, "test/a/state", "off")
+    await hass.async_block_till_done()
+    assert calls_exact.call_count == 1
+    assert calls_level.call_count == 2
+    assert calls_subtree.call_count == 4
+
+
 async def test_subscribe_same_topic(hass, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
@@ -1218,9 +1247,7 @@ async def test_delayed_birth_message(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
     spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
 
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
@@ -5,10 +5,22 @@ from datetime import timedelta
 import json
 from unittest.mock import patch, sentinel
 
-from homeassistant.components.recorder import history
-from homeassistant.components.recorder.models import process_timestamp
+import pytest
+from pytest import approx
+
+from homeassistant.components.recorder import history, statistics
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import (
+    Statistics,
+    StatisticsMeta,
+    process_timestamp,
+    process_timestamp_to_utc_isoformat,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import TEMP_CELSIUS
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
+from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
 
 from tests.common import mock_state_change_event
@@ -217,6 +229,182 @@ def test_get_significant_states_minimal_response(hass_recorder):
     assert states == hist
 
 
+def test_get_significant_states_columnar_response(hass_recorder):
+    """Test the states of each entity can be returned as parallel lists."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    hist = history.get_significant_states(hass, zero, four, columnar_response=True)
+
+    assert hist.keys() == states.keys()
+    for entity_id, entity_states in states.items():
+        expected_attributes = []
+        for idx, state in enumerate(entity_states):
+            if idx == 0 or state.attributes != entity_states[idx - 1].attributes:
+                expected_attributes.append([idx, dict(state.attributes)])
+        assert hist[entity_id] == {
+            "state": [state.state for state in entity_states],
+            "last_changed": [state.last_changed.timestamp() for state in entity_states],
+            "attributes": expected_attributes,
+        }
+
+
+def test_get_significant_states_columnar_minimal_response(hass_recorder):
+    """Test minimal columnar responses only have the first and last attributes."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    hist = history.get_significant_states(
+        hass,
+        zero - timedelta(seconds=1),
+        four,
+        entity_ids=["media_player.test", "thermostat.test"],
+        minimal_response=True,
+        columnar_response=True,
+    )
+
+    mp_states = states["media_player.test"]
+    assert hist["media_player.test"] == {
+        "state": ["idle", "YouTube", "Netflix"],
+        "last_changed": [state.last_changed.timestamp() for state in mp_states],
+        "attributes": [[0, mp_states[0].attributes], [2, mp_states[2].attributes]],
+    }
+    # Domains which need the attributes keep all of them
+    assert hist["thermostat.test"]["state"] == [
+        state.state for state in states["thermostat.test"]
+    ]
+    assert len(hist["thermostat.test"]["attributes"]) == len(states["thermostat.test"])
+
+
+def test_get_significant_states_point_budget(hass_recorder):
+    """Test entities with more states than the point budget use statistics."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero, states = record_sensor_states(hass)
+    recorder.do_adhoc_statistics(start=zero)
+    wait_recording_done(hass)
+
+    end = zero + timedelta(minutes=5)
+    entity_ids = ["sensor.test1", "sensor.test3", "media_player.test"]
+    hist = history.get_significant_states(
+        hass, zero, end, entity_ids=entity_ids, point_budget=3
+    )
+    assert hist == {entity_id: states[entity_id] for entity_id in entity_ids}
+
+    # sensor.test3 has no statistics, media_player.test is within budget
+    hist = history.get_significant_states(
+        hass, zero, end, entity_ids=entity_ids, point_budget=2
+    )
+    assert list(hist) == entity_ids
+    assert hist["sensor.test1"] == [
+        {
+            "state": approx(14.915254237288135),
+            "last_changed": process_timestamp_to_utc_isoformat(zero),
+            "min": approx(10.0),
+            "max": approx(20.0),
+        }
+    ]
+    assert hist["sensor.test3"] == states["sensor.test3"]
+    assert hist["media_player.test"] == states["media_player.test"]
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        end,
+        entity_ids=["sensor.test1"],
+        columnar_response=True,
+        point_budget=2,
+    )
+    assert hist == {
+        "sensor.test1": {
+            "state": [approx(14.915254237288135)],
+            "last_changed": [zero.timestamp()],
+            "attributes": [],
+            "min": [approx(10.0)],
+            "max": [approx(20.0)],
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "period_start_end,duration,point_budget",
+    [
+        (statistics.day_start_end, timedelta(days=3), 3),
+        (statistics.month_start_end, timedelta(days=62), 2),
+    ],
+)
+def test_get_significant_states_point_budget_long_period(
+    hass_recorder, period_start_end, duration, point_budget
+):
+    """Test long periods are downsampled to daily or monthly statistics."""
+    hass = hass_recorder()
+    entity_id = "sensor.test1"
+    attributes = {"state_class": "measurement", "unit_of_measurement": TEMP_CELSIUS}
+
+    start, second_start = period_start_end(dt_util.utcnow() - timedelta(days=100))
+    end = start + duration
+    for hours in range(1, point_budget + 2):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=start + timedelta(hours=hours),
+        ):
+            hass.states.set(entity_id, str(hours), attributes)
+            wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        metadata = StatisticsMeta(
+            statistic_id=entity_id,
+            source="recorder",
+            unit_of_measurement=TEMP_CELSIUS,
+            has_mean=True,
+            has_sum=False,
+        )
+        session.add(metadata)
+        session.flush()
+        for period_start, value in ((start, 10.0), (second_start, 20.0)):
+            session.add(
+                Statistics(
+                    metadata_id=metadata.id,
+                    start=period_start + timedelta(hours=1),
+                    mean=value,
+                    min=value - 5,
+                    max=value + 5,
+                )
+            )
+
+    hist = history.get_significant_states(
+        hass, start, end, entity_ids=[entity_id], point_budget=point_budget
+    )
+    assert hist == {
+        entity_id: [
+            {
+                "state": approx(10.0),
+                "last_changed": process_timestamp_to_utc_isoformat(start),
+                "min": approx(5.0),
+                "max": approx(15.0),
+            },
+            {
+                "state": approx(20.0),
+                "last_changed": process_timestamp_to_utc_isoformat(second_start),
+                "min": approx(15.0),
+                "max": approx(25.0),
+            },
+        ]
+    }
+
+    hist = history.get_significant_states(
+        hass,
+        start,
+        end,
+        entity_ids=[entity_id],
+        columnar_response=True,
+        point_budget=point_budget,
+    )
+    assert hist[entity_id]["last_changed"] == [
+        start.timestamp(),
+        second_start.timestamp(),
+    ]
+
+
 def test_get_significant_states_with_initial(hass_recorder):
     """Test that only significant states are returned.
 
@@ -441,3 +629,48 @@ def record_states(hass):
         )
 
     return zero, four, states
+
+
+def record_sensor_states(hass):
+    """Record some test states of sensors with and without statistics."""
+    mp = "media_player.test"
+    sns1 = "sensor.test1"
+    sns3 = "sensor.test3"
+    sns1_attr = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": TEMP_CELSIUS,
+    }
+    sns3_attr = {"device_class": "temperature"}
+
+    def set_state(entity_id, state, **kwargs):
+        """Set the state."""
+        hass.states.set(entity_id, state, **kwargs)
+        wait_recording_done(hass)
+        return hass.states.get(entity_id)
+
+    zero = dt_util.utcnow()
+    one = zero + timedelta(seconds=1 * 5)
+    two = one + timedelta(seconds=15 * 5)
+    three = two + timedelta(seconds=30 * 5)
+
+    states = {mp: [], sns1: [], sns3: []}
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=one):
+        states[mp].append(
+            set_state(mp, "idle", attributes={"media_title": str(sentinel.mt1)})
+        )
+        states[mp].append(
+            set_state(mp, "YouTube", attributes={"media_title": str(sentinel.mt2)})
+        )
+        states[sns1].append(set_state(sns1, "10", attributes=sns1_attr))
+        states[sns3].append(set_state(sns3, "10", attributes=sns3_attr))
+
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=two):
+        states[sns1].append(set_state(sns1, "15", attributes=sns1_attr))
+        states[sns3].append(set_state(sns3, "15", attributes=sns3_attr))
+
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=three):
+        states[sns1].append(set_state(sns1, "20", attributes=sns1_attr))
+        states[sns3].append(set_state(sns3, "20", attributes=sns3_attr))
+
+    return zero, states
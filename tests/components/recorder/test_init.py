@@ -30,7 +30,9 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
     process_timestamp,
 )
@@ -43,7 +45,7 @@ from homeassistant.const import (
     STATE_LOCKED,
     STATE_UNLOCKED,
 )
-from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util import dt as dt_util
 
@@ -123,7 +125,7 @@ async def test_state_gets_saved_when_set_before_start_event(
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 1
-        assert db_states[0].event_id > 0
+        assert db_states[0].event_id is None
 
 
 async def test_saving_state(
@@ -141,38 +143,138 @@ async def test_saving_state(
     await async_wait_recording_done(hass, instance)
 
     with session_scope(hass=hass) as session:
-        db_states = list(session.query(States))
+        db_states = []
+        for db_state, db_state_attributes in session.query(
+            States, StateAttributes
+        ).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        ):
+            db_states.append(db_state)
+            state = db_state.to_native()
+            state.attributes = db_state_attributes.to_native()
         assert len(db_states) == 1
-        assert db_states[0].event_id > 0
-        state = db_states[0].to_native()
+        assert db_states[0].event_id is None
 
-    assert state == _state_empty_context(hass, entity_id)
+    assert state == _state_with_context(hass, entity_id)
 
 
 async def test_saving_many_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
-    """Test we expire after many commits."""
+    """Test saving many states over multiple commits."""
     instance = await async_setup_recorder_instance(hass)
 
     entity_id = "test.recorder"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    with patch.object(
-        hass.data[DATA_INSTANCE].event_session, "expire_all"
-    ) as expire_all, patch.object(recorder, "EXPIRE_AFTER_COMMITS", 2):
-        for _ in range(3):
-            hass.states.async_set(entity_id, "on", attributes)
-            await async_wait_recording_done(hass, instance)
-            hass.states.async_set(entity_id, "off", attributes)
-            await async_wait_recording_done(hass, instance)
+    for _ in range(3):
+        hass.states.async_set(entity_id, "on", attributes)
+        await async_wait_recording_done(hass, instance)
+        hass.states.async_set(entity_id, "off", attributes)
+        await async_wait_recording_done(hass, instance)
 
-    assert expire_all.called
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 6
+        assert db_states[0].event_id is None
+        assert db_states[0].old_state_id is None
+        for old_db_state, db_state in zip(db_states, db_states[1:]):
+            assert db_state.old_state_id == old_db_state.state_id
+        last_state_id = db_states[-1].state_id
+
+    assert instance._old_states == {entity_id: last_state_id}
+    assert instance._pending_states == []
+    assert len(instance.event_session.identity_map) == 0
+
+
+async def test_saving_many_states_in_one_commit(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test old states are linked when an entity changes more than once per commit."""
+    instance = await async_setup_recorder_instance(hass)
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    for state in ("on", "off", "on"):
+        hass.states.async_set("test.recorder", state, attributes)
+        hass.states.async_set("test.recorder2", state, attributes)
+    hass.states.async_remove("test.recorder2")
+    hass.bus.async_fire("test_event", {"some": "data"})
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 7
+        assert len({db_state.attributes_id for db_state in db_states[:6]}) == 1
+        for entity_id in ("test.recorder", "test.recorder2"):
+            entity_db_states = [
+                db_state for db_state in db_states if db_state.entity_id == entity_id
+            ]
+            assert entity_db_states[0].old_state_id is None
+            for old_db_state, db_state in zip(entity_db_states, entity_db_states[1:]):
+                assert db_state.old_state_id == old_db_state.state_id
+        assert db_states[-1].state is None
+        assert (
+            session.query(Events).filter(Events.event_type == "test_event").count() == 1
+        )
+        last_state_id = db_states[4].state_id
+
+    assert instance._old_states == {"test.recorder": last_state_id}
+
+
+async def test_saving_state_deduplicates_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test identical attributes are only stored once."""
+    instance = await async_setup_recorder_instance(hass)
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    hass.states.async_set("test.recorder", "on", attributes)
+    hass.states.async_set("test.recorder2", "on", attributes)
+    await async_wait_recording_done(hass, instance)
+    hass.states.async_set("test.recorder", "off", attributes)
+    hass.states.async_set("test.recorder", "on", {"test_attr": 6})
+    await async_wait_recording_done(hass, instance)
 
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
-        assert len(db_states) == 6
-        assert db_states[0].event_id > 0
+        assert len(db_states) == 4
+        assert all(db_state.attributes is None for db_state in db_states)
+        db_state_attributes = list(session.query(StateAttributes))
+        assert len(db_state_attributes) == 2
+        assert {db_state.attributes_id for db_state in db_states} == {
+            db_attributes.attributes_id for db_attributes in db_state_attributes
+        }
+
+    assert len(instance._state_attributes_ids) == 2
+    assert instance._pending_state_attributes == {}
+
+
+async def test_saving_state_links_states_meta(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test each entity_id is stored once in the states_meta table."""
+    instance = await async_setup_recorder_instance(hass)
+
+    hass.states.async_set("test.recorder", "on")
+    hass.states.async_set("test.recorder", "off")
+    hass.states.async_set("test.recorder2", "on")
+    await async_wait_recording_done(hass, instance)
+    hass.states.async_set("test.recorder", "on")
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        metadata_ids = {
+            states_meta.entity_id: states_meta.metadata_id
+            for states_meta in session.query(StatesMeta)
+        }
+        assert set(metadata_ids) == {"test.recorder", "test.recorder2"}
+        for db_state in session.query(States):
+            assert db_state.metadata_id == metadata_ids[db_state.entity_id]
+
+    assert dict(instance._states_meta_ids.items()) == metadata_ids
+    assert instance._pending_states_meta == {}
 
 
 async def test_saving_state_with_intermixed_time_changes(
@@ -198,7 +300,7 @@ async def test_saving_state_with_intermixed_time_changes(
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 2
-        assert db_states[0].event_id > 0
+        assert db_states[0].event_id is None
 
 
 def test_saving_state_with_exception(hass, hass_recorder, caplog):
@@ -209,17 +311,14 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_in_objects(objects, *args, **kwargs):
+        if any(isinstance(obj, States) for obj in objects):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        "bulk_save_objects",
+        side_effect=_throw_if_state_in_objects,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -239,6 +338,55 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     assert "Error saving events" not in caplog.text
 
 
+def test_saving_state_retries_after_failed_commit(hass, hass_recorder, caplog):
+    """Test the pending rows are inserted again when the commit fails once."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    event_session = instance.event_session
+    commit = event_session.commit
+    failures = []
+
+    def _commit_fails_once():
+        if not failures:
+            failures.append(True)
+            raise OperationalError("commit", "fake params", "forced to fail")
+        return commit()
+
+    with patch("time.sleep"), patch.object(
+        event_session, "commit", side_effect=_commit_fails_once
+    ):
+        hass.states.set("test.recorder", "on", {"test_attr": 5})
+        hass.bus.fire("test_event", {"test": 1})
+        wait_recording_done(hass)
+
+    assert failures
+    assert "Error executing query" in caplog.text
+    assert "Error saving events" not in caplog.text
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].state == "on"
+        assert db_states[0].attributes_id is not None
+        assert db_states[0].metadata_id is not None
+        assert session.query(StateAttributes).count() == 1
+        assert session.query(StatesMeta).count() == 1
+        assert session.query(Events).filter_by(event_type="test_event").count() == 1
+        metadata_id = db_states[0].metadata_id
+        state_id = db_states[0].state_id
+
+    assert instance._old_states == {"test.recorder": state_id}
+    assert instance._states_meta_ids["test.recorder"] == metadata_id
+
+    # The next state links to the retried one
+    hass.states.set("test.recorder", "off", {"test_attr": 5})
+    wait_recording_done(hass)
+    with session_scope(hass=hass) as session:
+        db_state = session.query(States).filter(States.state == "off").one()
+        assert db_state.old_state_id == state_id
+        assert session.query(StateAttributes).count() == 1
+
+
 def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     """Test saving state when there is an SQLAlchemyError."""
     hass = hass_recorder()
@@ -247,17 +395,14 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_in_objects(objects, *args, **kwargs):
+        if any(isinstance(obj, States) for obj in objects):
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        "bulk_save_objects",
+        side_effect=_throw_if_state_in_objects,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -290,7 +435,7 @@ async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
 
     with patch.object(instance, "db_retry_wait", 0.2), patch.object(
         instance.event_session,
-        "flush",
+        "bulk_save_objects",
         side_effect=OperationalError(
             "insert the state", "fake params", "forced to fail"
         ),
@@ -364,7 +509,7 @@ def test_saving_state_with_commit_interval_zero(hass_recorder):
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 1
-        assert db_states[0].event_id > 0
+        assert db_states[0].event_id is None
 
 
 def _add_entities(hass, entity_ids):
@@ -375,7 +520,14 @@ def _add_entities(hass, entity_ids):
     wait_recording_done(hass)
 
     with session_scope(hass=hass) as session:
-        return [st.to_native() for st in session.query(States)]
+        states = []
+        for state, state_attributes in session.query(States, StateAttributes).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        ):
+            native_state = state.to_native()
+            native_state.attributes = state_attributes.to_native()
+            states.append(native_state)
+        return states
 
 
 def _add_events(hass, events):
@@ -389,12 +541,9 @@ def _add_events(hass, events):
         return [ev.to_native() for ev in session.query(Events)]
 
 
-def _state_empty_context(hass, entity_id):
-    # We don't restore context unless we need it by joining the
-    # events table on the event_id for state_changed events
-    state = hass.states.get(entity_id)
-    state.context = Context(id=None)
-    return state
+def _state_with_context(hass, entity_id):
+    # The context is stored on the states table
+    return hass.states.get(entity_id)
 
 
 # pylint: disable=redefined-outer-name,invalid-name
@@ -403,7 +552,7 @@ def test_saving_state_include_domains(hass_recorder):
     hass = hass_recorder({"include": {"domains": "test2"}})
     states = _add_entities(hass, ["test.recorder", "test2.recorder"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_state_include_domains_globs(hass_recorder):
@@ -415,8 +564,8 @@ def test_saving_state_include_domains_globs(hass_recorder):
         hass, ["test.recorder", "test2.recorder", "test3.included_entity"]
     )
     assert len(states) == 2
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
-    assert _state_empty_context(hass, "test3.included_entity") == states[1]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test3.included_entity") == states[1]
 
 
 def test_saving_state_incl_entities(hass_recorder):
@@ -424,7 +573,7 @@ def test_saving_state_incl_entities(hass_recorder):
     hass = hass_recorder({"include": {"entities": "test2.recorder"}})
     states = _add_entities(hass, ["test.recorder", "test2.recorder"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_event_exclude_event_type(hass_recorder):
@@ -453,7 +602,7 @@ def test_saving_state_exclude_domains(hass_recorder):
     hass = hass_recorder({"exclude": {"domains": "test"}})
     states = _add_entities(hass, ["test.recorder", "test2.recorder"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_state_exclude_domains_globs(hass_recorder):
@@ -465,7 +614,7 @@ def test_saving_state_exclude_domains_globs(hass_recorder):
         hass, ["test.recorder", "test2.recorder", "test2.excluded_entity"]
     )
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_state_exclude_entities(hass_recorder):
@@ -473,7 +622,7 @@ def test_saving_state_exclude_entities(hass_recorder):
     hass = hass_recorder({"exclude": {"entities": "test.recorder"}})
     states = _add_entities(hass, ["test.recorder", "test2.recorder"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_state_exclude_domain_include_entity(hass_recorder):
@@ -506,8 +655,8 @@ def test_saving_state_include_domain_exclude_entity(hass_recorder):
     )
     states = _add_entities(hass, ["test.recorder", "test2.recorder", "test.ok"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test.ok") == states[0]
-    assert _state_empty_context(hass, "test.ok").state == "state2"
+    assert _state_with_context(hass, "test.ok") == states[0]
+    assert _state_with_context(hass, "test.ok").state == "state2"
 
 
 def test_saving_state_include_domain_glob_exclude_entity(hass_recorder):
@@ -522,8 +671,8 @@ def test_saving_state_include_domain_glob_exclude_entity(hass_recorder):
         hass, ["test.recorder", "test2.recorder", "test.ok", "test2.included_entity"]
     )
     assert len(states) == 1
-    assert _state_empty_context(hass, "test.ok") == states[0]
-    assert _state_empty_context(hass, "test.ok").state == "state2"
+    assert _state_with_context(hass, "test.ok") == states[0]
+    assert _state_with_context(hass, "test.ok").state == "state2"
 
 
 def test_saving_state_and_removing_entity(hass, hass_recorder):
@@ -991,8 +1140,8 @@ def test_service_disable_states_not_recording(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 1
-        assert db_states[0].event_id > 0
-        assert db_states[0].to_native() == _state_empty_context(hass, "test.two")
+        assert db_states[0].event_id is None
+        assert db_states[0].to_native() == _state_with_context(hass, "test.two")
 
 
 def test_service_disable_run_information_recorded(tmpdir):
@@ -1091,7 +1240,7 @@ async def test_database_corruption_while_running(hass, tmpdir, caplog):
         with session_scope(hass=hass) as session:
             db_states = list(session.query(States))
             assert len(db_states) == 1
-            assert db_states[0].event_id > 0
+            assert db_states[0].event_id is None
             return db_states[0].to_native()
 
     state = await hass.async_add_executor_job(_get_last_state)
@@ -8,7 +8,7 @@ import threading
 from unittest.mock import ANY, Mock, PropertyMock, call, patch
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.exc import (
     DatabaseError,
     InternalError,
@@ -22,7 +22,7 @@ from homeassistant.bootstrap import async_setup_component
 from homeassistant.components import persistent_notification as pn, recorder
 from homeassistant.components.recorder import RecorderRuns, migration, models
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import States, StatesMeta
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.util.dt as dt_util
 
@@ -225,7 +225,7 @@ async def test_events_during_migration_queue_exhausted(hass):
     assert len(db_states) == 2
 
 
-@pytest.mark.parametrize("start_version", [0, 16, 18, 22])
+@pytest.mark.parametrize("start_version", [0, 16, 18, 22, 24, 26])
 async def test_schema_migrate(hass, start_version):
     """Test the full schema migration logic.
 
@@ -306,6 +306,68 @@ async def test_schema_migrate(hass, start_version):
         assert recorder.util.async_migration_in_progress(hass) is not True
 
 
+async def test_migrate_states_meta(hass):
+    """Test the states of a schema 26 database are linked to states_meta."""
+
+    def _create_engine_test(*args, **kwargs):
+        """Test version of create_engine that initializes with schema 26."""
+        module = "tests.components.recorder.models_schema_26"
+        importlib.import_module(module)
+        old_models = sys.modules[module]
+        engine = create_engine(*args, **kwargs)
+        old_models.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(recorder.models.SchemaChanges(schema_version=26))
+            for entity_id, state in (
+                ("sensor.one", "1"),
+                ("sensor.two", "2"),
+                ("sensor.one", "3"),
+                (None, None),
+            ):
+                session.add(old_models.States(entity_id=entity_id, state=state))
+            session.commit()
+        return engine
+
+    def _get_states_meta():
+        with session_scope(hass=hass) as session:
+            metadata_ids = {
+                meta.entity_id: meta.metadata_id for meta in session.query(StatesMeta)
+            }
+            states = [
+                (state.entity_id, state.metadata_id)
+                for state in session.query(States).order_by(States.state_id)
+            ]
+            indexes = {
+                index["name"]
+                for index in inspect(session.connection()).get_indexes("states")
+            }
+            tables = inspect(session.connection()).get_table_names()
+            return metadata_ids, states, indexes, tables
+
+    with patch(
+        "homeassistant.components.recorder.create_engine", new=_create_engine_test
+    ), patch.object(migration, "MIGRATION_BATCH_SIZE", 2):
+        await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": "sqlite://"}}
+        )
+        await async_wait_recording_done_without_instance(hass)
+
+    metadata_ids, states, indexes, tables = await hass.async_add_executor_job(
+        _get_states_meta
+    )
+    # States written while the migration runs may add their own entity_ids
+    assert {"sensor.one", "sensor.two"} <= metadata_ids.keys()
+    assert states[:4] == [
+        ("sensor.one", metadata_ids["sensor.one"]),
+        ("sensor.two", metadata_ids["sensor.two"]),
+        ("sensor.one", metadata_ids["sensor.one"]),
+        (None, None),
+    ]
+    assert "ix_states_metadata_id_last_updated" in indexes
+    assert "ix_states_entity_id_last_updated" in indexes
+    assert "purge_runs" in tables
+
+
 def test_invalid_update():
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
@@ -347,7 +409,7 @@ def test_forgiving_add_index():
     engine = create_engine("sqlite://", poolclass=StaticPool)
     models.Base.metadata.create_all(engine)
     with Session(engine) as session:
-        migration._create_index(session, "states", "ix_states_context_id")
+        migration._create_index(session.connection(), "states", "ix_states_context_id")
 
 
 @pytest.mark.parametrize(
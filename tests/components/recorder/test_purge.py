@@ -12,12 +12,20 @@ from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
 from homeassistant.components.recorder.models import (
     Events,
+    PurgeRuns,
     RecorderRuns,
+    StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
     StatisticsShortTerm,
+    process_timestamp,
+)
+from homeassistant.components.recorder.purge import (
+    MIN_ROWS_TO_PURGE,
+    _adapt_batch_size,
+    purge_old_data,
 )
-from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant
@@ -48,16 +56,23 @@ async def test_purge_old_states(
         assert states[0].old_state_id is None
         assert states[-1].old_state_id == states[-2].state_id
 
+        # state changes are recorded in the states table only
         events = session.query(Events).filter(Events.event_type == "state_changed")
-        assert events.count() == 6
+        assert events.count() == 0
         assert "test.recorder2" in instance._old_states
 
+        # all states share the same attributes
+        state_attributes = session.query(StateAttributes)
+        assert state_attributes.count() == 1
+        assert len(instance._state_attributes_ids) == 1
+
         purge_before = dt_util.utcnow() - timedelta(days=4)
 
         # run purge_old_data()
         finished = purge_old_data(instance, purge_before, repack=False)
         assert not finished
         assert states.count() == 2
+        assert state_attributes.count() == 1
         assert "test.recorder2" in instance._old_states
 
         states_after_purge = session.query(States)
@@ -74,7 +89,9 @@ async def test_purge_old_states(
         finished = purge_old_data(instance, purge_before, repack=False)
         assert not finished
         assert states.count() == 0
+        assert state_attributes.count() == 0
         assert "test.recorder2" not in instance._old_states
+        assert len(instance._state_attributes_ids) == 0
 
     # Add some more states
     await _add_test_states(hass, instance)
@@ -87,7 +104,7 @@ async def test_purge_old_states(
         assert states[-1].old_state_id == states[-2].state_id
 
         events = session.query(Events).filter(Events.event_type == "state_changed")
-        assert events.count() == 6
+        assert events.count() == 0
         assert "test.recorder2" in instance._old_states
 
 
@@ -209,6 +226,133 @@ async def test_purge_old_events(
         assert events.count() == 2
 
 
+async def test_purge_legacy_state_changed_events(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging events which states recorded before schema 26 refer to."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    utcnow = dt_util.utcnow()
+    five_days_ago = utcnow - timedelta(days=5)
+    three_days_ago = utcnow - timedelta(days=3)
+
+    with session_scope(hass=hass) as session:
+        states_meta = _get_or_add_states_meta(session, "sensor.legacy")
+        for timestamp in (five_days_ago, three_days_ago):
+            session.add(
+                States(
+                    entity_id="sensor.legacy",
+                    domain="sensor",
+                    state="on",
+                    attributes="{}",
+                    last_changed=timestamp,
+                    last_updated=timestamp,
+                    states_meta=states_meta,
+                    # The state changed events of old states are older
+                    # than the purge target even when the state is not
+                    event=Events(
+                        event_type=EVENT_STATE_CHANGED,
+                        event_data="{}",
+                        origin="LOCAL",
+                        time_fired=five_days_ago,
+                    ),
+                )
+            )
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        events = session.query(Events).filter(Events.event_type == EVENT_STATE_CHANGED)
+        assert states.count() == 2
+        assert events.count() == 2
+
+        purge_before = utcnow - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+
+        assert events.count() == 0
+        remaining_state = states.one()
+        assert remaining_state.last_updated == three_days_ago.replace(tzinfo=None)
+        assert remaining_state.event_id is None
+
+
+async def test_purge_old_data_tracks_purge_run(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the progress of a purge is stored with each batch."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass, instance)
+    await _add_test_events(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        purge_run = session.query(PurgeRuns).one()
+        assert process_timestamp(purge_run.purge_before) == purge_before
+        assert purge_run.end is None
+        assert purge_run.states_purged == 4
+        assert purge_run.events_purged == 4
+        assert MIN_ROWS_TO_PURGE <= purge_run.batch_size <= MAX_ROWS_TO_PURGE
+
+        # A new purge request takes over the unfinished run
+        purge_before = purge_before + timedelta(seconds=1)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        purge_run = session.query(PurgeRuns).one()
+        assert process_timestamp(purge_run.purge_before) == purge_before
+        assert purge_run.end is not None
+        assert purge_run.states_purged == 4
+
+        # Finished runs are purged with the recorder runs
+        finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+        assert not finished
+        finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+        assert finished
+        purge_run = session.query(PurgeRuns).one()
+        assert purge_run.end is not None
+        assert purge_run.states_purged == 2
+
+
+async def test_resume_unfinished_purge(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test an unfinished purge run is resumed when the recorder starts."""
+    instance = await async_setup_recorder_instance(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with session_scope(hass=hass) as session:
+        session.add(
+            PurgeRuns(
+                purge_before=purge_before,
+                repack=False,
+                apply_filter=True,
+                batch_size=MAX_ROWS_TO_PURGE,
+            )
+        )
+
+    with session_scope(hass=hass) as session, patch.object(
+        instance, "queue"
+    ) as queue_mock:
+        instance._schedule_unfinished_purge(session)
+    queue_mock.put.assert_called_once_with(PurgeTask(purge_before, False, True))
+
+
+def test_adapt_batch_size():
+    """Test the purge batch size follows the duration of a batch."""
+    # Fast batches grow the batch size, up to the maximum
+    assert _adapt_batch_size(200, 0.05) == 400
+    assert _adapt_batch_size(800, 0) == MAX_ROWS_TO_PURGE
+    # Slow batches shrink the batch size, down to the minimum
+    assert _adapt_batch_size(800, 0.8) == 500
+    assert _adapt_batch_size(800, 60) == 400
+    assert _adapt_batch_size(MIN_ROWS_TO_PURGE, 60) == MIN_ROWS_TO_PURGE
+
+
 async def test_purge_old_recorder_runs(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -363,6 +507,7 @@ async def test_purge_edge_case(
             session.add(
                 States(
                     entity_id="test.recorder2",
+                    states_meta=_get_or_add_states_meta(session, "test.recorder2"),
                     domain="sensor",
                     state="purgeme",
                     attributes="{}",
@@ -423,6 +568,7 @@ async def test_purge_cutoff_date(
             session.add(
                 States(
                     entity_id="test.cutoff",
+                    states_meta=_get_or_add_states_meta(session, "test.cutoff"),
                     domain="sensor",
                     state="keep",
                     attributes="{}",
@@ -446,6 +592,7 @@ async def test_purge_cutoff_date(
                 session.add(
                     States(
                         entity_id="test.cutoff",
+                        states_meta=_get_or_add_states_meta(session, "test.cutoff"),
                         domain="sensor",
                         state="purge",
                         attributes="{}",
@@ -514,6 +661,7 @@ async def test_purge_filtered_states(
             session.add(
                 States(
                     entity_id="sensor.excluded",
+                    states_meta=_get_or_add_states_meta(session, "sensor.excluded"),
                     domain="sensor",
                     state="purgeme",
                     attributes="{}",
@@ -536,6 +684,9 @@ async def test_purge_filtered_states(
             timestamp = dt_util.utcnow() - timedelta(days=0)
             state_1 = States(
                 entity_id="sensor.linked_old_state_id",
+                states_meta=_get_or_add_states_meta(
+                    session, "sensor.linked_old_state_id"
+                ),
                 domain="sensor",
                 state="keep",
                 attributes="{}",
@@ -547,6 +698,9 @@ async def test_purge_filtered_states(
             timestamp = dt_util.utcnow() - timedelta(days=4)
             state_2 = States(
                 entity_id="sensor.linked_old_state_id",
+                states_meta=_get_or_add_states_meta(
+                    session, "sensor.linked_old_state_id"
+                ),
                 domain="sensor",
                 state="keep",
                 attributes="{}",
@@ -557,6 +711,9 @@ async def test_purge_filtered_states(
             )
             state_3 = States(
                 entity_id="sensor.linked_old_state_id",
+                states_meta=_get_or_add_states_meta(
+                    session, "sensor.linked_old_state_id"
+                ),
                 domain="sensor",
                 state="keep",
                 attributes="{}",
@@ -753,6 +910,9 @@ async def test_purge_filtered_events_state_changed(
             timestamp = dt_util.utcnow() - timedelta(days=0)
             state_1 = States(
                 entity_id="sensor.linked_old_state_id",
+                states_meta=_get_or_add_states_meta(
+                    session, "sensor.linked_old_state_id"
+                ),
                 domain="sensor",
                 state="keep",
                 attributes="{}",
@@ -764,6 +924,9 @@ async def test_purge_filtered_events_state_changed(
             timestamp = dt_util.utcnow() - timedelta(days=4)
             state_2 = States(
                 entity_id="sensor.linked_old_state_id",
+                states_meta=_get_or_add_states_meta(
+                    session, "sensor.linked_old_state_id"
+                ),
                 domain="sensor",
                 state="keep",
                 attributes="{}",
@@ -774,6 +937,9 @@ async def test_purge_filtered_events_state_changed(
             )
             state_3 = States(
                 entity_id="sensor.linked_old_state_id",
+                states_meta=_get_or_add_states_meta(
+                    session, "sensor.linked_old_state_id"
+                ),
                 domain="sensor",
                 state="keep",
                 attributes="{}",
@@ -902,6 +1068,10 @@ async def test_purge_entities(
         )
         assert states_sensor_kept.count() == 10
 
+        # The metadata of the purged entities is removed as well
+        states_meta = session.query(StatesMeta)
+        assert [meta.entity_id for meta in states_meta] == ["sensor.keep"]
+
     _add_purge_records(hass)
 
     # Confirm each parameter purges only the associated records
@@ -1078,6 +1248,17 @@ async def _add_test_statistics_runs(hass: HomeAssistant, instance: recorder.Reco
             )
 
 
+def _get_or_add_states_meta(session: Session, entity_id: str) -> StatesMeta:
+    """Return the states metadata of entity_id, adding it if needed."""
+    if states_meta := (
+        session.query(StatesMeta).filter(StatesMeta.entity_id == entity_id).first()
+    ):
+        return states_meta
+    states_meta = StatesMeta(entity_id=entity_id)
+    session.add(states_meta)
+    return states_meta
+
+
 def _add_state_and_state_changed_event(
     session: Session,
     entity_id: str,
@@ -1089,6 +1270,7 @@ def _add_state_and_state_changed_event(
     session.add(
         States(
             entity_id=entity_id,
+            states_meta=_get_or_add_states_meta(session, entity_id),
             domain="sensor",
             state=state,
             attributes="{}",
@@ -15,6 +15,8 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import SQLITE_URL_PREFIX, history, statistics
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    Statistics,
+    StatisticsMeta,
     StatisticsShortTerm,
     process_timestamp_to_utc_isoformat,
 )
@@ -118,6 +120,105 @@ def test_compile_hourly_statistics(hass_recorder):
     assert stats == {}
 
 
+@pytest.mark.parametrize("db_supports_row_number", (True, False))
+def test_compile_hourly_statistics_rollup(hass_recorder, db_supports_row_number):
+    """Test the hourly rollup matches the summary computed in Python."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    wait_recording_done(hass)
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=2
+    )
+    last_reset = zero - timedelta(days=1)
+
+    def metadata(statistic_id, has_mean, has_sum):
+        return StatisticsMeta.from_meta(
+            {
+                "has_mean": has_mean,
+                "has_sum": has_sum,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": statistic_id,
+                "unit_of_measurement": "kWh",
+            }
+        )
+
+    with session_scope(hass=hass) as session:
+        mean_meta = metadata("sensor.mean", True, False)
+        sum_meta = metadata("sensor.sum", False, True)
+        partial_meta = metadata("sensor.partial", True, False)
+        session.add_all((mean_meta, sum_meta, partial_meta))
+        session.flush()
+        mean_id, sum_id, partial_id = mean_meta.id, sum_meta.id, partial_meta.id
+        # Include periods before and after the compiled hour
+        for idx in range(-1, 13):
+            start = zero + timedelta(minutes=5 * idx)
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    mean_id,
+                    {"start": start, "mean": idx, "min": idx - 1, "max": idx * 2},
+                )
+            )
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    sum_id,
+                    {
+                        "start": start,
+                        "last_reset": last_reset,
+                        "state": idx * 10,
+                        "sum": idx * 100,
+                    },
+                )
+            )
+            if 2 <= idx < 6:
+                session.add(
+                    StatisticsShortTerm.from_stats(
+                        partial_id,
+                        {"start": start, "mean": -idx, "min": -idx, "max": -idx},
+                    )
+                )
+
+    def compile_hour(supports_row_number):
+        instance._db_supports_row_number = supports_row_number
+        with session_scope(hass=hass) as session:
+            statistics.compile_hourly_statistics(instance, session, zero)
+        with session_scope(hass=hass) as session:
+            rows = [
+                (
+                    row.metadata_id,
+                    process_timestamp_to_utc_isoformat(row.start),
+                    row.mean,
+                    row.min,
+                    row.max,
+                    process_timestamp_to_utc_isoformat(row.last_reset),
+                    row.state,
+                    row.sum,
+                )
+                for row in session.query(Statistics).order_by(Statistics.metadata_id)
+            ]
+            session.query(Statistics).delete()
+        return rows
+
+    rows = compile_hour(db_supports_row_number)
+    assert rows == compile_hour(not db_supports_row_number)
+
+    start = process_timestamp_to_utc_isoformat(zero)
+    assert rows == [
+        (mean_id, start, approx(5.5), -1.0, 22.0, None, None, None),
+        (
+            sum_id,
+            start,
+            None,
+            None,
+            None,
+            process_timestamp_to_utc_isoformat(last_reset),
+            110.0,
+            1100.0,
+        ),
+        (partial_id, start, approx(-3.5), -5.0, -2.0, None, None, None),
+    ]
+
+
 @pytest.fixture
 def mock_sensor_statistics():
     """Generate some fake statistics."""
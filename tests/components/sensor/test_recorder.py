@@ -21,6 +21,7 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor.recorder import STATE_BUFFER, compile_statistics
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
@@ -138,6 +139,66 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_from_state_buffer(hass_recorder):
+    """Test compiling statistics from the states buffered by the recorder."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)
+    zero = dt_util.utcnow()
+    start = zero + timedelta(minutes=1)
+    end = start + timedelta(minutes=5)
+    power_attributes = dict(POWER_SENSOR_ATTRIBUTES)
+
+    def set_state(point_in_time, entity_id, state, attributes):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=point_in_time,
+        ):
+            hass.states.set(entity_id, state, attributes=attributes)
+        wait_recording_done(hass)
+
+    set_state(zero, "sensor.power", "10", power_attributes)
+    set_state(zero, "sensor.energy", "100", ENERGY_SENSOR_ATTRIBUTES)
+    set_state(zero, "sensor.unchanged", "5", POWER_SENSOR_ATTRIBUTES)
+    set_state(start + timedelta(minutes=1), "sensor.power", "20", power_attributes)
+    set_state(
+        start + timedelta(minutes=1), "sensor.energy", "110", ENERGY_SENSOR_ATTRIBUTES
+    )
+    # Attribute changes are not significant for the mean, min and max
+    power_attributes["friendly_name"] = "Power"
+    set_state(start + timedelta(minutes=2), "sensor.power", "20", power_attributes)
+    set_state(start + timedelta(minutes=3), "sensor.power", "30", power_attributes)
+    set_state(
+        start + timedelta(minutes=3), "sensor.energy", "105", ENERGY_SENSOR_ATTRIBUTES
+    )
+
+    with patch.object(
+        history,
+        "get_significant_states_with_session",
+        wraps=history.get_significant_states_with_session,
+    ) as mock_history:
+        buffered = compile_statistics(hass, start, end)
+        assert len(mock_history.mock_calls) == 0
+
+        # The states before the buffer was started are read from the database
+        earlier = compile_statistics(
+            hass, zero - timedelta(minutes=5), zero + timedelta(minutes=1)
+        )
+        assert len(mock_history.mock_calls) == 2
+        assert {
+            result["meta"]["statistic_id"]: result["stat"].get("max")
+            for result in earlier
+        } == {"sensor.power": 10000, "sensor.energy": None, "sensor.unchanged": 5000}
+
+    hass.data.pop(STATE_BUFFER)
+    assert buffered == compile_statistics(hass, start, end)
+    assert {result["meta"]["statistic_id"] for result in buffered} == {
+        "sensor.power",
+        "sensor.energy",
+        "sensor.unchanged",
+    }
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit",
     [
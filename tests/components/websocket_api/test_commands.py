@@ -585,15 +585,15 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
-async def test_get_states_not_allows_nan(hass, websocket_client):
-    """Test get_states command not allows NaN floats."""
+async def test_get_states_encodes_nan_as_null(hass, websocket_client):
+    """Test get_states command encodes NaN floats as null."""
     hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
 
     await websocket_client.send_json({"id": 5, "type": "get_states"})
 
     msg = await websocket_client.receive_json()
-    assert not msg["success"]
-    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+    assert msg["success"]
+    assert msg["result"][0]["attributes"] == {"hello": None}
 
 
 async def test_subscribe_unsubscribe_events_whitelist(
@@ -659,6 +659,185 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe entities sends a snapshot and then only state diffs."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.other": True}}}
+    )
+    context = Context()
+    hass.states.async_set("light.permitted", "off", {"color": "red"}, context=context)
+    hass.states.async_set("light.not_permitted", "off")
+    state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red"},
+                "c": context.id,
+                "lc": state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "off", {"color": "red", "effect": "x"})
+    msg = await websocket_client.receive_json()
+    state = hass.states.get("light.permitted")
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"effect": "x"},
+                    "c": state.context.id,
+                    "lu": state.last_updated.timestamp(),
+                }
+            }
+        }
+    }
+
+    context = Context(user_id=hass_admin_user.id)
+    hass.states.async_set("light.permitted", "on", {"effect": "x"}, context=context)
+    msg = await websocket_client.receive_json()
+    state = hass.states.get("light.permitted")
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "c": {
+                        "id": context.id,
+                        "parent_id": None,
+                        "user_id": context.user_id,
+                    },
+                    "lc": state.last_changed.timestamp(),
+                },
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+    hass.states.async_remove("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+    hass.states.async_set("light.other", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.other"]["s"] == "on"
+
+
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribe entities limited to some entities."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.ignored", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.ignored", "on")
+    hass.states.async_set("light.permitted", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.permitted"]["+"]["s"] == "on"
+
+
+async def test_subscribe_events_with_entity_filter(hass, websocket_client):
+    """Test subscribe state_changed events filtered by entity, domain and glob."""
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "entity_ids": ["switch.wanted"],
+            "domains": "light",
+            "entity_globs": ["sensor.*_temperature"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+
+    for entity_id in (
+        "switch.ignored",
+        "switch.wanted",
+        "sensor.kitchen_humidity",
+        "sensor.kitchen_temperature",
+        "light.bowl",
+    ):
+        hass.states.async_set(entity_id, "on")
+
+    received = []
+    for _ in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        received.append(msg["event"]["data"]["entity_id"])
+    assert received == ["switch.wanted", "sensor.kitchen_temperature", "light.bowl"]
+
+
+async def test_subscribe_events_entity_filter_requires_state_changed(
+    hass, websocket_client
+):
+    """Test entity filters are refused for other events than state_changed."""
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "test_event",
+            "domains": ["light"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
+async def test_subscribe_entities_with_domains_and_globs(hass, websocket_client):
+    """Test subscribe entities limited by domain and glob."""
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("sensor.kitchen_temperature", "20")
+    hass.states.async_set("sensor.kitchen_humidity", "50")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "domains": ["light"],
+            "entity_globs": ["sensor.*_temperature"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.bowl", "sensor.kitchen_temperature"}
+
+    hass.states.async_set("sensor.kitchen_humidity", "51")
+    hass.states.async_set("sensor.hall_temperature", "19")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["sensor.hall_temperature"]["s"] == "19"
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
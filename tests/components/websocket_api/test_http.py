@@ -67,6 +67,59 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+@pytest.fixture
+async def websocket_client_handler(hass, hass_ws_client):
+    """Return a websocket client and the handler of its connection."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    return websocket_client, instance
+
+
+async def test_coalesce_messages(hass, websocket_client_handler):
+    """Test queued messages are sent in one frame if the client supports it."""
+    websocket_client, instance = websocket_client_handler
+
+    for idx in range(3):
+        instance._send_message({"id": idx, "type": "pong"})
+    for idx in range(3):
+        assert await websocket_client.receive_json() == {"id": idx, "type": "pong"}
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+
+    for idx in range(3):
+        instance._send_message({"id": idx, "type": "pong"})
+    assert await websocket_client.receive_json() == [
+        {"id": 0, "type": "pong"},
+        {"id": 1, "type": "pong"},
+        {"id": 2, "type": "pong"},
+    ]
+
+    # A single queued message is not wrapped
+    await websocket_client.send_json({"id": 6, "type": "ping"})
+    assert await websocket_client.receive_json() == {"id": 6, "type": "pong"}
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
@@ -1,4 +1,5 @@
 """Test Websocket API messages module."""
+import json
 
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
@@ -78,18 +79,63 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_changed_event_message(hass):
+    """Test state changed event messages reuse the state JSON."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "off")
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+    for event in events:
+        message = json.loads(cached_event_message(5, event))
+        expected = json.loads(
+            message_to_json({"id": 5, "type": "event", "event": event})
+        )
+        assert message == expected
+
+    new_state = events[1].data["new_state"]
+    assert new_state.as_dict_json in cached_event_message(5, events[1])
+
+
+async def test_cached_state_changed_event_message_unserializable(hass, caplog):
+    """Test state changed event messages with attributes that cannot be serialized."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"bad": _Unserializeable()})
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+    message = json.loads(cached_event_message(5, events[0]))
+    assert message["error"]["code"] == "unknown_error"
+    assert "Unable to serialize to JSON" in caplog.text
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
     json_str = message_to_json({"id": 1, "message": "xyz"})
 
-    assert json_str == '{"id": 1, "message": "xyz"}'
+    assert json_str == '{"id":1,"message":"xyz"}'
 
     json_str2 = message_to_json({"id": 1, "message": _Unserializeable()})
 
     assert (
         json_str2
-        == '{"id": 1, "type": "result", "success": false, "error": {"code": "unknown_error", "message": "Invalid JSON in response"}}'
+        == '{"id":1,"type":"result","success":false,"error":{"code":"unknown_error","message":"Invalid JSON in response"}}'
     )
     assert "Unable to serialize to JSON" in caplog.text
 
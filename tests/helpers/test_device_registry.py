@@ -1,6 +1,6 @@
 """Tests for the Device Registry."""
 import time
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 
@@ -310,6 +310,7 @@ async def test_migration_1_1_to_1_3(hass, hass_storage):
         "version": device_registry.STORAGE_VERSION_MAJOR,
         "minor_version": device_registry.STORAGE_VERSION_MINOR,
         "key": device_registry.STORAGE_KEY,
+        "journal": ANY,
         "data": {
             "devices": [
                 {
@@ -367,6 +368,7 @@ async def test_migration_1_2_to_1_3(hass, hass_storage):
         "version": 1,
         "minor_version": 2,
         "key": device_registry.STORAGE_KEY,
+        "journal": ANY,
         "data": {
             "devices": [
                 {
@@ -435,6 +437,7 @@ async def test_migration_1_2_to_1_3(hass, hass_storage):
         "version": device_registry.STORAGE_VERSION_MAJOR,
         "minor_version": device_registry.STORAGE_VERSION_MINOR,
         "key": device_registry.STORAGE_KEY,
+        "journal": ANY,
         "data": {
             "devices": [
                 {
@@ -941,6 +944,42 @@ async def test_update(registry):
     assert registry.async_get(updated_entry.id) is not None
 
 
+async def test_entries_lookups_follow_updates(registry):
+    """Test that devices are looked up by their current area and config entries."""
+    entry1 = registry.async_get_or_create(
+        config_entry_id="1234", identifiers={("hue", "1")}
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="1234", identifiers={("hue", "2")}
+    )
+    entry1 = registry.async_update_device(entry1.id, area_id="kitchen")
+    entry2 = registry.async_update_device(entry2.id, area_id="kitchen")
+
+    assert device_registry.async_entries_for_area(registry, "kitchen") == [
+        entry1,
+        entry2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == [
+        entry1,
+        entry2,
+    ]
+
+    entry1 = registry.async_get_or_create(
+        config_entry_id="5678", identifiers={("hue", "1")}
+    )
+    entry2 = registry.async_update_device(
+        entry2.id, area_id="hallway", remove_config_entry_id="1234"
+    )
+    assert device_registry.async_entries_for_area(registry, "kitchen") == [entry1]
+    assert device_registry.async_entries_for_area(registry, "hallway") == []
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == [entry1]
+    assert device_registry.async_entries_for_config_entry(registry, "5678") == [entry1]
+
+    registry.async_remove_device(entry1.id)
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == []
+
+
 async def test_update_remove_config_entries(hass, registry, update_events):
     """Make sure we do not get duplicate entries."""
     entry = registry.async_get_or_create(
@@ -10,6 +10,7 @@ import pytest
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -20,6 +21,7 @@ from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    async_capture_events,
     get_test_home_assistant,
     mock_registry,
 )
@@ -574,6 +576,45 @@ async def test_set_context_expired(hass):
     assert ent._context_set is None
 
 
+async def test_batch_state_writes(hass):
+    """Test batching the state writes of entities."""
+    context = Context()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.hass = hass
+        ent.entity_id = f"hello.world_{idx}"
+        entities.append(ent)
+    entities[2].async_set_context(context)
+
+    with entity.async_batch_state_writes(hass):
+        for ent in entities:
+            ent.async_write_ha_state()
+        with entity.async_batch_state_writes(hass):
+            entities[0]._attr_state = "nested"
+            entities[0].async_write_ha_state()
+        assert hass.states.async_entity_ids() == []
+
+    states = [hass.states.get(ent.entity_id) for ent in entities]
+    assert [state.state for state in states] == ["nested", STATE_UNKNOWN, STATE_UNKNOWN]
+    assert len({state.last_updated for state in states}) == 1
+    assert states[0].context is states[1].context
+    assert states[2].context is context
+
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in events] == [
+        "hello.world_0",
+        "hello.world_1",
+        "hello.world_2",
+        "hello.world_0",
+    ]
+
+    entities[1]._attr_state = "unbatched"
+    entities[1].async_write_ha_state()
+    assert hass.states.get("hello.world_1").state == "unbatched"
+
+
 async def test_warn_disabled(hass, caplog):
     """Test we warn once if we write to a disabled entity."""
     entry = entity_registry.RegistryEntry(
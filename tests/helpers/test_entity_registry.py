@@ -239,6 +239,33 @@ async def test_loading_saving_data(hass, registry):
     assert new_entry2.unit_of_measurement == "initial-unit_of_measurement"
 
 
+async def test_saving_changed_entries_to_journal(hass, hass_storage):
+    """Test that changes to single entries are journaled once saved."""
+    registry = er.async_get(hass)
+    entry1 = registry.async_get_or_create("light", "hue", "1234")
+    entry2 = registry.async_get_or_create("light", "hue", "5678")
+    await flush_store(registry._store)
+    generation = hass_storage[er.STORAGE_KEY]["journal"]
+
+    with patch.object(
+        registry._store, "_write_journal", wraps=registry._store._write_journal
+    ) as mock_write_journal:
+        registry.async_update_entity(entry1.entity_id, name="Renamed")
+        registry.async_remove(entry2.entity_id)
+        await flush_store(registry._store)
+
+    records = mock_write_journal.mock_calls[0][1][2]
+    assert {(record["id"], record["record"] is None) for record in records} == {
+        (entry1.id, False),
+        (entry2.id, True),
+    }
+    assert hass_storage[er.STORAGE_KEY]["journal"] == generation
+    assert [
+        (entity["id"], entity["name"])
+        for entity in hass_storage[er.STORAGE_KEY]["data"]["entities"]
+    ] == [(entry1.id, "Renamed")]
+
+
 def test_generate_entity_considers_registered_entities(registry):
     """Test that we don't create entity id that are already registered."""
     entry = registry.async_get_or_create("light", "hue", "1234")
@@ -1012,6 +1039,41 @@ async def test_disabled_entities_excluded_from_entity_list(hass, registry):
     assert entries == [entry1, entry2]
 
 
+async def test_entries_lookups_follow_updates(registry):
+    """Test that entries are looked up by their current attributes."""
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", area_id="kitchen", device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", area_id="kitchen", device_id="device-1"
+    )
+    entry3 = registry.async_get_or_create("sensor", "zha", "9012")
+
+    assert er.async_entries_for_area(registry, "kitchen") == [entry1, entry2]
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+    assert er.async_entries_for_platform(registry, "hue") == [entry1, entry2]
+    assert er.async_entries_for_platform(registry, "zha") == [entry3]
+
+    # Updating an entry keeps it in place, moving it adds it at the end
+    entry1 = registry.async_update_entity(entry1.entity_id, name="Renamed")
+    entry3 = registry.async_update_entity(entry3.entity_id, area_id="kitchen")
+    assert er.async_entries_for_area(registry, "kitchen") == [entry1, entry2, entry3]
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+
+    entry1 = registry.async_update_entity(
+        entry1.entity_id, new_entity_id="light.renamed", area_id="hallway"
+    )
+    entry2 = registry.async_update_entity(entry2.entity_id, device_id=None)
+    assert er.async_entries_for_area(registry, "kitchen") == [entry2, entry3]
+    assert er.async_entries_for_area(registry, "hallway") == [entry1]
+    assert er.async_entries_for_device(registry, "device-1") == [entry1]
+
+    registry.async_remove(entry1.entity_id)
+    assert er.async_entries_for_area(registry, "hallway") == []
+    assert er.async_entries_for_device(registry, "device-1") == []
+    assert er.async_entries_for_platform(registry, "hue") == [entry2]
+
+
 async def test_entity_max_length_exceeded(hass, registry):
     """Test that an exception is raised when the max character length is exceeded."""
 
@@ -27,6 +27,7 @@ from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
     async_track_state_change_filtered,
+    async_track_state_change_matching,
     async_track_state_removed_domain,
     async_track_sunrise,
     async_track_sunset,
@@ -532,6 +533,86 @@ async def test_async_track_state_change_event_with_empty_list(hass):
     unsub_single()
 
 
+async def test_async_track_state_change_matching(hass):
+    """Test tracking state changes by entity_id, domain and glob."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("sensor.kitchen_temperature", "20")
+    hass.states.async_set("sensor.kitchen_humidity", "50")
+    hass.states.async_set("switch.other", "on")
+    changes = []
+
+    @ha.callback
+    def _record(event):
+        changes.append((event.data["entity_id"], event.data["new_state"]))
+
+    unsub = async_track_state_change_matching(
+        hass, ["switch.explicit"], ["light"], ["sensor.*_temperature"], _record
+    )
+
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("sensor.kitchen_temperature", "21")
+    hass.states.async_set("sensor.kitchen_humidity", "51")
+    hass.states.async_set("switch.other", "off")
+    await hass.async_block_till_done()
+    assert [entity_id for entity_id, _ in changes] == [
+        "light.bowl",
+        "sensor.kitchen_temperature",
+    ]
+
+    # Added entities are tracked once, removals are forwarded
+    changes.clear()
+    hass.states.async_set("light.new", "on")
+    hass.states.async_set("switch.explicit", "on")
+    hass.states.async_set("sensor.hall_temperature", "19")
+    hass.states.async_set("sensor.hall_pressure", "1000")
+    await hass.async_block_till_done()
+    hass.states.async_set("light.new", "off")
+    hass.states.async_remove("sensor.hall_temperature")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.hall_temperature", "18")
+    await hass.async_block_till_done()
+    assert [(entity_id, state and state.state) for entity_id, state in changes] == [
+        ("light.new", "on"),
+        ("switch.explicit", "on"),
+        ("sensor.hall_temperature", "19"),
+        ("light.new", "off"),
+        ("sensor.hall_temperature", None),
+        ("sensor.hall_temperature", "18"),
+    ]
+
+    changes.clear()
+    unsub()
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.another", "on")
+    hass.states.async_set("sensor.hall_temperature", "17")
+    await hass.async_block_till_done()
+    assert changes == []
+
+
+async def test_async_track_state_change_matching_glob_domains(hass):
+    """Test globs with a wildcard domain match entities of every domain."""
+    changes = []
+
+    @ha.callback
+    def _record(event):
+        changes.append(event.data["entity_id"])
+
+    unsub = async_track_state_change_matching(hass, [], [], ["*.kitchen_*"], _record)
+
+    hass.states.async_set("light.kitchen_ceiling", "on")
+    hass.states.async_set("sensor.kitchen_temperature", "20")
+    hass.states.async_set("sensor.hall_temperature", "20")
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen_ceiling", "off")
+    await hass.async_block_till_done()
+    assert changes == [
+        "light.kitchen_ceiling",
+        "sensor.kitchen_temperature",
+        "light.kitchen_ceiling",
+    ]
+    unsub()
+
+
 async def test_async_track_state_added_domain(hass):
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -1022,6 +1103,44 @@ async def test_track_template_result(hass):
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_skips_unread_attributes(hass):
+    """Test tracking template ignores changes of fields it did not read."""
+    runs = []
+    template_volume = Template(
+        "{{ states('media_player.test') }} {{ state_attr('media_player.test', 'volume_level') }}",
+        hass,
+    )
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.append(updates.pop().result)
+
+    hass.states.async_set("media_player.test", "playing", {"volume_level": 0.5})
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_volume, None)], run_callback
+    )
+    await hass.async_block_till_done()
+    render_info = info._info[template_volume]
+
+    hass.states.async_set(
+        "media_player.test", "playing", {"volume_level": 0.5, "media_position": 1}
+    )
+    await hass.async_block_till_done()
+    assert info._info[template_volume] is render_info
+    assert runs == []
+
+    hass.states.async_set(
+        "media_player.test", "playing", {"volume_level": 0.6, "media_position": 2}
+    )
+    await hass.async_block_till_done()
+    assert info._info[template_volume] is not render_info
+    assert runs == ["playing 0.6"]
+
+    hass.states.async_set("media_player.test", "paused", {"volume_level": 0.6})
+    await hass.async_block_till_done()
+    assert runs == ["playing 0.6", "paused 0.6"]
+
+
 async def test_track_template_result_none(hass):
     """Test tracking template."""
     specific_runs = []
@@ -4,7 +4,13 @@ import datetime
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+    json_loads,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -64,3 +70,45 @@ def test_extended_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+def test_json_dumps(hass):
+    """Test dumping Home Assistant objects with the fastest backend."""
+    now = dt_util.utcnow()
+    state = core.State("test.test", "hello", last_changed=now, last_updated=now)
+
+    assert json_loads(json_dumps({"state": state, "when": now, 1: ("a",)})) == {
+        "state": json_loads(json_dumps(state.as_dict())),
+        "when": now.isoformat(),
+        "1": ["a"],
+    }
+    assert json_dumps({"milk": {"beer"}}) == '{"milk":["beer"]}'
+    assert json_bytes({"a": [1]}, indent=True) == b'{\n  "a": [\n    1\n  ]\n}'
+
+    with pytest.raises(TypeError):
+        json_dumps({"a": object()})
+
+
+def test_json_dumps_custom_encoder(hass):
+    """Test a custom encoder class is honoured."""
+    assert (
+        json_bytes({"a": datetime.timedelta(seconds=1)}, encoder=ExtendedJSONEncoder)
+        == b'{"a":{"__type":"<class \'datetime.timedelta\'>","total_seconds":1.0}}'
+    )
+
+
+@pytest.mark.parametrize("indent", (False, True))
+def test_json_bytes_nan(hass, indent):
+    """Test NaN is encoded as null by orjson and rejected by the stdlib."""
+    assert json_bytes({"a": float("nan")}, indent=indent).replace(b" ", b"") in (
+        b'{"a":null}',
+        b'{\n"a":null\n}',
+    )
+    with pytest.raises(ValueError):
+        json_bytes({"a": float("nan")}, indent=indent, encoder=ExtendedJSONEncoder)
+
+
+def test_json_loads_falls_back(hass):
+    """Test loading data only the stdlib parser accepts."""
+    assert json_loads('{"a": NaN}')["a"] != json_loads('{"a": NaN}')["a"]
+    assert json_loads(b'{"a": Infinity}') == {"a": float("inf")}
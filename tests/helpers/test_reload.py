@@ -17,6 +17,7 @@ from homeassistant.helpers.reload import (
 from homeassistant.loader import async_get_integration
 
 from tests.common import (
+    MockEntity,
     MockModule,
     MockPlatform,
     get_fixture_path,
@@ -69,6 +70,44 @@ async def test_reload_platform(hass):
     assert not async_get_platform_without_config_entry(hass, PLATFORM, DOMAIN)
 
 
+async def test_reload_platform_keeps_unchanged_entities(hass):
+    """Test reloading only re-creates entities of changed platform configs."""
+    setup_called = []
+
+    async def setup_platform(hass, config, async_add_entities, discovery_info=None):
+        setup_called.append(config["name"])
+        async_add_entities([MockEntity(name=config["name"])])
+
+    mock_integration(hass, MockModule(DOMAIN))
+    mock_integration(hass, MockModule(PLATFORM, dependencies=[DOMAIN]))
+    mock_entity_platform(
+        hass, f"{DOMAIN}.{PLATFORM}", MockPlatform(async_setup_platform=setup_platform)
+    )
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup(
+        {
+            DOMAIN: [
+                {"platform": PLATFORM, "name": "one"},
+                {"platform": PLATFORM, "name": "two"},
+            ]
+        }
+    )
+    await hass.async_block_till_done()
+    assert sorted(setup_called) == ["one", "two"]
+    entity_one = component.get_entity(f"{DOMAIN}.one")
+
+    yaml_path = get_fixture_path("helpers/reload_incremental_configuration.yaml")
+    with patch.object(config, "YAML_CONFIG_FILE", yaml_path):
+        await async_reload_integration_platforms(hass, PLATFORM, [DOMAIN])
+    await hass.async_block_till_done()
+
+    assert sorted(setup_called) == ["one", "three", "two"]
+    assert component.get_entity(f"{DOMAIN}.one") is entity_one
+    assert hass.states.get(f"{DOMAIN}.two") is None
+    assert hass.states.get(f"{DOMAIN}.three") is not None
+
+
 async def test_setup_reload_service(hass):
     """Test setting up a reload service."""
     component_setup = Mock(return_value=True)
@@ -460,3 +460,162 @@ async def test_changing_delayed_written_data(hass, store, hass_storage):
         "key": MOCK_KEY,
         "data": {"hello": "world"},
     }
+
+
+async def test_saving_records_to_journal(hass, hass_storage):
+    """Test changed records are journaled once the data has been written."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    items = {"1": {"id": "1", "value": "one"}}
+
+    def data_func():
+        return {"items": list(items.values())}
+
+    def record_func(collection, record_id):
+        return items.get(record_id)
+
+    # Nothing has been written yet, so all data is written
+    store.async_delay_save_records(data_func, record_func, [("items", "1")], 1)
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass_storage[MOCK_KEY]["data"] == {"items": [{"id": "1", "value": "one"}]}
+    generation = hass_storage[MOCK_KEY]["journal"]
+
+    items["2"] = {"id": "2", "value": "two"}
+    del items["1"]
+    with patch.object(
+        store, "_write_data", wraps=store._write_data
+    ) as mock_write_data, patch.object(
+        store, "_write_journal", wraps=store._write_journal
+    ) as mock_write_journal:
+        store.async_delay_save_records(
+            data_func, record_func, [("items", "1"), ("items", "2")], 1
+        )
+        async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert len(mock_write_data.mock_calls) == 0
+    assert len(mock_write_journal.mock_calls) == 1
+    _, header, records = mock_write_journal.mock_calls[0][1]
+    assert header == {"version": 1, "minor_version": 1, "generation": generation}
+    assert sorted(records, key=lambda record: record["id"]) == [
+        {"collection": "items", "id": "1", "record": None},
+        {"collection": "items", "id": "2", "record": {"id": "2", "value": "two"}},
+    ]
+    assert hass_storage[MOCK_KEY]["data"] == {"items": [{"id": "2", "value": "two"}]}
+    assert hass_storage[MOCK_KEY]["journal"] == generation
+
+
+async def test_saving_records_compacts_journal(hass, hass_storage):
+    """Test the data is rewritten when the journal grows too long or on a full save."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    items = {}
+
+    def data_func():
+        return {"items": list(items.values())}
+
+    def record_func(collection, record_id):
+        return items.get(record_id)
+
+    await store.async_save(data_func())
+    generation = hass_storage[MOCK_KEY]["journal"]
+
+    with patch.object(storage, "JOURNAL_COMPACT_RECORDS", 2):
+        for idx in range(3):
+            items[str(idx)] = {"id": str(idx)}
+            store.async_delay_save_records(
+                data_func, record_func, [("items", str(idx))], 1
+            )
+            async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+            await hass.async_block_till_done()
+            # The third record does not fit in the journal anymore
+            assert (hass_storage[MOCK_KEY]["journal"] == generation) is (idx < 2)
+
+    assert hass_storage[MOCK_KEY]["data"] == {
+        "items": [{"id": "0"}, {"id": "1"}, {"id": "2"}]
+    }
+    generation = hass_storage[MOCK_KEY]["journal"]
+
+    # A full save pending wins over records
+    store.async_delay_save(data_func, 1)
+    store.async_delay_save_records(data_func, record_func, [("items", "0")], 1)
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass_storage[MOCK_KEY]["journal"] != generation
+
+
+async def test_saving_records_journal_write_fails(hass, hass_storage, caplog):
+    """Test all data is written when the journal can not be written."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    items = {"1": {"id": "1"}}
+
+    def data_func():
+        return {"items": list(items.values())}
+
+    def record_func(collection, record_id):
+        return items.get(record_id)
+
+    await store.async_save(data_func())
+    generation = hass_storage[MOCK_KEY]["journal"]
+
+    items["2"] = {"id": "2"}
+    with patch.object(store, "_write_journal", side_effect=OSError("disk full")):
+        store.async_delay_save_records(data_func, record_func, [("items", "2")], 1)
+        async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert "Error writing journal for" in caplog.text
+    assert hass_storage[MOCK_KEY]["data"] == {"items": [{"id": "1"}, {"id": "2"}]}
+    assert hass_storage[MOCK_KEY]["journal"] != generation
+
+
+def test_loading_journal(tmp_path, caplog):
+    """Test the journal is replayed on top of the data it belongs to."""
+    store = storage.Store(Mock(), MOCK_VERSION, MOCK_KEY, journal=True)
+    path = str(tmp_path / MOCK_KEY)
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(
+            {
+                "version": MOCK_VERSION,
+                "minor_version": 1,
+                "key": MOCK_KEY,
+                "journal": "abc",
+                "data": {"items": [{"id": "1"}, {"id": "2"}], "other": []},
+            },
+            fp,
+        )
+
+    header = {"version": MOCK_VERSION, "minor_version": 1, "generation": "abc"}
+    store._write_journal(
+        path,
+        header,
+        [
+            {"collection": "items", "id": "1", "record": None},
+            {"collection": "items", "id": "2", "record": {"id": "2", "a": 1}},
+        ],
+    )
+    store._write_journal(
+        path, None, [{"collection": "items", "id": "3", "record": {"id": "3"}}]
+    )
+
+    data, generation, records = store._load_data_with_journal(path)
+    assert generation == "abc"
+    assert records == 3
+    assert data["data"] == {"items": [{"id": "2", "a": 1}, {"id": "3"}], "other": []}
+
+    # A record that was not completely written is ignored with the rest
+    with open(f"{path}{storage.JOURNAL_SUFFIX}", "a", encoding="utf-8") as fp:
+        fp.write('{"collection": "items", "id": "4", "rec')
+    data, generation, records = store._load_data_with_journal(path)
+    assert records == 3
+    assert data["data"]["items"] == [{"id": "2", "a": 1}, {"id": "3"}]
+    assert "Ignoring incomplete journal record" in caplog.text
+
+    # A journal of an earlier generation of the data is ignored
+    store._write_journal(
+        path,
+        {**header, "generation": "def"},
+        [{"collection": "items", "id": "2", "record": None}],
+    )
+    data, generation, records = store._load_data_with_journal(path)
+    assert records == 0
+    assert data["data"]["items"] == [{"id": "1"}, {"id": "2"}]
@@ -2686,6 +2686,50 @@ def test_async_render_to_info_with_branching(hass):
     assert info.rate_limit is None
 
 
+def test_async_render_to_info_collects_fields_and_attributes(hass):
+    """Test async_render_to_info records which fields and attributes were read."""
+    hass.states.async_set("media_player.a", "playing", {"volume_level": 0.5})
+    hass.states.async_set("media_player.b", "idle", {"media_position": 1})
+    hass.states.async_set("media_player.c", "off")
+
+    info = render_to_info(
+        hass,
+        "{{ states('media_player.a') }} {{ state_attr('media_player.a', 'volume_level') }}"
+        " {{ states.media_player.b.attributes.media_position }}"
+        " {{ states.media_player.c.name }} {{ expand('media_player.c') | count }}",
+    )
+    assert_result_info(
+        info,
+        "playing 0.5 1 c 1",
+        {"media_player.a", "media_player.b", "media_player.c"},
+    )
+    assert info.entity_fields == {
+        "media_player.a": {"state"},
+        "media_player.b": {"attributes"},
+    }
+    assert info.entity_attributes == {
+        "media_player.a": {"volume_level"},
+        "media_player.b": set(),
+    }
+
+    old_state = hass.states.get("media_player.a")
+    hass.states.async_set(
+        "media_player.a", "playing", {"volume_level": 0.5, "media_position": 2}
+    )
+    new_state = hass.states.get("media_player.a")
+    assert not info.filter_state_change("media_player.a", old_state, new_state)
+    assert info.filter_state_change("media_player.a", old_state, None)
+
+    hass.states.async_set("media_player.a", "playing", {"volume_level": 0.6})
+    assert info.filter_state_change(
+        "media_player.a", new_state, hass.states.get("media_player.a")
+    )
+    # Entities collected as a whole always re-render
+    assert info.filter_state_change(
+        "media_player.c", hass.states.get("media_player.c"), new_state
+    )
+
+
 def test_async_render_to_info_with_complex_branching(hass):
     """Test async_render_to_info function by domain."""
     hass.states.async_set("light.a", "off")
@@ -3225,35 +3269,34 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_template_cache(hass):
+    """Test compiled template code is shared between templates."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
-    tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    info = template.compiled_template_cache_info()
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl = template.Template(template_string)
+    tpl.ensure_valid()
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert tpl._compiled_code is tpl2._compiled_code
+
+    # The code outlives the templates that compiled it
+    del tpl, tpl2
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+
+    new_info = template.compiled_template_cache_info()
+    assert new_info["misses"] == info["misses"] + 1
+    assert new_info["hits"] == info["hits"] + 2
+    assert new_info["compiles"] == info["compiles"] + 1
+    assert new_info["compile_time"] > info["compile_time"]
+
+    # Environments of another kind compile their own code
+    tpl4 = template.Template(template_string, hass)
+    assert tpl4.async_render() == "foo=x%26y&bar=42"
+    assert tpl4._compiled_code is not tpl3._compiled_code
 
 
 def test_is_template_string():
@@ -279,6 +279,30 @@ async def test_coordinator_entity(crd):
     assert entity.available is False
 
 
+async def test_coordinator_entities_write_state_in_one_pass(hass, crd):
+    """Test the coordinator entities write their state in one pass."""
+    entities = []
+    for idx in range(3):
+        entity = update_coordinator.CoordinatorEntity(crd)
+        entity.hass = hass
+        entity.entity_id = f"sensor.test_{idx}"
+        crd.async_add_listener(entity._handle_coordinator_update)
+        entities.append(entity)
+
+    with patch.object(
+        hass.states, "async_set_many", wraps=hass.states.async_set_many
+    ) as mock_set_many:
+        await crd.async_refresh()
+
+    assert len(mock_set_many.mock_calls) == 1
+    assert [update.entity_id for update in mock_set_many.mock_calls[0][1][0]] == [
+        "sensor.test_0",
+        "sensor.test_1",
+        "sensor.test_2",
+    ]
+    assert hass.states.get("sensor.test_2") is not None
+
+
 async def test_async_set_updated_data(crd):
     """Test async_set_updated_data for update coordinator."""
     assert crd.data is None
@@ -27,6 +27,11 @@ async def apply_stop_hass(stop_hass):
     """Make sure all hass are stopped."""
 
 
+@pytest.fixture(autouse=True)
+def apply_hass_storage(hass_storage):
+    """Make sure the checked config does not write to the test config dir."""
+
+
 @pytest.fixture
 def mock_is_file():
     """Mock is_file."""
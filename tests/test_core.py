@@ -3,10 +3,11 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
 import pytest
 import voluptuous as vol
@@ -38,6 +39,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -383,6 +385,69 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_compressed_state():
+    """Test a State as a compressed dictionary."""
+    last_changed = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    last_updated = datetime(1984, 12, 8, 13, 0, 0, tzinfo=dt_util.UTC)
+    context = ha.Context(user_id="abc")
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_updated,
+        last_changed=last_changed,
+        context=context,
+    )
+    expected = {
+        "s": "on",
+        "a": {"pig": "dog"},
+        "c": {"id": context.id, "parent_id": None, "user_id": "abc"},
+        "lc": last_changed.timestamp(),
+        "lu": last_updated.timestamp(),
+    }
+    assert state.as_compressed_state() == expected
+    assert state.as_compressed_state() is state.as_compressed_state()
+
+    # Last updated is omitted if equal and the context is sent as its id
+    state = ha.State(
+        "happy.happy", "on", last_updated=last_changed, last_changed=last_changed
+    )
+    assert state.as_compressed_state() == {
+        "s": "on",
+        "a": {},
+        "c": state.context.id,
+        "lc": last_changed.timestamp(),
+    }
+
+
+def test_state_as_dict_json():
+    """Test a State as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog", "when": last_time},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    expected = json.dumps(state.as_dict(), cls=JSONEncoder)
+    assert json.loads(state.as_dict_json) == json.loads(expected)
+    assert state.attributes_json == ('{"pig":"dog","when":"1984-12-08T12:00:00"}')
+    # 2nd time to verify cache
+    assert state.as_dict_json is state.as_dict_json
+    assert state.attributes_json is state.attributes_json
+
+
+def test_state_as_dict_json_unserializable():
+    """Test a State with attributes that cannot be serialized as JSON."""
+    state = ha.State("happy.happy", "on", {"pig": object()})
+    with pytest.raises(TypeError):
+        state.as_dict_json
+
+    state = ha.State("happy.happy", "on", {"pig": float("nan")})
+    assert state.attributes_json == '{"pig":null}'
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -562,6 +627,60 @@ async def test_eventbus_max_length_exceeded(hass):
     assert exc_info.value.value == long_evt_name
 
 
+async def test_eventbus_match_all_excludes_time_changed(hass):
+    """Test time changed events only go to explicit listeners."""
+    all_events = async_capture_events(hass, MATCH_ALL)
+    time_events = async_capture_events(hass, EVENT_TIME_CHANGED)
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    assert [event.event_type for event in all_events] == ["test_event"]
+    assert len(time_events) == 1
+
+
+async def test_timer_listen(hass):
+    """Test listening for core timer ticks."""
+    now = dt_util.utcnow()
+    every_tick = []
+    every_third_tick = []
+
+    @ha.callback
+    def third_tick_listener(now):
+        every_third_tick.append(now)
+
+    async def tick_listener(now):
+        every_tick.append(now)
+
+    unsub_tick = hass.timer.async_listen(tick_listener)
+    hass.timer.async_listen(third_tick_listener, 3)
+    assert hass.timer.listener_count == 2
+
+    for idx in range(6):
+        hass.timer.async_tick(now + timedelta(seconds=idx))
+    await hass.async_block_till_done()
+
+    assert every_tick == [now + timedelta(seconds=idx) for idx in range(6)]
+    assert every_third_tick == [now + timedelta(seconds=2), now + timedelta(seconds=5)]
+
+    unsub_tick()
+    assert hass.timer.listener_count == 1
+
+    for idx in range(6, 9):
+        hass.timer.async_tick(now + timedelta(seconds=idx))
+    await hass.async_block_till_done()
+
+    assert len(every_tick) == 6
+    assert every_third_tick[-1] == now + timedelta(seconds=8)
+
+
+async def test_timer_listen_invalid_interval(hass):
+    """Test the timer interval must be at least a second."""
+    with pytest.raises(ValueError):
+        hass.timer.async_listen(lambda now: None, 0)
+
+
 def test_state_init():
     """Test state.init."""
     with pytest.raises(InvalidEntityFormatError):
@@ -728,6 +847,48 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass):
+    """Test setting multiple states in one pass."""
+    hass.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    own_context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ha.StateUpdate("light.bowl", "on"),
+            ha.StateUpdate("Light.Kitchen", "off", {"brightness": 0}),
+            ha.StateUpdate("light.porch", "on", context=own_context),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.kitchen",
+        "light.porch",
+    ]
+    kitchen = hass.states.get("light.kitchen")
+    porch = hass.states.get("light.porch")
+    assert kitchen.attributes == {"brightness": 0}
+    assert kitchen.last_updated == porch.last_updated
+    assert kitchen.context is events[0].context
+    assert porch.context is own_context
+
+    context = ha.Context()
+    hass.states.async_set_many(
+        [
+            ha.StateUpdate("light.kitchen", "off", {"brightness": 0}, True),
+            ha.StateUpdate("light.porch", "off"),
+        ],
+        context,
+    )
+    await hass.async_block_till_done()
+
+    assert len(events) == 4
+    assert events[2].context is context
+    assert events[3].context is context
+    assert hass.states.get("light.porch").state == "off"
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1082,6 +1243,9 @@ def test_create_timer(mock_monotonic, loop):
 
     assert len(hass.bus.async_listen_once.mock_calls) == 1
     assert len(hass.bus.async_fire.mock_calls) == 1
+    assert hass.timer.async_tick.mock_calls == [
+        call(datetime(2018, 12, 31, 3, 4, 6, 100000))
+    ]
     assert len(hass.loop.call_later.mock_calls) == 2
 
     event_type, callback = hass.bus.async_listen_once.mock_calls[0][1]
@@ -1098,6 +1262,49 @@ def test_create_timer(mock_monotonic, loop):
     assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
 
 
+@patch("homeassistant.core.monotonic")
+def test_timer_without_time_changed_listeners(mock_monotonic, loop):
+    """Test the timer does not fire time changed events nobody listens to."""
+    hass = MagicMock()
+    hass.bus.async_has_listeners.return_value = False
+    mock_monotonic.side_effect = 10.2, 10.8, 11.3
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
+    ):
+        ha._async_create_timer(hass)
+
+    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 6, 100000),
+    ):
+        callback(target)
+
+    hass.bus.async_has_listeners.assert_called_once_with(EVENT_TIME_CHANGED)
+    assert len(hass.bus.async_fire.mock_calls) == 0
+    assert hass.timer.async_tick.mock_calls == [
+        call(datetime(2018, 12, 31, 3, 4, 6, 100000))
+    ]
+    assert len(hass.loop.call_later.mock_calls) == 2
+
+
+async def test_eventbus_has_listeners(hass):
+    """Test only listeners of the event type itself are reported."""
+    assert not hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+
+    unsub_all = hass.bus.async_listen(MATCH_ALL, lambda event: None)
+    assert not hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+
+    unsub = hass.bus.async_listen(EVENT_TIME_CHANGED, lambda event: None)
+    assert hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+
+    unsub()
+    unsub_all()
+    assert not hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+
+
 @patch("homeassistant.core.monotonic")
 def test_timer_out_of_sync(mock_monotonic, loop):
     """Test create timer."""
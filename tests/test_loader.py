@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import json
+import pathlib
 from unittest.mock import patch
 
 import pytest
@@ -172,6 +174,31 @@ async def test_get_integration_exceptions(hass):
         assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_manifest_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch("homeassistant.loader._load_manifest") as mock_load:
+        integration = await loader.async_get_integration(hass, "http")
+
+    assert not mock_load.called
+    assert integration.pkg_path == "homeassistant.components.http"
+    assert integration.file_path == pathlib.Path(http.__file__).parent
+    manifest = json.loads((integration.file_path / "manifest.json").read_text())
+    assert integration.manifest == {**manifest, "is_built_in": True}
+
+
+async def test_get_integration_manifest_index_outdated(hass):
+    """Test the manifest files are loaded when the index has another version."""
+    loader._get_builtin_manifests.cache_clear()
+    with patch.object(loader, "MANIFESTS_INDEX_VERSION", 0), patch(
+        "homeassistant.loader._load_manifest", wraps=loader._load_manifest
+    ) as mock_load:
+        integration = await loader.async_get_integration(hass, "http")
+    loader._get_builtin_manifests.cache_clear()
+
+    assert mock_load.call_count == 1
+    assert integration.domain == "http"
+
+
 async def test_get_integration_legacy(hass, enable_custom_integrations):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -443,6 +470,29 @@ async def test_get_custom_components(hass, enable_custom_integrations):
         mock_get.assert_called_once_with(hass)
 
 
+async def test_get_custom_components_manifest_cache(
+    hass, hass_storage, enable_custom_integrations
+):
+    """Verify that only changed custom manifests are loaded again."""
+    with patch(
+        "homeassistant.loader._load_manifest", wraps=loader._load_manifest
+    ) as mock_load:
+        integrations = await loader._async_get_custom_components(hass)
+        assert mock_load.called
+        stored = hass_storage[loader.CUSTOM_MANIFESTS_STORAGE_KEY]["data"]
+        assert len(stored) == mock_load.call_count
+
+        mock_load.reset_mock()
+        assert (await loader._async_get_custom_components(hass)).keys() == (
+            integrations.keys()
+        )
+        assert not mock_load.called
+
+        stored[0]["mtime"] -= 1
+        await loader._async_get_custom_components(hass)
+        mock_load.assert_called_once_with(pathlib.Path(stored[0]["path"]))
+
+
 async def test_get_config_flows(hass):
     """Verify that custom components with config_flow are available."""
     test_1_integration = _get_test_integration(hass, "test_1", False)
@@ -445,3 +445,59 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def test_c_loader_keeps_line_numbers():
+    """Test the fast loader still records the file and line of objects."""
+    with io.StringIO("key:\n  nested:\n    - 1\n") as file:
+        setattr(file, "name", "test.yaml")
+        doc = yaml.parse_yaml(file)
+
+    assert yaml_loader.HAS_C_LOADER
+    assert doc["key"].__config_file__ == "test.yaml"
+    assert doc["key"].__line__ == 1
+    assert doc["key"]["nested"].__line__ == 2
+
+
+def test_parse_error_is_reported_with_snippet(caplog):
+    """Test errors from the fast loader are reported by the pure Python loader."""
+    with pytest.raises(HomeAssistantError):
+        yaml.parse_yaml("key: [unclosed\nother: 1\n")
+
+    assert "^" in caplog.text
+
+
+def test_load_yaml_caches_unchanged_files(tmp_path):
+    """Test files are only parsed again when they changed."""
+    fname = str(tmp_path / "included.yaml")
+    with open(fname, "w", encoding="utf-8") as fp:
+        fp.write("key: value\n")
+
+    with patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as mock_parse:
+        first = yaml.load_yaml(fname)
+        first["key"] = "modified"
+        assert yaml.load_yaml(fname) == {"key": "value"}
+        assert len(mock_parse.mock_calls) == 1
+
+        with open(fname, "w", encoding="utf-8") as fp:
+            fp.write("key: new value\n")
+        os.utime(fname, ns=(0, 0))
+        assert yaml.load_yaml(fname) == {"key": "new value"}
+        assert len(mock_parse.mock_calls) == 2
+
+
+def test_load_yaml_does_not_cache_secrets(tmp_path):
+    """Test files with values from outside the file are always parsed."""
+    fname = str(tmp_path / "included.yaml")
+    with open(fname, "w", encoding="utf-8") as fp:
+        fp.write("key: !env_var TEST_YAML_CACHE default\n")
+
+    with patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as mock_parse:
+        assert yaml.load_yaml(fname) == {"key": "default"}
+        with patch.dict(os.environ, {"TEST_YAML_CACHE": "set"}):
+            assert yaml.load_yaml(fname) == {"key": "set"}
+        assert len(mock_parse.mock_calls) == 2